@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from threading import Barrier, Thread
+from time import perf_counter
+import sys
+
+from bench_parse import get_record_array_json
+from ppt_json import ConcurrentJsonResource, JsonResource
+
+OPERATIONS_COUNT = 200000
+"""
+Total number of node reads per measurement
+"""
+
+
+def measure(json_resource, threads_count, write_ratio):
+    """
+    Measures reading (and changing) nodes from the given number of threads.
+
+    :param json_resource: JsonResource instance to share
+    :param threads_count: Number of threads
+    :param write_ratio: Number of reads per change; 0 for reads only
+
+    :return: (float) Operations per second
+    """
+
+    barrier = Barrier(1 + threads_count)
+    operations_count = OPERATIONS_COUNT // threads_count
+
+    def work(thread_id):
+        node_paths = [
+            "items#{0:d} name".format((thread_id * 97 + i) % 1000) for i in range(1000)
+        ]
+
+        barrier.wait()
+
+        for i in range(operations_count):
+            node_path = node_paths[i % 1000]
+
+            if write_ratio > 0 and i % write_ratio == 0:
+                json_resource.change_node(node_path, "changed")
+            else:
+                json_resource.get_node(node_path)
+
+    threads = [Thread(target=work, args=(i,)) for i in range(threads_count)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    started = perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    return (operations_count * threads_count) / (perf_counter() - started)
+
+
+def run():
+    """
+    Prints node access throughput of "ConcurrentJsonResource" for 1, 2, 4 and
+    8 threads compared to an unshared "JsonResource".
+    """
+
+    data = get_record_array_json(10000)
+
+    print("GIL enabled: {0}".format(getattr(sys, "_is_gil_enabled", lambda: True)()))
+
+    json_resource = JsonResource()
+    json_resource.parse(data)
+
+    baseline = measure(json_resource, 1, 0)
+
+    print("{0:>24s} {1:12.0f} ops/s".format("JsonResource", baseline))
+
+    for write_ratio in (0, 100):
+        json_resource = ConcurrentJsonResource()
+        json_resource.parse(data)
+
+        for threads_count in (1, 2, 4, 8):
+            operations_per_second = measure(json_resource, threads_count, write_ratio)
+
+            print(
+                "{0:>12s} {1:>8d} t {2:12.0f} ops/s {3:6.2f}x".format(
+                    "reads" if (write_ratio == 0) else "1% writes",
+                    threads_count,
+                    operations_per_second,
+                    operations_per_second / baseline,
+                )
+            )
+
+
+if __name__ == "__main__":
+    run()
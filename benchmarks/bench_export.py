@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from time import perf_counter
+import json
+
+from ppt_json import JsonResource
+
+from bench_parse import get_record_array_json
+
+
+def run():
+    """
+    Prints encoder throughput for the internal and native implementations
+    compared to "json.dumps()".
+    """
+
+    for count in (1000, 10000, 50000):
+        data = json.loads(get_record_array_json(count))
+
+        json_resource = JsonResource()
+        json_resource.implementation = JsonResource.IMPLEMENTATION_INTERNAL
+
+        for encoder_name, encoder in (
+            ("internal", json_resource.data_to_json),
+            ("json.dumps", json.dumps),
+        ):
+            started = perf_counter()
+            json_data = encoder(data)
+            duration = perf_counter() - started
+
+            print(
+                "{0:>10s} {1:>10d} bytes {2:8.4f}s {3:8.2f} MB/s".format(
+                    encoder_name,
+                    len(json_data),
+                    duration,
+                    len(json_data) / duration / 1e6,
+                )
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from time import perf_counter
+
+from bench_parse import get_record_array_json
+from ppt_json import JsonResource
+
+
+def run():
+    """
+    Prints "export_data()" durations after changing 1, 10, 100 and 1000
+    leaves with and without incremental export.
+    """
+
+    data = get_record_array_json(20000)
+
+    for implementation_name, implementation in (
+        ("internal", JsonResource.IMPLEMENTATION_INTERNAL),
+        ("native", JsonResource.IMPLEMENTATION_NATIVE),
+    ):
+        for is_incremental in (False, True):
+            json_resource = JsonResource()
+            json_resource.implementation = implementation
+
+            if is_incremental:
+                json_resource.enable_incremental_export()
+
+            json_resource.parse(data)
+
+            started = perf_counter()
+            json_resource.export_data()
+            initial_duration = perf_counter() - started
+
+            print(
+                "{0:>8s} {1:>11s} {2:>9s} {3:10.6f}s".format(
+                    implementation_name,
+                    "incremental" if is_incremental else "complete",
+                    "initial",
+                    initial_duration,
+                )
+            )
+
+            for changes_count in (1, 10, 100, 1000):
+                for position in range(0, 20000, 20000 // changes_count):
+                    json_resource.change_node(
+                        "items#{0:d} name".format(position), "changed"
+                    )
+
+                started = perf_counter()
+                json_resource.export_data()
+                duration = perf_counter() - started
+
+                print(
+                    "{0:>8s} {1:>11s} {2:>9d} {3:10.6f}s".format(
+                        implementation_name,
+                        "incremental" if is_incremental else "complete",
+                        changes_count,
+                        duration,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from time import perf_counter
+import tracemalloc
+
+from bench_parse import get_record_array_json
+from ppt_json import JsonResource
+
+INTERNING_MODES = (
+    ("none", JsonResource.INTERNING_NONE),
+    ("keys", JsonResource.INTERNING_KEYS),
+    ("strings", JsonResource.INTERNING_STRINGS),
+)
+"""
+Interning modes measured
+"""
+
+
+def run():
+    """
+    Prints the memory retained by the parsed record array and the memory
+    saved by each interning mode.
+    """
+
+    for count in (10000, 50000):
+        data = get_record_array_json(count)
+
+        for implementation_name, implementation in (
+            ("internal", JsonResource.IMPLEMENTATION_INTERNAL),
+            ("native", JsonResource.IMPLEMENTATION_NATIVE),
+        ):
+            retained_memory_without_interning = None
+
+            for interning_name, interning in INTERNING_MODES:
+                json_resource = JsonResource()
+                json_resource.implementation = implementation
+
+                started = perf_counter()
+                json_resource.parse(data, interning=interning)
+                duration = perf_counter() - started
+
+                json_resource = JsonResource()
+                json_resource.implementation = implementation
+
+                tracemalloc.start()
+
+                try:
+                    json_resource.parse(data, interning=interning)
+                    retained_memory, _ = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+
+                if retained_memory_without_interning is None:
+                    retained_memory_without_interning = retained_memory
+
+                print(
+                    "{0:>8s} {1:>6d} records {2:>7s} {3:8.4f}s {4:10.1f} KiB retained {5:10.1f} KiB saved ({6:4.1f}%)".format(
+                        implementation_name,
+                        count,
+                        interning_name,
+                        duration,
+                        retained_memory / 1024,
+                        (retained_memory_without_interning - retained_memory) / 1024,
+                        100.0
+                        * (retained_memory_without_interning - retained_memory)
+                        / retained_memory_without_interning,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    run()
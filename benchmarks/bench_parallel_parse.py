@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from time import perf_counter
+
+from bench_parse import get_record_array_json
+from ppt_json import JsonResource
+
+
+def run():
+    """
+    Prints "parse_parallel()" scaling for 1, 2, 4 and 8 worker processes
+    compared to "parse()".
+    """
+
+    data = get_record_array_json(200000)
+
+    for implementation_name, implementation in (
+        ("internal", JsonResource.IMPLEMENTATION_INTERNAL),
+        ("native", JsonResource.IMPLEMENTATION_NATIVE),
+    ):
+        json_resource = JsonResource()
+        json_resource.implementation = implementation
+
+        started = perf_counter()
+        json_resource.parse(data)
+        baseline_duration = perf_counter() - started
+
+        print(
+            "{0:>8s} {1:>10s} {2:8.4f}s".format(
+                implementation_name, "parse", baseline_duration
+            )
+        )
+
+        for processes in (1, 2, 4, 8):
+            started = perf_counter()
+            is_parallel = json_resource.parse_parallel(data, "items", processes)
+            duration = perf_counter() - started
+
+            print(
+                "{0:>8s} {1:>8d} p {2:8.4f}s {3:6.2f}x {4}".format(
+                    implementation_name,
+                    processes,
+                    duration,
+                    baseline_duration / duration,
+                    "parallel" if is_parallel else "serial",
+                )
+            )
+
+
+if __name__ == "__main__":
+    run()
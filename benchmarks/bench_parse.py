@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from time import perf_counter
+import json
+
+from ppt_json import JsonResource
+
+
+def get_record_array_json(count):
+    """
+    Returns a JSON array of records.
+
+    :param count: Number of records
+
+    :return: (str) JSON data
+    """
+
+    return json.dumps(
+        {
+            "items": [
+                {
+                    "id": i,
+                    "name": "item {0:d}".format(i),
+                    "tags": ["a", "b\\n", "c"],
+                    "price": i * 1.5,
+                    "ok": i % 2 == 0,
+                    "none": None,
+                }
+                for i in range(count)
+            ]
+        }
+    )
+
+
+def run():
+    """
+    Prints parser throughput for the internal and native implementations.
+    """
+
+    for count in (1000, 10000, 50000):
+        data = get_record_array_json(count)
+
+        for implementation_name, implementation in (
+            ("internal", JsonResource.IMPLEMENTATION_INTERNAL),
+            ("native", JsonResource.IMPLEMENTATION_NATIVE),
+        ):
+            json_resource = JsonResource()
+            json_resource.implementation = implementation
+
+            started = perf_counter()
+            json_resource.parse(data)
+            duration = perf_counter() - started
+
+            print(
+                "{0:>8s} {1:>10d} bytes {2:8.4f}s {3:8.2f} MB/s".format(
+                    implementation_name, len(data), duration, len(data) / duration / 1e6
+                )
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from time import perf_counter
+import json
+
+from bench_parse import get_record_array_json
+from ppt_json import JsonResource
+
+
+def run():
+    """
+    Prints the duration of a parse cache hit of "json_to_data_view()" compared
+    to "json.loads()" of the same input.
+    """
+
+    JsonResource.enable_parse_cache()
+
+    try:
+        for count in (1, 10, 1000, 50000):
+            data = get_record_array_json(count)
+            repetitions = max(1, 100000 // count)
+
+            started = perf_counter()
+
+            for _ in range(repetitions):
+                json.loads(data)
+
+            loads_duration = (perf_counter() - started) / repetitions
+
+            JsonResource.json_to_data_view(data)
+
+            """
+Compare an equal but not identical input to include the comparison on hit.
+            """
+
+            data = "".join(data)
+            started = perf_counter()
+
+            for _ in range(repetitions):
+                JsonResource.json_to_data_view(data)
+
+            hit_duration = (perf_counter() - started) / repetitions
+
+            print(
+                "{0:>6d} records {1:>9d} characters json.loads() {2:10.6f}s cache hit {3:10.6f}s ({4:6.1f}x faster)".format(
+                    count,
+                    len(data),
+                    loads_duration,
+                    hit_duration,
+                    loads_duration / hit_duration,
+                )
+            )
+    finally:
+        JsonResource.disable_parse_cache()
+
+
+if __name__ == "__main__":
+    run()
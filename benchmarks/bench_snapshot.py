@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import os
+
+from bench_parse import get_record_array_json
+from ppt_json import JsonResource
+
+
+def run():
+    """
+    Prints the startup time of loading a record array from JSON files with
+    "parse_file()" compared to loading a snapshot with "load_snapshot()".
+    """
+
+    with TemporaryDirectory() as directory_path:
+        json_file_path = os.path.join(directory_path, "data.json")
+        snapshot_file_path = os.path.join(directory_path, "data.snapshot")
+
+        for count in (10000, 100000):
+            with open(json_file_path, "w", encoding="utf-8") as file_obj:
+                file_obj.write(get_record_array_json(count))
+
+            json_resource = JsonResource()
+            json_resource.implementation = JsonResource.IMPLEMENTATION_NATIVE
+            json_resource.parse_file(json_file_path)
+            json_resource.save_snapshot(snapshot_file_path)
+
+            print(
+                "{0:>6d} records: JSON {1:d} bytes, snapshot {2:d} bytes".format(
+                    count,
+                    os.path.getsize(json_file_path),
+                    os.path.getsize(snapshot_file_path),
+                )
+            )
+
+            for implementation_name, implementation in (
+                ("internal", JsonResource.IMPLEMENTATION_INTERNAL),
+                ("native", JsonResource.IMPLEMENTATION_NATIVE),
+            ):
+                json_resource = JsonResource()
+                json_resource.implementation = implementation
+
+                started = perf_counter()
+                json_resource.parse_file(json_file_path)
+                duration = perf_counter() - started
+
+                print(
+                    "{0:>20s} {1:8.4f}s".format(
+                        implementation_name + " parse_file", duration
+                    )
+                )
+
+            json_resource = JsonResource()
+
+            started = perf_counter()
+            json_resource.load_snapshot(snapshot_file_path)
+            duration = perf_counter() - started
+
+            print("{0:>20s} {1:8.4f}s".format("load_snapshot", duration))
+
+
+if __name__ == "__main__":
+    run()
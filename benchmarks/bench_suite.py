@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+import json
+import os
+import sys
+import tracemalloc
+
+from ppt_json import JsonResource
+
+BASELINES_FILE_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+"""
+Path of the stored baseline ratios. Each timing is stored relative to
+"json.loads()" of the same document measured in the same run to compare runs
+on different machines.
+"""
+
+IMPLEMENTATIONS = (
+    ("internal", JsonResource.IMPLEMENTATION_INTERNAL),
+    ("native", JsonResource.IMPLEMENTATION_NATIVE),
+)
+"""
+Implementations measured
+"""
+
+SIZES = {"small": 1000, "medium": 20000}
+"""
+Number of elements per document size
+"""
+
+
+def get_deep_data(count):
+    """
+    Returns nested objects with a depth of the given count divided by ten.
+
+    :param count: Number of elements
+
+    :return: (tuple) Python data and the path to the innermost node
+    """
+
+    depth = max(1, min(count // 10, 500))
+    data = {"value": 1}
+
+    for level in range(depth - 1, -1, -1):
+        data = {"level{0:d}".format(level): data, "id": level}
+
+    return (
+        data,
+        " ".join("level{0:d}".format(level) for level in range(depth)) + " value",
+    )
+
+
+def get_long_array_data(count):
+    """
+    Returns an object containing a list of small records.
+
+    :param count: Number of elements
+
+    :return: (tuple) Python data and the path to a node in the middle
+    """
+
+    return (
+        {"items": [{"id": i, "ok": i % 2 == 0} for i in range(count)]},
+        "items#{0:d} id".format(count // 2),
+    )
+
+
+def get_number_heavy_data(count):
+    """
+    Returns an object containing lists of integers and floats.
+
+    :param count: Number of elements
+
+    :return: (tuple) Python data and the path to a node in the middle
+    """
+
+    return (
+        {
+            "ints": [i * 7919 for i in range(count)],
+            "floats": [i / 7.0 for i in range(count)],
+        },
+        "floats#{0:d}".format(count // 2),
+    )
+
+
+def get_string_heavy_data(count):
+    """
+    Returns an object containing a list of long strings with escapes.
+
+    :param count: Number of elements
+
+    :return: (tuple) Python data and the path to a node in the middle
+    """
+
+    return (
+        {
+            "texts": [
+                'Line {0:d} with "quotes", a tab\\t and ümlauts '.format(i) * 4
+                for i in range(count)
+            ]
+        },
+        "texts#{0:d}".format(count // 2),
+    )
+
+
+def get_wide_data(count):
+    """
+    Returns one object with many members.
+
+    :param count: Number of elements
+
+    :return: (tuple) Python data and the path to a member in the middle
+    """
+
+    return (
+        {"key{0:d}".format(i): {"value": i} for i in range(count)},
+        "key{0:d} value".format(count // 2),
+    )
+
+
+SHAPES = {
+    "deep": get_deep_data,
+    "long_array": get_long_array_data,
+    "number_heavy": get_number_heavy_data,
+    "string_heavy": get_string_heavy_data,
+    "wide": get_wide_data,
+}
+"""
+Document generators by shape name
+"""
+
+
+def get_operations(data, node_path, implementation):
+    """
+    Returns the measured operations for the given document.
+
+    :param data: JSON data
+    :param node_path: Path to the node read and changed
+    :param implementation: Implementation identifier
+
+    :return: (list) Tuples of operation name, setup and operation callables
+             and the number of repetitions
+    """
+
+    node_parent_path = node_path.rsplit(" ", 1)[0] if (" " in node_path) else ""
+
+    def get_json_resource():
+        json_resource = JsonResource()
+        json_resource.implementation = implementation
+        json_resource.parse(data)
+
+        return json_resource
+
+    def get_cached_json_resource():
+        json_resource = get_json_resource()
+        json_resource.set_cached_node(node_parent_path)
+
+        return json_resource
+
+    json_resource = JsonResource()
+    json_resource.implementation = implementation
+
+    """
+Nodes without a parent path can not be resolved from a cached node pointer.
+    """
+
+    return [
+        ("parse", lambda: json_resource, lambda r: r.parse(data), 1),
+        ("export_data", get_json_resource, lambda r: r.export_data(), 1),
+        ("get_node", get_json_resource, lambda r: r.get_node(node_path), 1000),
+        (
+            "change_node",
+            get_json_resource,
+            lambda r: r.change_node(node_path, 1),
+            1000,
+        ),
+    ] + (
+        []
+        if (node_parent_path == "")
+        else [
+            (
+                "get_node_cached",
+                get_cached_json_resource,
+                lambda r: r.get_node(node_path),
+                1000,
+            ),
+            (
+                "change_node_cached",
+                get_cached_json_resource,
+                lambda r: r.change_node(node_path, 1),
+                1000,
+            ),
+        ]
+    )
+
+
+def measure(setup, operation, repetitions, rounds):
+    """
+    Measures the given operation.
+
+    :param setup: Callable returning the argument for the operation
+    :param operation: Callable to measure
+    :param repetitions: Number of calls per round
+    :param rounds: Number of rounds
+
+    :return: (tuple) Best duration per call in seconds and peak memory
+             allocated in bytes
+    """
+
+    duration = None
+
+    for _ in range(rounds):
+        argument = setup()
+
+        started = perf_counter()
+
+        for _ in range(repetitions):
+            operation(argument)
+
+        round_duration = (perf_counter() - started) / repetitions
+
+        if duration is None or round_duration < duration:
+            duration = round_duration
+
+    argument = setup()
+
+    tracemalloc.start()
+
+    try:
+        operation(argument)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return duration, peak_memory
+
+
+def measure_reference(data, rounds):
+    """
+    Measures "json.loads()" of the given document as the reference timings
+    are set in relation to.
+
+    :param data: JSON data
+    :param rounds: Number of rounds
+
+    :return: (float) Best duration in seconds
+    """
+
+    duration = None
+
+    for _ in range(rounds):
+        started = perf_counter()
+        json.loads(data)
+        round_duration = perf_counter() - started
+
+        if duration is None or round_duration < duration:
+            duration = round_duration
+
+    return duration
+
+
+def run(argv=None):
+    """
+    Runs the benchmark suite and compares the results with stored baselines.
+    Regressions fail the run only if "--check" is given.
+
+    :param argv: Command line arguments
+
+    :return: (int) Exit code
+    """
+
+    argument_parser = ArgumentParser(description=run.__doc__.strip().split("\n")[0])
+    argument_parser.add_argument(
+        "--sizes", default=",".join(SIZES), help="comma separated document sizes"
+    )
+    argument_parser.add_argument(
+        "--shapes", default=",".join(SHAPES), help="comma separated document shapes"
+    )
+    argument_parser.add_argument("--rounds", type=int, default=3)
+    argument_parser.add_argument(
+        "--save", action="store_true", help="store the results as new baselines"
+    )
+    argument_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown factor compared to the baseline reported as possible regression",
+    )
+    argument_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with status 1 if a regression exceeds the threshold",
+    )
+
+    arguments = argument_parser.parse_args(argv)
+
+    baselines = {}
+
+    if os.path.exists(BASELINES_FILE_PATH):
+        with open(BASELINES_FILE_PATH, "r", encoding="utf-8") as file_obj:
+            baselines = json.load(file_obj)
+
+    results = {}
+    regressions = []
+
+    print(
+        "{0:<12s} {1:<6s} {2:<8s} {3:<18s} {4:>12s} {5:>10s} {6:>10s} {7:>10s} {8:>8s}".format(
+            "shape",
+            "size",
+            "impl",
+            "operation",
+            "seconds",
+            "MB/s",
+            "peak KiB",
+            "ratio",
+            "baseline",
+        )
+    )
+
+    for shape in arguments.shapes.split(","):
+        for size in arguments.sizes.split(","):
+            data, node_path = SHAPES[shape](SIZES[size])
+            data = json.dumps(data)
+
+            reference_duration = measure_reference(data, arguments.rounds)
+
+            for implementation_name, implementation in IMPLEMENTATIONS:
+                for operation_name, setup, operation, repetitions in get_operations(
+                    data, node_path, implementation
+                ):
+                    duration, peak_memory = measure(
+                        setup, operation, repetitions, arguments.rounds
+                    )
+
+                    key = "/".join((shape, size, implementation_name, operation_name))
+
+                    ratio = duration / reference_duration
+                    results[key] = ratio
+
+                    baseline_ratio = (
+                        (ratio / baselines[key]) if (key in baselines) else None
+                    )
+
+                    if (
+                        baseline_ratio is not None
+                        and baseline_ratio > arguments.threshold
+                    ):
+                        regressions.append(key)
+
+                    print(
+                        "{0:<12s} {1:<6s} {2:<8s} {3:<18s} {4:12.6f} {5:>10s} {6:10.1f} {7:10.4g} {8:>8s}".format(
+                            shape,
+                            size,
+                            implementation_name,
+                            operation_name,
+                            duration,
+                            (
+                                "{0:.2f}".format(len(data) / duration / 1e6)
+                                if (repetitions == 1)
+                                else "-"
+                            ),
+                            peak_memory / 1024,
+                            ratio,
+                            (
+                                "-"
+                                if (baseline_ratio is None)
+                                else "{0:.2f}x".format(baseline_ratio)
+                            ),
+                        )
+                    )
+
+    if arguments.save:
+        baselines.update(results)
+
+        with open(BASELINES_FILE_PATH, "w", encoding="utf-8") as file_obj:
+            json.dump(baselines, file_obj, indent=2, sort_keys=True)
+            file_obj.write("\n")
+
+    if len(regressions) > 0:
+        print(
+            "\nPossible regressions slower than {0:.2f}x the baseline:".format(
+                arguments.threshold
+            )
+        )
+
+        for key in regressions:
+            print("  " + key)
+
+    return 1 if (arguments.check and len(regressions) > 0) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
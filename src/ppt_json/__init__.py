@@ -12,6 +12,30 @@ v. 2.0. If a copy of the MPL was not distributed with this file, You can
 obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from .async_json_resource import AsyncJsonResource
+from .concurrent_json_resource import ConcurrentJsonResource
+from .json_backends import JsonBackend
+from .json_feed_parser import JsonFeedParser
+from .json_lines import JsonLinesReader, JsonLinesWriter
+from .json_node_path import JsonNodePath
+from .json_parse_cache import JsonParseCache
 from .json_resource import JsonResource
+from .json_stats import JsonStats
+from .json_views import JsonMappingView, JsonSequenceView
+from .read_write_lock import ReadWriteLock
 
-__all__ = ("JsonResource",)
+__all__ = (
+    "AsyncJsonResource",
+    "ConcurrentJsonResource",
+    "JsonBackend",
+    "JsonFeedParser",
+    "JsonLinesReader",
+    "JsonLinesWriter",
+    "JsonMappingView",
+    "JsonNodePath",
+    "JsonParseCache",
+    "JsonResource",
+    "JsonSequenceView",
+    "JsonStats",
+    "ReadWriteLock",
+)
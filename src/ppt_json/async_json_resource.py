@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from time import perf_counter
+import asyncio
+
+from .json_feed_parser import JsonFeedParser
+from .json_resource import JsonResource
+
+
+class AsyncJsonResource(JsonResource):
+    """
+    "AsyncJsonResource" provides coroutines to parse from and export to
+    asyncio streams without blocking the event loop for long. The internal
+    parser yields to the event loop at time-slice boundaries while all other
+    backends decode large documents in an executor. Coroutines of one
+    instance are serialized.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    FEED_CHUNK_SIZE = 16384
+    """
+Size of chunks fed to the internal parser between time-slice checks
+    """
+    OFFLOAD_SIZE = 262144
+    """
+Default size of JSON data decoded in the executor by non-internal backends
+    """
+    READ_CHUNK_SIZE = 65536
+    """
+Size of chunks read from a stream
+    """
+    TIME_SLICE = 0.005
+    """
+Default number of seconds to run before yielding to the event loop
+    """
+
+    __slots__ = ("_lock", "executor", "offload_size", "time_slice")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(
+        self,
+        struct_type=dict,
+        log_handler=None,
+        skipkeys=True,
+        executor=None,
+        offload_size=None,
+        time_slice=None,
+    ):
+        """
+        Constructor __init__(AsyncJsonResource)
+
+        :param struct_type: Dict implementation for new struct elements
+        :param log_handler: Log handler to use
+        :param skipkeys: False to raise a "TypeError" for keys that are not
+                         str, int, float, bool or None
+        :param executor: "concurrent.futures" executor used to decode large
+                         documents; None for the event loop default
+        :param offload_size: Size of JSON data decoded in the executor
+        :param time_slice: Number of seconds to run before yielding to the
+                           event loop
+
+        :since: v1.1.0
+        """
+
+        JsonResource.__init__(self, struct_type, log_handler, skipkeys)
+
+        self._lock = None
+        """
+asyncio lock serializing the coroutines of this instance
+        """
+        self.executor = executor
+        """
+Executor used to decode large documents
+        """
+        self.offload_size = (
+            AsyncJsonResource.OFFLOAD_SIZE if (offload_size is None) else offload_size
+        )
+        """
+Size of JSON data decoded in the executor
+        """
+        self.time_slice = (
+            AsyncJsonResource.TIME_SLICE if (time_slice is None) else time_slice
+        )
+        """
+Number of seconds to run before yielding to the event loop
+        """
+
+    def _get_lock(self):
+        """
+        Returns the asyncio lock serializing the coroutines of this instance.
+
+        :return: (object) asyncio lock
+        :since:  v1.1.0
+        """
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        return self._lock
+
+    async def aadd_node(self, node_path, data):
+        """
+        Adds a node with content.
+
+        :param node_path: Path to the new node - delimiter is space
+        :param data: Data for the new node
+
+        :return: (bool) False on error
+        :since:  v1.1.0
+        """
+
+        async with self._get_lock():
+            return self.add_node(node_path, data)
+
+    async def achange_node(self, node_path, data, add_recursively=False):
+        """
+        Change the content of a specified node.
+
+        :param node_path: Path to the new node - delimiter is space
+        :param data: Data for the new node
+        :param add_recursively: True to create undefined nodes
+
+        :return: (bool) False on error
+        :since:  v1.1.0
+        """
+
+        async with self._get_lock():
+            return self.change_node(node_path, data, add_recursively)
+
+    async def acount_node(self, node_path):
+        """
+        Count the occurrence of a specified node.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :return: (int) Counted number off matching nodes
+        :since:  v1.1.0
+        """
+
+        async with self._get_lock():
+            return self.count_node(node_path)
+
+    async def aexport(self, writer, encoding="utf-8"):
+        """
+        Writes the JSON output of the Python representation data to the given
+        asyncio stream writer. The writer is drained after each chunk.
+
+        :param writer: asyncio stream writer
+        :param encoding: Encoding of the JSON output
+
+        :return: (int) Number of bytes written
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.aexport()- (#echo(__LINE__)#)"
+            )
+
+        _return = 0
+
+        async with self._get_lock():
+            parts = []
+            parts_size = 0
+            time_slice_started = perf_counter()
+
+            for part in self.iter_json():
+                parts.append(part)
+                parts_size += len(part)
+
+                if parts_size >= JsonResource.EXPORT_CHUNK_SIZE:
+                    chunk = "".join(parts).encode(encoding)
+
+                    writer.write(chunk)
+                    await writer.drain()
+
+                    _return += len(chunk)
+                    parts = []
+                    parts_size = 0
+                    time_slice_started = perf_counter()
+                elif perf_counter() - time_slice_started >= self.time_slice:
+                    await asyncio.sleep(0)
+                    time_slice_started = perf_counter()
+
+            if len(parts) > 0:
+                chunk = "".join(parts).encode(encoding)
+
+                writer.write(chunk)
+                await writer.drain()
+
+                _return += len(chunk)
+
+        return _return
+
+    async def aget_node(self, node_path):
+        """
+        Read a specified node including all children if applicable.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :return: (mixed) JSON data; None on error
+        :since:  v1.1.0
+        """
+
+        async with self._get_lock():
+            return self.get_node(node_path)
+
+    async def aget_nodes(self, node_paths):
+        """
+        Read all specified nodes including all children if applicable.
+
+        :param node_paths: Iterable of paths to the nodes - delimiter is space
+
+        :return: (list) JSON data of each node in the given order; None for
+                 each node not found
+        :since:  v1.1.0
+        """
+
+        async with self._get_lock():
+            return self.get_nodes(node_paths)
+
+    async def aparse(self, reader):
+        """
+        Parses the UTF-8 encoded JSON data read from the given asyncio stream
+        reader. The data is None afterwards if the JSON data is invalid.
+
+        :param reader: asyncio stream reader
+
+        :since: v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.aparse()- (#echo(__LINE__)#)"
+            )
+
+        async with self._get_lock():
+            if self.implementation == JsonResource.IMPLEMENTATION_INTERNAL:
+                await self._aparse_internal(reader)
+            else:
+                chunks = []
+
+                while True:
+                    chunk = await reader.read(AsyncJsonResource.READ_CHUNK_SIZE)
+
+                    if len(chunk) < 1:
+                        break
+
+                    chunks.append(chunk)
+
+                try:
+                    data = b"".join(chunks).decode("utf-8")
+                except UnicodeDecodeError:
+                    data = ""
+
+                if len(data) < self.offload_size:
+                    self.parse(data)
+                else:
+                    await asyncio.get_running_loop().run_in_executor(
+                        self.executor, self.parse, data
+                    )
+
+    async def _aparse_internal(self, reader):
+        """
+        Feeds the JSON data read from the given asyncio stream reader to the
+        internal parser and yields to the event loop at time-slice boundaries.
+
+        :param reader: asyncio stream reader
+
+        :since: v1.1.0
+        """
+
+        started = None if (self._stats is None) else perf_counter()
+
+        data_size = 0
+        json_parser = JsonFeedParser(self.struct_type, self._log_handler)
+        time_slice_started = perf_counter()
+
+        while json_parser.is_valid:
+            chunk = await reader.read(AsyncJsonResource.READ_CHUNK_SIZE)
+
+            if len(chunk) < 1:
+                break
+
+            data_size += len(chunk)
+
+            with memoryview(chunk) as chunk_view:
+                for position in range(
+                    0, len(chunk_view), AsyncJsonResource.FEED_CHUNK_SIZE
+                ):
+                    if not json_parser.feed(
+                        chunk_view[
+                            position : position + AsyncJsonResource.FEED_CHUNK_SIZE
+                        ]
+                    ):
+                        break
+
+                    if perf_counter() - time_slice_started >= self.time_slice:
+                        await asyncio.sleep(0)
+                        time_slice_started = perf_counter()
+
+        self._data = json_parser.close()._data
+        self._reset_loaded_data()
+
+        if started is not None:
+            self._stats.record("parse", started, data_size)
+
+    async def aremove_node(self, node_path):
+        """
+        Remove a node and all children if applicable.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :return: (bool) False on error
+        :since:  v1.1.0
+        """
+
+        async with self._get_lock():
+            return self.remove_node(node_path)
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from threading import local
+
+from .json_resource import JsonResource
+from .json_views import get_json_view_copy
+from .read_write_lock import ReadWriteLock
+
+
+def _get_read_locked_method(method):
+    """
+    Returns the given method wrapped to run with the read lock held.
+
+    :param method: "JsonResource" method
+
+    :return: (object) Wrapped method
+    :since:  v1.1.0
+    """
+
+    @wraps(method)
+    def read_locked_method(self, *args, **kwargs):
+        self._lock.acquire_read()
+
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._lock.release_read()
+
+    return read_locked_method
+
+
+def _get_read_locked_iterator(method):
+    """
+    Returns the given generator method wrapped to collect all values with the
+    read lock held. The lock is released before the first value is returned
+    so that the data may be changed while iterating.
+
+    :param method: "JsonResource" generator method
+
+    :return: (object) Wrapped method returning an iterator
+    :since:  v1.1.0
+    """
+
+    @wraps(method)
+    def read_locked_iterator(self, *args, **kwargs):
+        self._lock.acquire_read()
+
+        try:
+            values = list(method(self, *args, **kwargs))
+        finally:
+            self._lock.release_read()
+
+        return iter(values)
+
+    return read_locked_iterator
+
+
+def _get_read_locked_view(method):
+    """
+    Returns the given method wrapped to run with the read lock held. Returned
+    views refer to a copy of the struct taken with the lock held.
+
+    :param method: "JsonResource" method returning read-only views
+
+    :return: (object) Wrapped method
+    :since:  v1.1.0
+    """
+
+    @wraps(method)
+    def read_locked_view(self, *args, **kwargs):
+        self._lock.acquire_read()
+
+        try:
+            return get_json_view_copy(method(self, *args, **kwargs))
+        finally:
+            self._lock.release_read()
+
+    return read_locked_view
+
+
+def _get_write_locked_method(method):
+    """
+    Returns the given method wrapped to run with the write lock held. The
+    cached node pointers of all threads are invalidated afterwards.
+
+    :param method: "JsonResource" method
+
+    :return: (object) Wrapped method
+    :since:  v1.1.0
+    """
+
+    @wraps(method)
+    def write_locked_method(self, *args, **kwargs):
+        self._lock.acquire_write()
+
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._generation += 1
+            self._lock.release_write()
+
+    return write_locked_method
+
+
+class ConcurrentJsonResource(JsonResource):
+    """
+    "ConcurrentJsonResource" may be shared between threads. Reading methods
+    run concurrently while changing methods run exclusively. Cached node
+    pointers ("set_cached_node()") are kept per thread and dropped whenever
+    the data has been changed by any thread.
+
+    Lazy parsing is not supported as decoding on access would change the
+    tree while reading. "iter_json()" and "iter_nodes()" collect all values
+    when called and return them from memory as streaming would hold the lock
+    while the caller iterates. Use "export_to()" to write the output to a
+    file-like object in chunks with the lock held. Read-only views refer to
+    a copy of the data taken when they are returned. Node cache counters may miss
+    concurrent updates.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ("_generation", "_lock", "_thread_local")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, struct_type=dict, log_handler=None, skipkeys=True):
+        """
+        Constructor __init__(ConcurrentJsonResource)
+
+        :param struct_type: Dict implementation for new struct elements
+        :param log_handler: Log handler to use
+        :param skipkeys: False to raise a "TypeError" for keys that are not
+                         str, int, float, bool or None
+
+        :since: v1.1.0
+        """
+
+        self._generation = 0
+        """
+Number of changes of the data; thread caches of older generations are
+invalid
+        """
+        self._lock = ReadWriteLock()
+        """
+Lock allowing many readers or one writer
+        """
+        self._thread_local = local()
+        """
+Node cache and its generation of the current thread
+        """
+
+        JsonResource.__init__(self, struct_type, log_handler, skipkeys)
+
+    @property
+    def _node_cache(self):
+        """
+        Returns the node cache of the current thread.
+
+        :return: (object) Ordered dict of node path steps to node pointers
+        :since:  v1.1.0
+        """
+
+        thread_local = self._thread_local
+
+        if getattr(thread_local, "generation", -1) != self._generation:
+            thread_local.generation = self._generation
+            thread_local.node_cache = OrderedDict()
+
+        return thread_local.node_cache
+
+    @_node_cache.setter
+    def _node_cache(self, node_cache):
+        """
+        Sets the node cache of the current thread.
+
+        :param node_cache: Ordered dict of node path steps to node pointers
+
+        :since: v1.1.0
+        """
+
+        self._thread_local.generation = self._generation
+        self._thread_local.node_cache = node_cache
+
+    @property
+    def implementation(self):
+        """
+        Returns the parser implementation in use.
+
+        :return: (int) Implementation identifier
+        :since:  v1.1.0
+        """
+
+        return self._implementation
+
+    @implementation.setter
+    def implementation(self, implementation):
+        """
+        Set the parser implementation to use with the write lock held.
+
+        :param implementation: Implementation identifier
+
+        :since: v1.1.0
+        """
+
+        self._lock.acquire_write()
+
+        try:
+            JsonResource.implementation.fset(self, implementation)
+        finally:
+            self._lock.release_write()
+
+    def export_data(self, flush=False):
+        """
+        Convert the Python representation data into a JSON string. The write
+        lock is held if the content is deleted or encoded fragments are
+        updated by the incremental export.
+
+        :param flush: True to delete the instance content
+
+        :return: (str) Result string
+        :since:  v1.1.0
+        """
+
+        if flush or self._fragment_cache is not None:
+            self._lock.acquire_write()
+
+            try:
+                _return = JsonResource.export_data(self, flush)
+            finally:
+                self._generation += 1
+                self._lock.release_write()
+        else:
+            self._lock.acquire_read()
+
+            try:
+                _return = JsonResource.export_data(self)
+            finally:
+                self._lock.release_read()
+
+        return _return
+
+    def parse(self, data, lazy=False, interning=None):
+        """
+        Parses the given JSON data. Lazy parsing is not supported and the
+        data is always decoded completely.
+
+        :param data: Input JSON data
+        :param lazy: Ignored
+        :param interning: String interning mode ("INTERNING_KEYS" or
+                          "INTERNING_STRINGS") sharing equal strings of the
+                          document
+
+        :since: v1.1.0
+        """
+
+        self._lock.acquire_write()
+
+        try:
+            JsonResource.parse(self, data, interning=interning)
+        finally:
+            self._generation += 1
+            self._lock.release_write()
+
+    @contextmanager
+    def record_patch(self):
+        """
+        Records all changes as JSON Patch (RFC 6902) operations while the
+        context is active. The write lock is held while the recording is
+        started and stopped only.
+
+        :return: (object) Context manager yielding the list of recorded JSON
+                 Patch operations
+        :since:  v1.1.0
+        """
+
+        self._lock.acquire_write()
+
+        try:
+            recording = JsonResource.record_patch(self)
+            patch = recording.__enter__()
+        finally:
+            self._lock.release_write()
+
+        try:
+            yield patch
+        finally:
+            self._lock.acquire_write()
+
+            try:
+                recording.__exit__(None, None, None)
+            finally:
+                self._lock.release_write()
+
+    data = property(
+        _get_read_locked_method(JsonResource.data.fget), JsonResource.data.fset
+    )
+    data_view = property(_get_read_locked_view(JsonResource.data_view.fget))
+    node_index_size = property(
+        _get_read_locked_method(JsonResource.node_index_size.fget)
+    )
+
+    count_node = _get_read_locked_method(JsonResource.count_node)
+    export_to = _get_read_locked_method(JsonResource.export_to)
+    get_column = _get_read_locked_method(JsonResource.get_column)
+    get_node = _get_read_locked_method(JsonResource.get_node)
+    get_nodes = _get_read_locked_method(JsonResource.get_nodes)
+    save_snapshot = _get_read_locked_method(JsonResource.save_snapshot)
+    set_cached_node = _get_read_locked_method(JsonResource.set_cached_node)
+    stats = _get_read_locked_method(JsonResource.stats)
+
+    get_node_view = _get_read_locked_view(JsonResource.get_node_view)
+
+    iter_json = _get_read_locked_iterator(JsonResource.iter_json)
+    iter_nodes = _get_read_locked_iterator(JsonResource.iter_nodes)
+
+    add_node = _get_write_locked_method(JsonResource.add_node)
+    apply_patch = _get_write_locked_method(JsonResource.apply_patch)
+    build_index = _get_write_locked_method(JsonResource.build_index)
+    change_node = _get_write_locked_method(JsonResource.change_node)
+    change_nodes = _get_write_locked_method(JsonResource.change_nodes)
+    disable_incremental_export = _get_write_locked_method(
+        JsonResource.disable_incremental_export
+    )
+    disable_stats = _get_write_locked_method(JsonResource.disable_stats)
+    drop_index = _get_write_locked_method(JsonResource.drop_index)
+    enable_incremental_export = _get_write_locked_method(
+        JsonResource.enable_incremental_export
+    )
+    enable_stats = _get_write_locked_method(JsonResource.enable_stats)
+    load_snapshot = _get_write_locked_method(JsonResource.load_snapshot)
+    parse_file = _get_write_locked_method(JsonResource.parse_file)
+    parse_parallel = _get_write_locked_method(JsonResource.parse_parallel)
+    remove_node = _get_write_locked_method(JsonResource.remove_node)
+    remove_nodes = _get_write_locked_method(JsonResource.remove_nodes)
+    set_json = _get_write_locked_method(JsonResource.set_json)
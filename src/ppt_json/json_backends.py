@@ -0,0 +1,602 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=import-error,invalid-name
+
+import json
+import re
+from abc import ABCMeta, abstractmethod
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonBackend(object, metaclass=ABCMeta):
+    """
+    A "JsonBackend" decodes and encodes JSON data for a "JsonResource"
+    implementation identifier.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    BINARY_INPUT = False
+    """
+True if "decode()" accepts UTF-8 encoded bytes-like objects, e.g. memoryviews
+    """
+    INTERNING = 0
+    """
+Highest "JsonResource" string interning mode applied by the decoder itself
+    """
+    PRIORITY = 0
+    """
+Relative speed used to select a backend for "IMPLEMENTATION_AUTO"
+    """
+    RE_LONG_INTEGER = re.compile("\\d{19}")
+    """
+RegExp to find integers possibly exceeding 64 bits
+    """
+    RE_LONG_INTEGER_BYTES = re.compile(b"\\d{19}")
+    """
+RegExp to find integers possibly exceeding 64 bits in binary data
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    @abstractmethod
+    def decode(self, json_resource, data):
+        """
+        Decodes the given JSON data.
+
+        :param json_resource: JsonResource instance
+        :param data: Input JSON data
+
+        :return: (mixed) Python representation data; None on error
+        :since:  v1.1.0
+        """
+
+    @abstractmethod
+    def encode(self, json_resource, data):
+        """
+        Encodes the given Python data.
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (str) JSON output string
+        :since:  v1.1.0
+        """
+
+    def iter_encode(self, json_resource, data):
+        """
+        Returns a generator yielding the JSON output of the given Python data
+        in parts. The native encoder is used if not overwritten.
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (object) Generator yielding JSON string parts
+        :since:  v1.1.0
+        """
+
+        json_encoder = json.JSONEncoder(
+            default=json_resource._get_native_serializable_data,
+            skipkeys=json_resource.skipkeys,
+        )
+
+        return json_encoder.iterencode(data)
+
+    def is_supported(self, json_resource):
+        """
+        Returns true if the backend honors the "struct_type" and "skipkeys"
+        settings of the given "JsonResource" instance.
+
+        :param json_resource: JsonResource instance
+
+        :return: (bool) True if supported
+        :since:  v1.1.0
+        """
+
+        return json_resource.struct_type is dict
+
+    @staticmethod
+    def is_available():
+        """
+        Returns true if all dependencies of the backend are installed.
+
+        :return: (bool) True if available
+        :since:  v1.1.0
+        """
+
+        return True
+
+    @staticmethod
+    def _has_long_integer(data):
+        """
+        Returns true if the given JSON data may contain integers exceeding 64
+        bits. Digits within strings are matched as well.
+
+        :param data: Input JSON data
+
+        :return: (bool) True if found
+        :since:  v1.1.0
+        """
+
+        re_long_integer = (
+            JsonBackend.RE_LONG_INTEGER
+            if (isinstance(data, str))
+            else JsonBackend.RE_LONG_INTEGER_BYTES
+        )
+
+        return re_long_integer.search(data) is not None
+
+    @staticmethod
+    def _native_decode(data):
+        """
+        Decodes the given JSON data with "json.loads()".
+
+        :param data: Input JSON data
+
+        :return: (mixed) Python representation data; None on error
+        :since:  v1.1.0
+        """
+
+        try:
+            if not isinstance(data, (bytearray, bytes, str)):
+                data = str(data, "utf-8")
+
+            _return = json.loads(data)
+        except ValueError:
+            _return = None
+
+        return _return
+
+    @staticmethod
+    def _native_encode(json_resource, data):
+        """
+        Encodes the given Python data with "json.dumps()".
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (str) JSON output string
+        :since:  v1.1.0
+        """
+
+        return json.dumps(
+            data,
+            default=json_resource._get_native_serializable_data,
+            skipkeys=json_resource.skipkeys,
+        )
+
+
+class InternalJsonBackend(JsonBackend):
+    """
+    Backend using the internal parser and encoder.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    INTERNING = 2
+    """
+Highest "JsonResource" string interning mode applied by the decoder itself
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def decode(self, json_resource, data):
+        """
+        Decodes the given JSON data.
+
+        :param json_resource: JsonResource instance
+        :param data: Input JSON data
+
+        :return: (mixed) Python representation data; None on error
+        :since:  v1.1.0
+        """
+
+        return json_resource._json_to_data_internal(data)
+
+    def encode(self, json_resource, data):
+        """
+        Encodes the given Python data.
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (str) JSON output string
+        :since:  v1.1.0
+        """
+
+        return "".join(json_resource._iter_json_parts(data))
+
+    def iter_encode(self, json_resource, data):
+        """
+        Returns a generator yielding the JSON output of the given Python data
+        in parts.
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (object) Generator yielding JSON string parts
+        :since:  v1.1.0
+        """
+
+        return json_resource._iter_json_parts(data, json_resource.EXPORT_PARTS_COUNT)
+
+    def is_supported(self, json_resource):
+        """
+        Returns true if the backend honors the "struct_type" and "skipkeys"
+        settings of the given "JsonResource" instance.
+
+        :param json_resource: JsonResource instance
+
+        :return: (bool) True if supported
+        :since:  v1.1.0
+        """
+
+        return True
+
+
+class NativeJsonBackend(JsonBackend):
+    """
+    Backend using the Python "json" module. Its scanner shares equal object
+    keys of a document already.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    INTERNING = 1
+    """
+Highest "JsonResource" string interning mode applied by the decoder itself
+    """
+
+    PRIORITY = 10
+    """
+Relative speed used to select a backend for "IMPLEMENTATION_AUTO"
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def decode(self, json_resource, data):
+        """
+        Decodes the given JSON data.
+
+        :param json_resource: JsonResource instance
+        :param data: Input JSON data
+
+        :return: (mixed) Python representation data; None on error
+        :since:  v1.1.0
+        """
+
+        return JsonBackend._native_decode(data)
+
+    def encode(self, json_resource, data):
+        """
+        Encodes the given Python data.
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (str) JSON output string
+        :since:  v1.1.0
+        """
+
+        return JsonBackend._native_encode(json_resource, data)
+
+
+class MsgspecJsonBackend(JsonBackend):
+    """
+    Backend using "msgspec.json" for decoding. Data "msgspec" can not decode
+    like the native backend is handled by "json.loads()" instead. Output is
+    encoded with "json.dumps()" as "msgspec" writes compact separators and
+    "NaN" or "Infinity" as null.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    BINARY_INPUT = True
+    """
+True if "decode()" accepts UTF-8 encoded bytes-like objects, e.g. memoryviews
+    """
+
+    PRIORITY = 30
+    """
+Relative speed used to select a backend for "IMPLEMENTATION_AUTO"
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def decode(self, json_resource, data):
+        """
+        Decodes the given JSON data.
+
+        :param json_resource: JsonResource instance
+        :param data: Input JSON data
+
+        :return: (mixed) Python representation data; None on error
+        :since:  v1.1.0
+        """
+
+        try:
+            _return = (
+                JsonBackend._native_decode(data)
+                if (JsonBackend._has_long_integer(data))
+                else msgspec.json.decode(data)
+            )
+        except ValueError:
+            _return = JsonBackend._native_decode(data)
+
+        return _return
+
+    def encode(self, json_resource, data):
+        """
+        Encodes the given Python data.
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (str) JSON output string
+        :since:  v1.1.0
+        """
+
+        return JsonBackend._native_encode(json_resource, data)
+
+    def is_supported(self, json_resource):
+        """
+        Returns true if the backend honors the "struct_type" and "skipkeys"
+        settings of the given "JsonResource" instance.
+
+        :param json_resource: JsonResource instance
+
+        :return: (bool) True if supported
+        :since:  v1.1.0
+        """
+
+        return json_resource.struct_type is dict and json_resource.skipkeys
+
+    @staticmethod
+    def is_available():
+        """
+        Returns true if all dependencies of the backend are installed.
+
+        :return: (bool) True if available
+        :since:  v1.1.0
+        """
+
+        return msgspec is not None
+
+
+class OrjsonJsonBackend(JsonBackend):
+    """
+    Backend using "orjson" for decoding. Data "orjson" can not decode like the
+    native backend, e.g. integers exceeding 64 bits, is handled by
+    "json.loads()" instead. Output is encoded with "json.dumps()" as "orjson"
+    writes compact separators and "NaN" or "Infinity" as null.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    BINARY_INPUT = True
+    """
+True if "decode()" accepts UTF-8 encoded bytes-like objects, e.g. memoryviews
+    """
+
+    PRIORITY = 40
+    """
+Relative speed used to select a backend for "IMPLEMENTATION_AUTO"
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def decode(self, json_resource, data):
+        """
+        Decodes the given JSON data.
+
+        :param json_resource: JsonResource instance
+        :param data: Input JSON data
+
+        :return: (mixed) Python representation data; None on error
+        :since:  v1.1.0
+        """
+
+        try:
+            _return = (
+                JsonBackend._native_decode(data)
+                if (JsonBackend._has_long_integer(data))
+                else orjson.loads(data)
+            )
+        except orjson.JSONDecodeError:
+            _return = JsonBackend._native_decode(data)
+
+        return _return
+
+    def encode(self, json_resource, data):
+        """
+        Encodes the given Python data.
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (str) JSON output string
+        :since:  v1.1.0
+        """
+
+        return JsonBackend._native_encode(json_resource, data)
+
+    def is_supported(self, json_resource):
+        """
+        Returns true if the backend honors the "struct_type" and "skipkeys"
+        settings of the given "JsonResource" instance.
+
+        :param json_resource: JsonResource instance
+
+        :return: (bool) True if supported
+        :since:  v1.1.0
+        """
+
+        return json_resource.struct_type is dict and json_resource.skipkeys
+
+    @staticmethod
+    def is_available():
+        """
+        Returns true if all dependencies of the backend are installed.
+
+        :return: (bool) True if available
+        :since:  v1.1.0
+        """
+
+        return orjson is not None
+
+
+class UjsonJsonBackend(JsonBackend):
+    """
+    Backend using "ujson" for decoding. Data "ujson" can not decode like the
+    native backend is handled by "json.loads()" instead. Output is encoded
+    with "json.dumps()" as "ujson" converts keys of unsupported types with
+    "str()" instead of skipping them.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    PRIORITY = 20
+    """
+Relative speed used to select a backend for "IMPLEMENTATION_AUTO"
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def decode(self, json_resource, data):
+        """
+        Decodes the given JSON data.
+
+        :param json_resource: JsonResource instance
+        :param data: Input JSON data
+
+        :return: (mixed) Python representation data; None on error
+        :since:  v1.1.0
+        """
+
+        try:
+            _return = (
+                JsonBackend._native_decode(data)
+                if (JsonBackend._has_long_integer(data))
+                else ujson.loads(data)
+            )
+        except ValueError:
+            _return = JsonBackend._native_decode(data)
+
+        return _return
+
+    def encode(self, json_resource, data):
+        """
+        Encodes the given Python data.
+
+        :param json_resource: JsonResource instance
+        :param data: Python data
+
+        :return: (str) JSON output string
+        :since:  v1.1.0
+        """
+
+        return JsonBackend._native_encode(json_resource, data)
+
+    def is_supported(self, json_resource):
+        """
+        Returns true if the backend honors the "struct_type" and "skipkeys"
+        settings of the given "JsonResource" instance.
+
+        :param json_resource: JsonResource instance
+
+        :return: (bool) True if supported
+        :since:  v1.1.0
+        """
+
+        return json_resource.struct_type is dict and json_resource.skipkeys
+
+    @staticmethod
+    def is_available():
+        """
+        Returns true if all dependencies of the backend are installed.
+
+        :return: (bool) True if available
+        :since:  v1.1.0
+        """
+
+        return ujson is not None
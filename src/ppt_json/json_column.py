@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=import-error,invalid-name
+
+from time import perf_counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class JsonColumnMixin(object):
+    """
+    "JsonColumnMixin" reads a field of all elements of a list into a NumPy
+    array or list. The node path is resolved with "iter_nodes()".
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    COLUMN_MISSING_FILL = 1
+    """
+Use the fill value for missing nodes of a column
+    """
+    COLUMN_MISSING_RAISE = 2
+    """
+Raise a "ValueError" for missing nodes of a column
+    """
+    COLUMN_MISSING_SKIP = 3
+    """
+Leave out missing nodes of a column
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def get_column(
+        self,
+        node_path,
+        dtype=float,
+        missing=COLUMN_MISSING_FILL,
+        fill_value=None,
+    ):
+        """
+        Reads the nodes selected by the given path (e.g. "items#* price") as
+        one column in a single traversal. A contiguous NumPy array is returned
+        if NumPy is installed and a list otherwise. Nodes not found or null
+        are handled according to the given missing-value policy.
+
+        :param node_path: Path to the nodes - delimiter is space
+        :param dtype: NumPy data type; callable to convert each value of a
+                      list
+        :param missing: Missing-value policy (COLUMN_MISSING_FILL,
+                        COLUMN_MISSING_RAISE or COLUMN_MISSING_SKIP)
+        :param fill_value: Value used for missing nodes; NaN for NumPy arrays
+                           if not given
+
+        :return: (object) NumPy array or list of values
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.get_column({0})- (#echo(__LINE__)#)",
+                node_path,
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        if numpy is not None and fill_value is None:
+            fill_value = numpy.nan
+
+        values = self._iter_column_values(node_path, missing, fill_value)
+
+        if numpy is None:
+            _return = (
+                [(None if (value is None) else dtype(value)) for value in values]
+                if (callable(dtype))
+                else list(values)
+            )
+        else:
+            _return = numpy.fromiter(values, dtype)
+
+        if started is not None:
+            self._stats.record("get_column", started)
+
+        return _return
+
+    def _iter_column_values(self, node_path, missing, fill_value):
+        """
+        Returns a generator yielding the values of the nodes selected by the
+        given path with the missing-value policy applied.
+
+        :param node_path: Path to the nodes - delimiter is space
+        :param missing: Missing-value policy
+        :param fill_value: Value used for missing nodes
+
+        :return: (object) Generator yielding values
+        :since:  v1.1.0
+        """
+
+        for index, value in enumerate(self.iter_nodes(node_path, True)):
+            if value is None:
+                if missing == JsonColumnMixin.COLUMN_MISSING_RAISE:
+                    raise ValueError(
+                        "Node missing for column entry {0:d}".format(index)
+                    )
+
+                if missing == JsonColumnMixin.COLUMN_MISSING_SKIP:
+                    continue
+
+                value = fill_value
+
+            yield value
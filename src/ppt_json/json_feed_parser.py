@@ -0,0 +1,544 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from weakref import proxy, ProxyTypes
+import codecs
+import re
+
+from .json_resource import JsonResource
+
+
+class JsonFeedParser(object):
+    """
+    "JsonFeedParser" builds the Python representation of JSON data pushed in
+    chunks through "feed()". Only the incomplete token at the end of a chunk
+    is kept between calls.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    RE_NUMBER_CHARS = re.compile("[-+.0-9eE]*")
+    """
+RegExp to match characters a JSON number may consist of
+    """
+    RE_SINGLE_QUOTED_STRING = re.compile("'([^'\\\\]*(?:\\\\.[^'\\\\]*)*)'", re.S)
+    """
+RegExp to match a complete single quoted string
+    """
+    RE_SINGLE_QUOTED_STRING_CONTENT = re.compile("[^'\\\\]*(?:\\\\.[^'\\\\]*)*", re.S)
+    """
+RegExp to match single quoted string content up to the closing tag or an
+incomplete escape sequence
+    """
+    RE_STRING = re.compile('"([^"\\\\]*(?:\\\\.[^"\\\\]*)*)"', re.S)
+    """
+RegExp to match a complete string
+    """
+    RE_STRING_CONTENT = re.compile('[^"\\\\]*(?:\\\\.[^"\\\\]*)*', re.S)
+    """
+RegExp to match string content up to the closing tag or an incomplete escape
+sequence
+    """
+
+    STATE_COLON = 1
+    """
+Key delimiter expected
+    """
+    STATE_DELIMITER = 2
+    """
+Value delimiter or end of the current struct expected
+    """
+    STATE_DONE = 3
+    """
+Top level struct has been completed
+    """
+    STATE_ERROR = 4
+    """
+Invalid JSON data has been fed
+    """
+    STATE_KEY = 5
+    """
+Object key expected
+    """
+    STATE_KEY_OR_END = 6
+    """
+Object key or end of the object expected
+    """
+    STATE_VALUE = 7
+    """
+Value expected
+    """
+    STATE_VALUE_OR_END = 8
+    """
+Value or end of the list expected
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_decoder",
+        "_is_string_escaped",
+        "_key",
+        "_log_handler",
+        "_result",
+        "_stack",
+        "_state",
+        "_string_chunks",
+        "_string_tag",
+        "struct_type",
+    )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, struct_type=dict, log_handler=None):
+        """
+        Constructor __init__(JsonFeedParser)
+
+        :param struct_type: Dict implementation for new struct elements
+        :param log_handler: Log handler to use
+
+        :since: v1.1.0
+        """
+
+        self._buffer = ""
+        """
+Data of an incomplete token fed previously
+        """
+        self._decoder = None
+        """
+Incremental decoder used for binary chunks
+        """
+        self._is_string_escaped = False
+        """
+True if the incomplete string ends with an incomplete escape sequence
+        """
+        self._key = None
+        """
+Key of the next value of the innermost object
+        """
+        self._log_handler = None
+        """
+The log handler is called whenever debug messages should be logged or errors
+happened.
+        """
+        self._result = None
+        """
+Completed top level struct
+        """
+        self._stack = []
+        """
+Stack of incomplete structs
+        """
+        self._state = JsonFeedParser.STATE_VALUE
+        """
+Parser state
+        """
+        self._string_chunks = []
+        """
+Data fed since the start of an incomplete string
+        """
+        self._string_tag = None
+        """
+String delimiter of an incomplete string; None if no string is incomplete
+        """
+        self.struct_type = struct_type
+        """
+Dict implementation used to create new struct elements
+        """
+
+        if log_handler is not None:
+            self._log_handler = (
+                log_handler
+                if isinstance(log_handler, ProxyTypes)
+                else proxy(log_handler)
+            )
+
+    @property
+    def is_valid(self):
+        """
+        Returns false if invalid JSON data has been fed.
+
+        :return: (bool) True if valid so far
+        :since:  v1.1.0
+        """
+
+        return self._state != JsonFeedParser.STATE_ERROR
+
+    def _add_value(self, value):
+        """
+        Adds the given value to the innermost struct.
+
+        :param value: Python representation data
+
+        :since: v1.1.0
+        """
+
+        struct = self._stack[-1]
+
+        if isinstance(struct, list):
+            struct.append(value)
+        else:
+            struct[self._key] = value
+
+    def close(self):
+        """
+        Finalizes parsing and returns the result.
+
+        :return: (object) JsonResource instance; its data is None on error
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -JsonFeedParser.close()- (#echo(__LINE__)#)"
+            )
+
+        if self._string_tag is not None:
+            self._buffer = "".join(self._string_chunks)
+            self._string_chunks = []
+            self._string_tag = None
+
+        if self._decoder is not None and self._state != JsonFeedParser.STATE_ERROR:
+            try:
+                self._buffer += self._decoder.decode(b"", True)
+            except UnicodeDecodeError:
+                self._state = JsonFeedParser.STATE_ERROR
+
+        if self._state != JsonFeedParser.STATE_ERROR:
+            self._parse_buffer_safely(True)
+
+        _return = JsonResource(self.struct_type, self._log_handler)
+
+        if self._state == JsonFeedParser.STATE_DONE:
+            _return.set_json(self._result)
+
+        self._buffer = ""
+        self._result = None
+        self._stack = []
+
+        return _return
+
+    def feed(self, chunk):
+        """
+        Parses the given chunk of JSON data.
+
+        :param chunk: JSON data chunk (str or UTF-8 encoded bytes)
+
+        :return: (bool) False on error
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -JsonFeedParser.feed()- (#echo(__LINE__)#)"
+            )
+
+        if self._state != JsonFeedParser.STATE_ERROR:
+            if not isinstance(chunk, str):
+                if self._decoder is None:
+                    self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+                try:
+                    chunk = self._decoder.decode(chunk)
+                except UnicodeDecodeError:
+                    self._state = JsonFeedParser.STATE_ERROR
+
+            if self._state != JsonFeedParser.STATE_ERROR:
+                if self._string_tag is None:
+                    self._buffer = (self._buffer + chunk) if self._buffer else chunk
+                    self._parse_buffer_safely(False)
+                elif len(chunk) > 0:
+                    """
+Only the new chunk of an incomplete string is scanned for the closing tag.
+The chunks are joined and parsed once it has been found.
+                    """
+
+                    self._string_chunks.append(chunk)
+
+                    if self._scan_string_chunk(chunk):
+                        self._buffer = "".join(self._string_chunks)
+                        self._string_chunks = []
+                        self._string_tag = None
+
+                        self._parse_buffer_safely(False)
+
+        return self._state != JsonFeedParser.STATE_ERROR
+
+    def _parse_buffer(self, is_final):
+        """
+        Parses all complete tokens of the buffered data.
+
+        :param is_final: True if no more data will follow
+
+        :since: v1.1.0
+        """
+
+        # pylint: disable=too-many-branches,too-many-statements
+
+        buffer = self._buffer
+        buffer_length = len(buffer)
+        position = 0
+        stack = self._stack
+        state = self._state
+        string_tag = None
+
+        while True:
+            position = JsonResource.RE_WHITESPACE.match(buffer, position).end()
+
+            if position >= buffer_length:
+                break
+
+            char = buffer[position]
+            is_value_parsed = False
+
+            if state == JsonFeedParser.STATE_VALUE or (
+                state == JsonFeedParser.STATE_VALUE_OR_END and char != "]"
+            ):
+                if char == "{" or char == "[":
+                    struct = self.struct_type() if (char == "{") else []
+
+                    if len(stack) > 0:
+                        self._add_value(struct)
+
+                    stack.append(struct)
+                    position += 1
+
+                    state = (
+                        JsonFeedParser.STATE_KEY_OR_END
+                        if (char == "{")
+                        else JsonFeedParser.STATE_VALUE_OR_END
+                    )
+
+                    continue
+                elif len(stack) < 1:
+                    state = JsonFeedParser.STATE_ERROR
+                    break
+                elif char in JsonResource.STRING_TAG_CHARS:
+                    value, string_end_position = self._parse_string(
+                        buffer, position, char
+                    )
+
+                    if string_end_position < 0:
+                        if is_final:
+                            state = JsonFeedParser.STATE_ERROR
+                        else:
+                            string_tag = char
+
+                        break
+
+                    position = string_end_position
+                    is_value_parsed = True
+                elif char in "tfn":
+                    for literal, value in (
+                        ("true", True),
+                        ("false", False),
+                        ("null", None),
+                    ):
+                        if buffer.startswith(literal, position):
+                            position += len(literal)
+                            is_value_parsed = True
+                            break
+
+                    if not is_value_parsed:
+                        if is_final or not any(
+                            literal.startswith(buffer[position:])
+                            for literal in ("true", "false", "null")
+                        ):
+                            state = JsonFeedParser.STATE_ERROR
+
+                        break
+                else:
+                    if (
+                        not is_final
+                        and JsonFeedParser.RE_NUMBER_CHARS.match(buffer, position).end()
+                        == buffer_length
+                    ):
+                        break
+
+                    re_result = JsonResource.RE_NUMBER.match(buffer, position)
+
+                    if re_result is None:
+                        state = JsonFeedParser.STATE_ERROR
+                        break
+
+                    integer, fraction, exponent = re_result.groups()
+
+                    value = (
+                        int(integer)
+                        if (fraction is None and exponent is None)
+                        else float(re_result.group())
+                    )
+
+                    position = re_result.end()
+                    is_value_parsed = True
+            elif (
+                state == JsonFeedParser.STATE_DELIMITER
+                or (
+                    state == JsonFeedParser.STATE_VALUE_OR_END
+                    or state == JsonFeedParser.STATE_KEY_OR_END
+                )
+                and (char == "]" or char == "}")
+            ):
+                is_list = isinstance(stack[-1], list)
+                position += 1
+
+                if char == ",":
+                    state = (
+                        JsonFeedParser.STATE_VALUE
+                        if is_list
+                        else JsonFeedParser.STATE_KEY
+                    )
+                elif (char == "]" and is_list) or (char == "}" and not is_list):
+                    struct = stack.pop()
+
+                    if len(stack) > 0:
+                        state = JsonFeedParser.STATE_DELIMITER
+                    else:
+                        self._result = struct
+                        state = JsonFeedParser.STATE_DONE
+                else:
+                    state = JsonFeedParser.STATE_ERROR
+                    break
+            elif (
+                state == JsonFeedParser.STATE_KEY
+                or state == JsonFeedParser.STATE_KEY_OR_END
+            ) and char in JsonResource.STRING_TAG_CHARS:
+                key, string_end_position = self._parse_string(buffer, position, char)
+
+                if string_end_position < 0:
+                    if is_final:
+                        state = JsonFeedParser.STATE_ERROR
+                    else:
+                        string_tag = char
+
+                    break
+
+                self._key = key
+                position = string_end_position
+                state = JsonFeedParser.STATE_COLON
+            elif state == JsonFeedParser.STATE_COLON and char == ":":
+                position += 1
+                state = JsonFeedParser.STATE_VALUE
+            else:
+                state = JsonFeedParser.STATE_ERROR
+                break
+
+            if is_value_parsed:
+                self._add_value(value)
+                state = JsonFeedParser.STATE_DELIMITER
+
+        self._buffer = buffer[position:] if (position < buffer_length) else ""
+        self._state = state
+
+        if string_tag is not None:
+            self._string_chunks = [self._buffer]
+            self._string_tag = string_tag
+            self._buffer = ""
+
+            self._is_string_escaped = False
+            self._scan_string_chunk(self._string_chunks[0], 1)
+
+        if is_final and state != JsonFeedParser.STATE_DONE:
+            self._state = JsonFeedParser.STATE_ERROR
+
+    def _parse_buffer_safely(self, is_final):
+        """
+        Parses all complete tokens of the buffered data and sets the error
+        state for invalid escape sequences.
+
+        :param is_final: True if no more data will follow
+
+        :since: v1.1.0
+        """
+
+        try:
+            self._parse_buffer(is_final)
+        except (IndexError, ValueError):
+            self._buffer = ""
+            self._state = JsonFeedParser.STATE_ERROR
+
+    def _scan_string_chunk(self, chunk, position=0):
+        """
+        Scans the given chunk of an incomplete string for the closing tag.
+
+        :param chunk: Data of the incomplete string
+        :param position: Position to start scanning at
+
+        :return: (bool) True if the closing tag has been found
+        :since:  v1.1.0
+        """
+
+        if self._is_string_escaped:
+            position += 1
+
+        re_string_content = (
+            JsonFeedParser.RE_STRING_CONTENT
+            if (self._string_tag == '"')
+            else JsonFeedParser.RE_SINGLE_QUOTED_STRING_CONTENT
+        )
+
+        position = re_string_content.match(chunk, min(position, len(chunk))).end()
+
+        """
+The content ends at the closing tag, at an escape character without the
+escaped character or at the end of the chunk.
+        """
+
+        _return = position < len(chunk) and chunk[position] == self._string_tag
+        self._is_string_escaped = position < len(chunk) and not _return
+
+        return _return
+
+    @staticmethod
+    def _parse_string(data, position, string_tag):
+        """
+        Decodes the complete string starting at the given position.
+
+        :param data: Input JSON data
+        :param position: Position of the opening string tag
+        :param string_tag: String delimiter used
+
+        :return: (tuple) Decoded string and the position after the closing
+                 tag; position is -1 if the string is incomplete
+        :since:  v1.1.0
+        """
+
+        re_string = (
+            JsonFeedParser.RE_STRING
+            if (string_tag == '"')
+            else JsonFeedParser.RE_SINGLE_QUOTED_STRING
+        )
+
+        re_result = re_string.match(data, position)
+
+        if re_result is None:
+            _return = (None, -1)
+        else:
+            value = re_result.group(1)
+
+            _return = (
+                (value, re_result.end())
+                if ("\\" not in value)
+                else JsonResource._json_string_to_data(data, position + 1, string_tag)
+            )
+
+        return _return
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:
+    from collections import Mapping, Sequence
+
+
+class JsonIncrementalExportMixin(object):
+    """
+    "JsonIncrementalExportMixin" caches the encoded JSON fragments of
+    nested structs. Node changes mark the fragments of the changed struct and
+    its parents dirty, so "export_data()" only encodes these again.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def disable_incremental_export(self):
+        """
+        Disables the incremental export and discards all encoded fragments.
+
+        :since: v1.1.0
+        """
+
+        self._fragment_cache = None
+
+    def enable_incremental_export(self):
+        """
+        Enables the incremental export. "export_data()" keeps the encoded JSON
+        fragment of each struct and re-encodes only structs changed through
+        "add_node()", "change_node()" or "remove_node()" (and their batch
+        variants) afterwards. Changes made to the data by other means must be
+        followed by "set_json()" to be exported.
+
+        :since: v1.1.0
+        """
+
+        if self._fragment_cache is None:
+            self._fragment_cache = JsonIncrementalExportMixin._get_fragment_node(None)
+
+    def _get_incremental_json(self):
+        """
+        Returns the JSON output of the Python representation data. Encoded
+        parts of unchanged structs are reused and structs without nested
+        structs are encoded at once.
+
+        :return: (str) Result string
+        :since:  v1.1.0
+        """
+
+        # pylint: disable=too-many-branches
+
+        if self._fragment_cache[0] is not self._data:
+            self._fragment_cache = JsonIncrementalExportMixin._get_fragment_node(
+                self._data
+            )
+
+        root_fragment_node = self._fragment_cache
+
+        if root_fragment_node[1] is None:
+            if not (
+                isinstance(self._data, (Mapping, list))
+                and JsonIncrementalExportMixin._is_struct_nested(self._data)
+            ):
+                root_fragment_node[1] = self.data_to_json(self._data)
+            else:
+                separators_probe = self.data_to_json([0, {"": 0}])
+                key_separator = separators_probe[
+                    separators_probe.index('""') + 2 : separators_probe.rindex("0")
+                ]
+                item_separator = separators_probe[2 : separators_probe.index("{")]
+                key_prefixes = {}
+
+                stack = [
+                    JsonIncrementalExportMixin._get_fragment_frame(
+                        root_fragment_node, None, None, ""
+                    )
+                ]
+
+                while len(stack) > 0:
+                    (
+                        fragment_node,
+                        keys_iterator,
+                        parent_parts,
+                        parent_key,
+                        key_prefix,
+                    ) = stack[-1]
+
+                    struct, _, fragment_children, parts, _ = fragment_node
+                    key = next(keys_iterator, self._STRUCT_END)
+
+                    if key is self._STRUCT_END:
+                        stack.pop()
+
+                        fragment_node[1] = (
+                            "{{{0}}}".format(item_separator.join(parts.values()))
+                            if isinstance(parts, dict)
+                            else "[{0}]".format(item_separator.join(parts))
+                        )
+
+                        if parent_parts is not None:
+                            parent_parts[parent_key] = key_prefix + fragment_node[1]
+
+                        continue
+
+                    if isinstance(parts, dict):
+                        if key not in struct:
+                            fragment_children.pop(key, None)
+                            parts.pop(key, None)
+
+                            continue
+
+                        value_key_prefix = key_prefixes.get(key)
+
+                        if value_key_prefix is None:
+                            json_key = (
+                                key
+                                if (isinstance(key, str))
+                                else self._get_json_key(key)
+                            )
+
+                            if json_key is None:
+                                continue
+
+                            value_key_prefix = (
+                                self.data_to_json(json_key) + key_separator
+                            )
+
+                            key_prefixes[key] = value_key_prefix
+                    else:
+                        value_key_prefix = ""
+
+                    value = struct[key]
+
+                    if isinstance(value, (Mapping, list)):
+                        value_fragment_node = fragment_children.get(key)
+
+                        if (
+                            value_fragment_node is None
+                            or value_fragment_node[0] is not value
+                        ):
+                            value_fragment_node = (
+                                JsonIncrementalExportMixin._get_fragment_node(value)
+                            )
+                            fragment_children[key] = value_fragment_node
+
+                        if value_fragment_node[1] is None:
+                            if JsonIncrementalExportMixin._is_struct_nested(value):
+                                stack.append(
+                                    JsonIncrementalExportMixin._get_fragment_frame(
+                                        value_fragment_node,
+                                        parts,
+                                        key,
+                                        value_key_prefix,
+                                    )
+                                )
+
+                                continue
+
+                            value_fragment_node[1] = self.data_to_json(value)
+
+                        parts[key] = value_key_prefix + value_fragment_node[1]
+                    else:
+                        fragment_children.pop(key, None)
+                        parts[key] = value_key_prefix + self.data_to_json(value)
+
+        return root_fragment_node[1]
+
+    def _mark_fragments_dirty(self, node_path_steps, is_position_removed=False):
+        """
+        Marks the encoded fragments of all structs containing the node of the
+        given path as dirty and removes the fragments of the node itself.
+
+        :param node_path_steps: Steps of the changed or removed node path
+        :param is_position_removed: True if a list entry has been removed and
+                                    all following positions shifted
+
+        :since: v1.1.0
+        """
+
+        fragment_node = self._fragment_cache
+
+        if fragment_node[0] is self._data:
+            keys = []
+
+            for node_name, node_position in node_path_steps:
+                keys.append((node_name, True))
+
+                if node_position >= 0:
+                    keys.append((node_position, False))
+
+            keys_count = len(keys)
+
+            for index, (key, is_name) in enumerate(keys, 1):
+                struct, _, fragment_children, _, dirty_keys = fragment_node
+                fragment_node[1] = None
+
+                if (is_name and not isinstance(struct, Mapping)) or (
+                    (not is_name) and not isinstance(struct, Sequence)
+                ):
+                    continue
+
+                if index == keys_count and is_position_removed and not is_name:
+                    fragment_children.clear()
+                    fragment_node[3] = None
+                else:
+                    dirty_keys.add(key)
+
+                    fragment_node = (
+                        fragment_children.pop(key, None)
+                        if (index == keys_count)
+                        else fragment_children.get(key)
+                    )
+
+                    if fragment_node is None:
+                        break
+
+    def _reset_fragment_cache(self):
+        """
+        Discards all encoded fragments if incremental export is enabled.
+
+        :since: v1.1.0
+        """
+
+        if self._fragment_cache is not None:
+            self._fragment_cache = JsonIncrementalExportMixin._get_fragment_node(None)
+
+    @staticmethod
+    def _get_fragment_frame(fragment_node, parent_parts, parent_key, key_prefix):
+        """
+        Returns a new stack frame to encode the struct of the given fragment
+        node incrementally. All keys are encoded if no encoded parts exist
+        and only the dirty ones otherwise.
+
+        :param fragment_node: Fragment node of the struct
+        :param parent_parts: Encoded parts of the parent struct; None for the
+                             top level struct
+        :param parent_key: Key or list position in the parent struct
+        :param key_prefix: Encoded object key and separator of the struct
+
+        :return: (list) Fragment node, keys iterator, parent parts, parent key
+                 and key prefix
+        :since:  v1.1.0
+        """
+
+        struct = fragment_node[0]
+
+        if fragment_node[3] is None:
+            if isinstance(struct, Mapping):
+                fragment_node[3] = {}
+                keys_iterator = iter(struct)
+            else:
+                fragment_node[3] = [None] * len(struct)
+                keys_iterator = iter(range(len(struct)))
+        else:
+            keys_iterator = iter(list(fragment_node[4]))
+
+        fragment_node[4].clear()
+
+        return [fragment_node, keys_iterator, parent_parts, parent_key, key_prefix]
+
+    @staticmethod
+    def _get_fragment_node(struct):
+        """
+        Returns a new fragment node for the given struct.
+
+        :param struct: Object or list
+
+        :return: (list) Struct, encoded JSON fragment (None if dirty), dict of
+                 child fragment nodes, encoded parts by key or list position
+                 (None if not encoded yet) and set of dirty keys
+        :since:  v1.1.0
+        """
+
+        return [struct, None, {}, None, set()]
+
+    @staticmethod
+    def _is_struct_nested(struct):
+        """
+        Returns true if the given struct contains further structs.
+
+        :param struct: Object or list
+
+        :return: (bool) True if nested
+        :since:  v1.1.0
+        """
+
+        return any(
+            isinstance(value, (Mapping, list))
+            for value in (struct.values() if (isinstance(struct, Mapping)) else struct)
+        )
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+import re
+
+
+class JsonLazySource(object):
+    """
+    "JsonLazySource" holds JSON data together with the positions of all
+    matching struct delimiters found in one structural scan.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    RE_STRUCTURE = re.compile(
+        "[^\"'\\[\\]{}]*"
+        "(?:(?:\"[^\"\\\\]*(?:\\\\.[^\"\\\\]*)*\"|'[^'\\\\]*(?:\\\\.[^'\\\\]*)*')"
+        "[^\"'\\[\\]{}]*)*"
+        "([\\[\\]{}])",
+        re.S,
+    )
+    """
+RegExp to find the next struct delimiter outside of strings
+    """
+
+    __slots__ = ("data", "spans")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, data, spans):
+        """
+        Constructor __init__(JsonLazySource)
+
+        :param data: Input JSON data
+        :param spans: Dict of struct start positions to end positions
+
+        :since: v1.1.0
+        """
+
+        self.data = data
+        """
+Input JSON data
+        """
+        self.spans = spans
+        """
+Dict of struct start positions to the positions of the closing delimiter
+        """
+
+    @staticmethod
+    def scan(data):
+        """
+        Scans the given JSON data for matching struct delimiters.
+
+        :param data: Input JSON data
+
+        :return: (object) JsonLazySource instance; None on error
+        :since:  v1.1.0
+        """
+
+        _return = None
+
+        spans = {}
+        stack = []
+        is_valid = True
+        position = 0
+
+        while True:
+            """
+Matches are anchored at the end of the previous one. A failing match means
+no further delimiter or an unterminated string and ends the scan instead of
+retrying the pattern at every following position.
+            """
+
+            re_result = JsonLazySource.RE_STRUCTURE.match(data, position)
+
+            if re_result is None:
+                break
+
+            delimiter = re_result.group(1)
+            position = re_result.end()
+
+            if delimiter == "{" or delimiter == "[":
+                stack.append(re_result.start(1))
+            else:
+                if len(stack) < 1:
+                    is_valid = False
+                    break
+
+                start_position = stack.pop()
+
+                if (data[start_position] == "{") != (delimiter == "}"):
+                    is_valid = False
+                    break
+
+                spans[start_position] = re_result.start(1)
+
+        if is_valid and len(stack) < 1:
+            _return = JsonLazySource(data, spans)
+
+        return _return
+
+
+class JsonLazyValue(object):
+    """
+    "JsonLazyValue" is the placeholder of a struct not yet decoded from a
+    "JsonLazySource".
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ("position", "source")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, source, position):
+        """
+        Constructor __init__(JsonLazyValue)
+
+        :param source: JsonLazySource instance
+        :param position: Position of the opening struct delimiter
+
+        :since: v1.1.0
+        """
+
+        self.position = position
+        """
+Position of the opening struct delimiter
+        """
+        self.source = source
+        """
+JsonLazySource instance containing the struct
+        """
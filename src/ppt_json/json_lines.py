@@ -0,0 +1,585 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from weakref import proxy, ProxyTypes
+import os
+
+from .json_resource import JsonResource
+
+
+class _JsonInvalidLine(object):
+    """
+    Type of the "INVALID_LINE" marker. Its only instance is kept if results
+    are transferred from worker processes.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __reduce__(self):
+        """
+        python.org: The interface is currently defined as follows. The
+        __reduce__() method takes no argument and shall return either a string
+        or preferably a tuple.
+
+        :return: (str) Name of the module global instance
+        :since:  v1.1.0
+        """
+
+        return "INVALID_LINE"
+
+    def __repr__(self):
+        """
+        python.org: Called by the repr() built-in function to compute the
+        "official" string representation of an object.
+
+        :return: (str) Marker name
+        :since:  v1.1.0
+        """
+
+        return "INVALID_LINE"
+
+
+INVALID_LINE = _JsonInvalidLine()
+"""
+Value of lines not containing valid JSON data
+"""
+
+
+class JsonLinesReader(object):
+    """
+    "JsonLinesReader" decodes JSON Lines (one JSON value per line) from a
+    file or an iterable of lines in batches. Batches may be decoded in a
+    process pool.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    BATCH_SIZE = 1000
+    """
+Default number of lines decoded together
+    """
+    INVALID_LINE = INVALID_LINE
+    """
+Value of lines not containing valid JSON data
+    """
+
+    __slots__ = (
+        "_file_obj",
+        "_log_handler",
+        "_source",
+        "batch_size",
+        "implementation",
+        "ordered",
+        "processes",
+        "struct_type",
+    )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(
+        self,
+        source,
+        struct_type=dict,
+        implementation=None,
+        batch_size=None,
+        processes=0,
+        ordered=True,
+        log_handler=None,
+    ):
+        """
+        Constructor __init__(JsonLinesReader)
+
+        :param source: Path to an UTF-8 encoded JSON Lines file or an
+                       iterable of lines (str or UTF-8 encoded bytes)
+        :param struct_type: Dict implementation for new struct elements
+        :param implementation: Implementation identifier
+        :param batch_size: Number of lines decoded together
+        :param processes: Number of worker processes; 0 to decode in the
+                          current process and None for one per CPU
+        :param ordered: False to yield batches decoded in worker processes as
+                        soon as they are completed
+        :param log_handler: Log handler to use
+
+        :since: v1.1.0
+        """
+
+        self._file_obj = None
+        """
+File object opened for the given path
+        """
+        self._log_handler = None
+        """
+The log handler is called whenever debug messages should be logged or errors
+happened.
+        """
+        self._source = source
+        """
+Path to the JSON Lines file or iterable of lines
+        """
+        self.batch_size = (
+            JsonLinesReader.BATCH_SIZE if (batch_size is None) else batch_size
+        )
+        """
+Number of lines decoded together
+        """
+        self.implementation = implementation
+        """
+Implementation identifier used for decoding
+        """
+        self.ordered = ordered
+        """
+False to yield batches decoded in worker processes in completion order
+        """
+        self.processes = processes
+        """
+Number of worker processes; 0 to decode in the current process
+        """
+        self.struct_type = struct_type
+        """
+Dict implementation used to create new struct elements
+        """
+
+        if log_handler is not None:
+            self._log_handler = (
+                log_handler
+                if isinstance(log_handler, ProxyTypes)
+                else proxy(log_handler)
+            )
+
+    def __enter__(self):
+        """
+        python.org: Enter the runtime context related to this object.
+
+        :return: (object) JsonLinesReader instance
+        :since:  v1.1.0
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        python.org: Exit the runtime context related to this object.
+
+        :return: (bool) True to suppress exceptions
+        :since:  v1.1.0
+        """
+
+        self.close()
+        return False
+
+    def __iter__(self):
+        """
+        python.org: Return an iterator object.
+
+        :return: (object) Generator yielding the Python representation data
+                 of each line; "INVALID_LINE" for invalid lines
+        :since:  v1.1.0
+        """
+
+        batches = self.iter_batches()
+
+        try:
+            for _, batch_data in batches:
+                yield from batch_data
+        finally:
+            """
+The process pool and the file are released even if the reader is iterated
+without a "with" statement and the iteration is stopped early.
+            """
+
+            batches.close()
+            self.close()
+
+    def close(self):
+        """
+        Closes the file opened for the given path.
+
+        :since: v1.1.0
+        """
+
+        if self._file_obj is not None:
+            self._file_obj.close()
+            self._file_obj = None
+
+    def _iter_lines(self):
+        """
+        Yields all non-empty lines of the source.
+
+        :return: (object) Generator yielding lines without whitespace; an
+                 empty string for lines not encoded in UTF-8
+        :since:  v1.1.0
+        """
+
+        if isinstance(self._source, str):
+            if self._file_obj is None:
+                self._file_obj = open(self._source, "rb")
+
+            lines = self._file_obj
+        else:
+            lines = self._source
+
+        for line in lines:
+            if not isinstance(line, str):
+                try:
+                    line = str(line, "utf-8")
+                except UnicodeDecodeError:
+                    """
+Lines not encoded in UTF-8 are passed on as an empty line as it is never valid
+JSON data.
+                    """
+
+                    yield ""
+                    continue
+
+            line = line.strip(JsonResource.WHITESPACE_CHARS)
+
+            if len(line) > 0:
+                yield line
+
+    def _iter_line_batches(self):
+        """
+        Yields the non-empty lines of the source in batches.
+
+        :return: (object) Generator yielding tuples of the index of the first
+                 value and the list of lines
+        :since:  v1.1.0
+        """
+
+        batch = []
+        position = 0
+
+        for line in self._iter_lines():
+            batch.append(line)
+
+            if len(batch) >= self.batch_size:
+                yield position, batch
+
+                position += len(batch)
+                batch = []
+
+        if len(batch) > 0:
+            yield position, batch
+
+    def iter_batches(self):
+        """
+        Returns a generator yielding the decoded values in batches. Batches
+        are yielded in completion order if decoded in worker processes and
+        "ordered" is false.
+
+        :return: (object) Generator yielding tuples of the index of the first
+                 value and the list of decoded values; "INVALID_LINE" for
+                 invalid lines
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -JsonLinesReader.iter_batches()- (#echo(__LINE__)#)"
+            )
+
+        if self.processes == 0:
+            json_resource = JsonLinesReader._get_json_resource(
+                self.struct_type, self.implementation
+            )
+
+            for position, batch in self._iter_line_batches():
+                yield (
+                    position,
+                    JsonLinesReader._decode_batch(json_resource, batch),
+                )
+        else:
+            yield from self._iter_batches_in_processes()
+
+    def _iter_batches_in_processes(self):
+        """
+        Decodes the batches of lines in a process pool. The number of pending
+        batches is bounded to keep memory usage independent of the input size.
+
+        :return: (object) Generator yielding tuples of the index of the first
+                 value and the list of decoded values
+        :since:  v1.1.0
+        """
+
+        processes = (
+            (os.cpu_count() or 1) if (self.processes is None) else self.processes
+        )
+
+        with ProcessPoolExecutor(processes) as executor:
+            futures_limit = 2 * processes
+            pending_futures = deque()
+
+            try:
+                for position, batch in self._iter_line_batches():
+                    pending_futures.append(
+                        executor.submit(
+                            _decode_json_lines,
+                            self.struct_type,
+                            self.implementation,
+                            position,
+                            batch,
+                        )
+                    )
+
+                    if len(pending_futures) >= futures_limit:
+                        yield from self._pop_completed_batches(pending_futures)
+
+                while len(pending_futures) > 0:
+                    yield from self._pop_completed_batches(pending_futures)
+            finally:
+                for future in pending_futures:
+                    future.cancel()
+
+    def _pop_completed_batches(self, pending_futures):
+        """
+        Waits for pending batches and removes the completed ones.
+
+        :param pending_futures: Deque of pending futures
+
+        :return: (object) Generator yielding tuples of the index of the first
+                 value and the list of decoded values
+        :since:  v1.1.0
+        """
+
+        if self.ordered:
+            yield pending_futures.popleft().result()
+        else:
+            completed_futures, _ = wait(pending_futures, return_when=FIRST_COMPLETED)
+
+            for future in completed_futures:
+                pending_futures.remove(future)
+                yield future.result()
+
+    @staticmethod
+    def _decode_batch(json_resource, batch):
+        """
+        Decodes the given batch of lines. Each line may contain any JSON value
+        including top level scalars.
+
+        :param json_resource: JsonResource instance used for decoding
+        :param batch: List of lines without surrounding whitespace
+
+        :return: (list) Decoded values; "INVALID_LINE" for invalid lines
+        :since:  v1.1.0
+        """
+
+        _return = []
+
+        backend = json_resource.backend
+
+        is_internal = (
+            json_resource.implementation == JsonResource.IMPLEMENTATION_INTERNAL
+        )
+
+        for line in batch:
+            value = (
+                json_resource._json_to_data_internal(line, True)
+                if (is_internal)
+                else backend.decode(json_resource, line)
+            )
+
+            if value is None and line != "null":
+                value = JsonLinesReader.INVALID_LINE
+
+            _return.append(value)
+
+        return _return
+
+    @staticmethod
+    def _get_json_resource(struct_type, implementation):
+        """
+        Returns a "JsonResource" instance configured for decoding.
+
+        :param struct_type: Dict implementation for new struct elements
+        :param implementation: Implementation identifier
+
+        :return: (object) JsonResource instance
+        :since:  v1.1.0
+        """
+
+        _return = JsonResource(struct_type)
+        _return.implementation = implementation
+
+        return _return
+
+
+class JsonLinesWriter(object):
+    """
+    "JsonLinesWriter" writes Python data as JSON Lines (one JSON value per
+    line) to a file-like object or a file.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ("_file_obj", "_is_file_owned", "_json_resource", "batch_size")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, target, implementation=None, batch_size=None, log_handler=None):
+        """
+        Constructor __init__(JsonLinesWriter)
+
+        :param target: Path to the JSON Lines file to create or a file-like
+                       object to write strings to
+        :param implementation: Implementation identifier
+        :param batch_size: Number of lines written at once
+        :param log_handler: Log handler to use
+
+        :since: v1.1.0
+        """
+
+        self._file_obj = target
+        """
+File-like object to write to
+        """
+        self._is_file_owned = isinstance(target, str)
+        """
+True if the file has been opened by this instance
+        """
+        self._json_resource = JsonResource(log_handler=log_handler)
+        """
+JsonResource instance used for encoding
+        """
+        self.batch_size = (
+            JsonLinesReader.BATCH_SIZE if (batch_size is None) else batch_size
+        )
+        """
+Number of lines written at once
+        """
+
+        self._json_resource.implementation = implementation
+
+        if self._is_file_owned:
+            self._file_obj = open(target, "w", encoding="utf-8")
+
+    def __enter__(self):
+        """
+        python.org: Enter the runtime context related to this object.
+
+        :return: (object) JsonLinesWriter instance
+        :since:  v1.1.0
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        python.org: Exit the runtime context related to this object.
+
+        :return: (bool) True to suppress exceptions
+        :since:  v1.1.0
+        """
+
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Closes the file opened for the given path.
+
+        :since: v1.1.0
+        """
+
+        if self._is_file_owned and self._file_obj is not None:
+            self._file_obj.close()
+            self._file_obj = None
+
+    def write(self, data):
+        """
+        Writes the given Python data as one line.
+
+        :param data: Python data
+
+        :since: v1.1.0
+        """
+
+        self._file_obj.write(self._json_resource.data_to_json(data) + "\n")
+
+    def write_all(self, iterable):
+        """
+        Writes each Python data value of the given iterable as one line.
+
+        :param iterable: Iterable of Python data
+
+        :return: (int) Number of lines written
+        :since:  v1.1.0
+        """
+
+        _return = 0
+
+        data_to_json = self._json_resource.data_to_json
+        lines = []
+
+        for data in iterable:
+            lines.append(data_to_json(data))
+
+            if len(lines) >= self.batch_size:
+                lines.append("")
+                self._file_obj.write("\n".join(lines))
+
+                _return += len(lines) - 1
+                lines = []
+
+        if len(lines) > 0:
+            lines.append("")
+            self._file_obj.write("\n".join(lines))
+
+            _return += len(lines) - 1
+
+        return _return
+
+
+def _decode_json_lines(struct_type, implementation, position, batch):
+    """
+    Decodes the given batch of lines in a worker process.
+
+    :param struct_type: Dict implementation for new struct elements
+    :param implementation: Implementation identifier
+    :param position: Index of the first value of the batch
+    :param batch: List of lines
+
+    :return: (tuple) Index of the first value and the list of decoded values
+    :since:  v1.1.0
+    """
+
+    json_resource = JsonLinesReader._get_json_resource(struct_type, implementation)
+    return position, JsonLinesReader._decode_batch(json_resource, batch)
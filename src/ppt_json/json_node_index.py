@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+import sys
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+class JsonNodeIndexMixin(object):
+    """
+    "JsonNodeIndexMixin" maintains an optional index of the JSON tree
+    elements by their node path steps. Node changes update the index
+    incrementally.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    @property
+    def node_index_size(self):
+        """
+        Returns the approximate memory used by the index built with
+        "build_index()".
+
+        :return: (int) Memory used in bytes; 0 if no index is built
+        :since:  v1.1.0
+        """
+
+        _return = 0
+
+        if self._node_index is not None:
+            _return = sys.getsizeof(self._node_index) + sum(
+                sys.getsizeof(node_index_steps) + sys.getsizeof(node_index_steps[-1])
+                for node_index_steps in self._node_index
+            )
+
+        return _return
+
+    def _add_indexed_nodes(
+        self, node_path, node_ptr, node_key, is_position_removed=False
+    ):
+        """
+        Adds the indexed node pointers of the node changed at the given key or
+        list position.
+
+        :param node_path: Compiled path to the node
+        :param node_ptr: Mutable struct containing the node
+        :param node_key: Key or list position of the node
+        :param is_position_removed: True if a list entry has been removed and
+                                    all following positions shifted
+
+        :since: v1.1.0
+        """
+
+        for node_index_steps, node_index_ptr in self._iter_node_index_items(
+            node_path, node_ptr, node_key, is_position_removed
+        ):
+            self._node_index[node_index_steps] = node_index_ptr
+
+    def build_index(self):
+        """
+        Builds an index of all nodes reachable by a node path of object keys
+        and list positions. Indexed nodes are looked up without walking the
+        path. The index is updated by changes and dropped if new data is set.
+
+        :return: (int) Approximate memory used by the index in bytes
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.build_index()- (#echo(__LINE__)#)"
+            )
+
+        if self._lazy_source is not None:
+            self._materialize_lazy_values(self._data)
+
+        self._node_index = {}
+
+        if isinstance(self._data, Mapping):
+            get_child_items = JsonNodeIndexMixin._get_node_index_child_items
+
+            self._node_index.update(
+                JsonNodeIndexMixin._iter_node_index_children(
+                    [
+                        node_index_item
+                        for key, value in self._data.items()
+                        for node_index_item in get_child_items((), key, value)
+                    ]
+                )
+            )
+
+        return self.node_index_size
+
+    def drop_index(self):
+        """
+        Removes the index built with "build_index()".
+
+        :since: v1.1.0
+        """
+
+        self._node_index = None
+
+    def _iter_node_index_items(
+        self, node_path, node_ptr, node_key, is_position_removed=False
+    ):
+        """
+        Returns the indexed node pointers of the node at the given key or list
+        position including all children.
+
+        :param node_path: Compiled path to the node
+        :param node_ptr: Mutable struct containing the node
+        :param node_key: Key or list position of the node
+        :param is_position_removed: True to include all following list
+                                    positions
+
+        :return: (object) Generator yielding node path steps and node pointer
+                 tuples
+        :since:  v1.1.0
+        """
+
+        node_parent_steps = node_path.steps[:-1]
+
+        if isinstance(node_ptr, Mapping):
+            node_index_items = (
+                JsonNodeIndexMixin._get_node_index_child_items(
+                    node_parent_steps, node_key, node_ptr[node_key]
+                )
+                if (node_key in node_ptr)
+                else []
+            )
+        else:
+            node_name = node_path.steps[-1][0]
+
+            node_index_items = [
+                (node_parent_steps + ((node_name, position),), node_ptr[position])
+                for position in range(
+                    node_key,
+                    len(node_ptr)
+                    if is_position_removed
+                    else min(node_key + 1, len(node_ptr)),
+                )
+            ]
+
+        return JsonNodeIndexMixin._iter_node_index_children(node_index_items)
+
+    def _remove_indexed_nodes(
+        self, node_path, node_ptr, node_key, is_position_removed=False
+    ):
+        """
+        Removes the indexed node pointers of the node to be changed at the
+        given key or list position. The index is dropped if the struct
+        containing the node is not indexed under the path of the node.
+
+        :param node_path: Compiled path to the node
+        :param node_ptr: Mutable struct containing the node
+        :param node_key: Key or list position of the node
+        :param is_position_removed: True if a list entry will be removed and
+                                    all following positions shifted
+
+        :since: v1.1.0
+        """
+
+        node_parent_steps = node_path.steps[:-1]
+
+        if isinstance(node_ptr, Mapping):
+            node_index_ptr = (
+                self._data
+                if (len(node_parent_steps) < 1)
+                else self._node_index.get(node_parent_steps)
+            )
+        else:
+            node_index_ptr = self._node_index.get(
+                node_parent_steps + ((node_path.steps[-1][0], -1),)
+            )
+
+        if node_index_ptr is node_ptr:
+            for node_index_steps, _ in self._iter_node_index_items(
+                node_path, node_ptr, node_key, is_position_removed
+            ):
+                self._node_index.pop(node_index_steps, None)
+        else:
+            self._node_index = None
+
+    @staticmethod
+    def _get_node_index_child_items(node_parent_steps, key, value):
+        """
+        Returns the indexed node pointers of the given object member. Entries
+        of a list value are indexed by their list position.
+
+        :param node_parent_steps: Node path steps of the object
+        :param key: Object key
+        :param value: JSON tree element of the member
+
+        :return: (list) Node path steps and node pointer tuples
+        :since:  v1.1.0
+        """
+
+        _return = [(node_parent_steps + ((key, -1),), value)]
+
+        if isinstance(value, list):
+            _return.extend(
+                (node_parent_steps + ((key, position),), entry)
+                for position, entry in enumerate(value)
+            )
+
+        return _return
+
+    @staticmethod
+    def _iter_node_index_children(node_index_items):
+        """
+        Yields the given indexed node pointers and the ones of all object
+        members below them.
+
+        :param node_index_items: List of node path steps and node pointer
+                                 tuples
+
+        :return: (object) Generator yielding node path steps and node pointer
+                 tuples
+        :since:  v1.1.0
+        """
+
+        stack = list(node_index_items)
+
+        while len(stack) > 0:
+            node_index_steps, node_ptr = stack.pop()
+            yield node_index_steps, node_ptr
+
+            if isinstance(node_ptr, Mapping):
+                for key, value in node_ptr.items():
+                    stack.extend(
+                        JsonNodeIndexMixin._get_node_index_child_items(
+                            node_index_steps, key, value
+                        )
+                    )
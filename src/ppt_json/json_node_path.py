@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from functools import lru_cache
+import re
+
+
+class JsonNodePath(object):
+    """
+    A "JsonNodePath" is the pre-compiled form of a space delimited node path.
+    Each step is a tuple of the node name and the list position (-1 if not
+    given).
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    CACHE_SIZE = 2048
+    """
+Maximum number of compiled node paths kept in the shared LRU cache
+    """
+
+    RE_NODE_POSITION = re.compile("^(.+)#(\\d+)$")
+    """
+RegExp to find node names with a specified position in a list
+    """
+
+    RE_NODE_SELECTION = re.compile("^(.+)#(\\*|(-?\\d*):(-?\\d*))$")
+    """
+RegExp to find node names with a wildcard or a slice of list positions
+    """
+
+    __slots__ = ("_parent", "_pattern_steps", "_prefix_steps", "path", "steps")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, node_path, steps=None):
+        """
+        Constructor __init__(JsonNodePath)
+
+        :param node_path: Path to the node - delimiter is space
+        :param steps: Already compiled steps of the given path
+
+        :since: v1.1.0
+        """
+
+        self._parent = None
+        """
+Compiled path of the parent node
+        """
+        self._pattern_steps = None
+        """
+Steps of this path with list selections
+        """
+        self._prefix_steps = None
+        """
+Prefix steps and the remaining steps of this path
+        """
+        self.path = node_path
+        """
+Path to the node - delimiter is space
+        """
+        self.steps = steps
+        """
+Tuple of node name and list position tuples
+        """
+
+        if steps is None:
+            self.steps = tuple(
+                JsonNodePath._get_step(node_name)
+                for node_name in (node_path.split(" ") if (len(node_path) > 0) else ())
+            )
+
+    def __eq__(self, other):
+        """
+        python.org: The correspondence between operator symbols and method names
+        is as follows: x==y calls x.__eq__(y)
+
+        :param other: Object to compare with
+
+        :return: (bool) True if equal
+        :since:  v1.1.0
+        """
+
+        return isinstance(other, JsonNodePath) and self.steps == other.steps
+
+    def __hash__(self):
+        """
+        python.org: Called by built-in function hash() and for operations on
+        members of hashed collections.
+
+        :return: (int) Hash value
+        :since:  v1.1.0
+        """
+
+        return hash(self.steps)
+
+    def __len__(self):
+        """
+        python.org: Called to implement the built-in function len().
+
+        :return: (int) Number of steps
+        :since:  v1.1.0
+        """
+
+        return len(self.steps)
+
+    def __repr__(self):
+        """
+        python.org: Called by the repr() built-in function to compute the
+        "official" string representation of an object.
+
+        :return: (str) String representation
+        :since:  v1.1.0
+        """
+
+        return "<{0} {1!r}>".format(self.__class__.__name__, self.path)
+
+    def __str__(self):
+        """
+        python.org: Called by str(object) and the built-in functions format()
+        and print() to compute the "informal" or nicely printable string
+        representation of an object.
+
+        :return: (str) Path to the node - delimiter is space
+        :since:  v1.1.0
+        """
+
+        return self.path
+
+    @property
+    def parent(self):
+        """
+        Returns the compiled path of the parent node.
+
+        :return: (object) JsonNodePath instance
+        :since:  v1.1.0
+        """
+
+        if self._parent is None:
+            self._parent = JsonNodePath.from_steps(self.steps[:-1])
+
+        return self._parent
+
+    @property
+    def is_pattern(self):
+        """
+        Returns true if this path contains a wildcard or a slice of list
+        positions.
+
+        :return: (bool) True if this path selects multiple nodes
+        :since:  v1.1.0
+        """
+
+        return any(
+            isinstance(node_selection, tuple)
+            for _, node_selection in self.pattern_steps
+        )
+
+    @property
+    def pattern_steps(self):
+        """
+        Returns the steps of this path with list selections. "name#*" selects
+        all list positions and "name#start:stop" a slice of them. A list
+        selection is given as a tuple of slice start and stop values.
+
+        :return: (tuple) Tuple of node name and list position or selection
+                 tuples
+        :since:  v1.1.0
+        """
+
+        if self._pattern_steps is None:
+            self._pattern_steps = tuple(
+                JsonNodePath._get_pattern_step(node_name, node_position)
+                for node_name, node_position in self.steps
+            )
+
+        return self._pattern_steps
+
+    @property
+    def prefix_steps(self):
+        """
+        Returns all non-empty prefixes of this path, longest first, together
+        with the steps remaining after each prefix. A prefix ending with a list
+        position is followed by the prefix addressing the list itself; its
+        remaining steps start with the unnamed list position.
+
+        :return: (tuple) Tuple of prefix steps and remaining steps tuples
+        :since:  v1.1.0
+        """
+
+        if self._prefix_steps is None:
+            prefix_steps = []
+
+            for node_path_length in range(len(self.steps), 0, -1):
+                node_name, node_position = self.steps[node_path_length - 1]
+
+                prefix_steps.append(
+                    (self.steps[:node_path_length], self.steps[node_path_length:])
+                )
+
+                if node_position >= 0:
+                    prefix_steps.append(
+                        (
+                            self.steps[: node_path_length - 1] + ((node_name, -1),),
+                            (("", node_position),) + self.steps[node_path_length:],
+                        )
+                    )
+
+            self._prefix_steps = tuple(prefix_steps)
+
+        return self._prefix_steps
+
+    @staticmethod
+    def compile(node_path):
+        """
+        Returns the compiled form of the given node path. Compiled paths are
+        shared through a bounded LRU cache.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :return: (object) JsonNodePath instance; None if invalid
+        :since:  v1.1.0
+        """
+
+        if isinstance(node_path, JsonNodePath):
+            _return = node_path
+        elif isinstance(node_path, str):
+            _return = _compile_node_path(node_path)
+        else:
+            _return = None
+
+        return _return
+
+    @staticmethod
+    def from_steps(steps):
+        """
+        Returns a compiled path for the given steps.
+
+        :param steps: Tuple of node name and list position tuples
+
+        :return: (object) JsonNodePath instance
+        :since:  v1.1.0
+        """
+
+        node_path = " ".join(
+            (
+                node_name
+                if (node_position < 0)
+                else "{0}#{1:d}".format(node_name, node_position)
+            )
+            for node_name, node_position in steps
+        )
+
+        return JsonNodePath(node_path, tuple(steps))
+
+    @staticmethod
+    def _get_pattern_step(node_name, node_position):
+        """
+        Returns the pattern step for the given step.
+
+        :param node_name: Node name with an optional list selection
+        :param node_position: List position (-1 if not given)
+
+        :return: (tuple) Node name and list position or selection
+        :since:  v1.1.0
+        """
+
+        re_result = (
+            JsonNodePath.RE_NODE_SELECTION.match(node_name)
+            if (node_position < 0)
+            else None
+        )
+
+        if re_result is None:
+            _return = (node_name, node_position)
+        elif re_result.group(2) == "*":
+            _return = (re_result.group(1), (None, None))
+        else:
+            _return = (
+                re_result.group(1),
+                tuple(
+                    (int(value) if (len(value) > 0) else None)
+                    for value in re_result.group(3, 4)
+                ),
+            )
+
+        return _return
+
+    @staticmethod
+    def _get_step(node_name):
+        """
+        Returns the step for the given node name.
+
+        :param node_name: Node name with an optional list position
+
+        :return: (tuple) Node name and list position (-1 if not given)
+        :since:  v1.1.0
+        """
+
+        re_result = JsonNodePath.RE_NODE_POSITION.match(node_name)
+
+        return (
+            (node_name, -1)
+            if (re_result is None)
+            else (re_result.group(1), int(re_result.group(2)))
+        )
+
+
+@lru_cache(maxsize=JsonNodePath.CACHE_SIZE)
+def _compile_node_path(node_path):
+    """
+    Compiles the given node path string.
+
+    :param node_path: Path to the node - delimiter is space
+
+    :return: (object) JsonNodePath instance
+    :since:  v1.1.0
+    """
+
+    return JsonNodePath(node_path)
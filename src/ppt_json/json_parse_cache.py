@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class JsonParseCache(object):
+    """
+    "JsonParseCache" keeps decoded JSON data by a key sampled from its input
+    in least recently used order. Cached input is compared with the given one
+    to confirm a hit. It is bounded by the number of entries and the total
+    length of the inputs cached.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    SAMPLE_SIZE = 64
+    """
+Number of characters or bytes sampled at the start, middle and end of the
+input
+    """
+
+    __slots__ = (
+        "_entries",
+        "_lock",
+        "_size",
+        "evictions",
+        "hits",
+        "max_entries",
+        "max_size",
+        "misses",
+    )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, max_entries, max_size):
+        """
+        Constructor __init__(JsonParseCache)
+
+        :param max_entries: Maximum number of cached entries
+        :param max_size: Maximum total length of the inputs cached
+
+        :since: v1.1.0
+        """
+
+        self._entries = OrderedDict()
+        """
+Decoded data and input by input key in least recently used order
+        """
+        self._lock = Lock()
+        """
+Lock guarding the entries and counters
+        """
+        self._size = 0
+        """
+Total length of the inputs cached
+        """
+        self.evictions = 0
+        """
+Number of entries removed to stay within the bounds
+        """
+        self.hits = 0
+        """
+Number of lookups finding cached data
+        """
+        self.max_entries = max_entries
+        """
+Maximum number of cached entries
+        """
+        self.max_size = max_size
+        """
+Maximum total length of the inputs cached
+        """
+        self.misses = 0
+        """
+Number of lookups without cached data
+        """
+
+    def __len__(self):
+        """
+        python.org: Called to implement the built-in function len().
+
+        :return: (int) Number of cached entries
+        :since:  v1.1.0
+        """
+
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """
+        Returns the total length of the inputs cached.
+
+        :return: (int) Length in characters or bytes
+        :since:  v1.1.0
+        """
+
+        return self._size
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters.
+
+        :since: v1.1.0
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+            self.evictions = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key, source):
+        """
+        Returns the data cached for the given input.
+
+        :param key: Input key
+        :param source: Input JSON data
+
+        :return: (mixed) Cached data; None if not cached
+        :since:  v1.1.0
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[1] != source:
+                self.misses += 1
+                _return = None
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                _return = entry[0]
+
+        return _return
+
+    def put(self, key, source, data):
+        """
+        Caches the given data for the given input. Least recently used entries
+        are removed to stay within the bounds.
+
+        :param key: Input key
+        :param source: Input JSON data
+        :param data: Decoded data
+
+        :since: v1.1.0
+        """
+
+        size = len(source)
+
+        if self.max_entries > 0 and size <= self.max_size:
+            with self._lock:
+                entry = self._entries.pop(key, None)
+
+                if entry is not None:
+                    self._size -= len(entry[1])
+
+                self._entries[key] = (data, source)
+                self._size += size
+
+                while (
+                    len(self._entries) > self.max_entries or self._size > self.max_size
+                ):
+                    _, (_, evicted_source) = self._entries.popitem(False)
+                    self._size -= len(evicted_source)
+                    self.evictions += 1
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        :return: (dict) Dict with "entries", "size", "hits", "misses",
+                 "evictions" and "hit_rate"
+        :since:  v1.1.0
+        """
+
+        lookups = self.hits + self.misses
+
+        return {
+            "entries": len(self._entries),
+            "size": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if (lookups > 0) else 0.0,
+        }
+
+    @staticmethod
+    def get_key(source):
+        """
+        Returns the key of the given JSON data. Long input is sampled at its
+        start, middle and end instead of being hashed completely.
+
+        :param source: Input JSON data
+
+        :return: (tuple) Input key
+        :since:  v1.1.0
+        """
+
+        size = len(source)
+        sample_size = JsonParseCache.SAMPLE_SIZE
+
+        if size <= 3 * sample_size:
+            _return = (size, source)
+        else:
+            middle = (size - sample_size) // 2
+
+            _return = (
+                size,
+                source[:sample_size],
+                source[middle : middle + sample_size],
+                source[-sample_size:],
+            )
+
+        return _return
@@ -0,0 +1,514 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from contextlib import contextmanager
+from copy import deepcopy
+from time import perf_counter
+import re
+
+try:
+    from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
+except ImportError:
+    from collections import Mapping, MutableMapping, MutableSequence, Sequence
+
+from .json_node_path import JsonNodePath
+
+
+class JsonPatchMixin(object):
+    """
+    "JsonPatchMixin" applies JSON Patch (RFC 6902) documents atomically and
+    records node changes as JSON Patch operations.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    RE_POINTER_INDEX = re.compile("^(?:0|[1-9]\\d*)$")
+    """
+RegExp to match a JSON Pointer reference token of a list position
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def apply_patch(self, operations):
+        """
+        Applies the given JSON Patch (RFC 6902) operations in the given order.
+        All changes are rolled back if any operation fails.
+
+        :param operations: List of JSON Patch operation dicts or its JSON
+                           representation
+
+        :return: (bool) False on error
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.apply_patch()- (#echo(__LINE__)#)"
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        _return = True
+
+        if isinstance(operations, str):
+            operations = self.backend.decode(self, operations)
+
+        patch_lengths = (
+            None
+            if (self._patch_recorders is None)
+            else [len(patch) for patch in self._patch_recorders]
+        )
+
+        undo_log = []
+
+        try:
+            if not isinstance(operations, Sequence):
+                raise ValueError("JSON Patch must be a list of operations")
+
+            for operation in operations:
+                self._apply_patch_operation(operation, undo_log)
+        except (IndexError, KeyError, TypeError, ValueError):
+            _return = False
+            self._rollback_patch(undo_log)
+
+            if patch_lengths is not None:
+                for patch, patch_length in zip(self._patch_recorders, patch_lengths):
+                    del patch[patch_length:]
+
+        if started is not None:
+            self._stats.record("apply_patch", started)
+
+        return _return
+
+    def _apply_patch_operation(self, operation, undo_log):
+        """
+        Applies the given JSON Patch operation and appends the records needed
+        to undo it to the given undo log.
+
+        :param operation: JSON Patch operation dict
+        :param undo_log: List of undo records
+
+        :since: v1.1.0
+        """
+
+        if not isinstance(operation, Mapping):
+            raise ValueError("JSON Patch operation must be an object")
+
+        operation_type = operation["op"]
+        pointer = operation["path"]
+
+        if operation_type in ("add", "replace", "test") and "value" not in operation:
+            raise ValueError(
+                "JSON Patch operation '{0}' requires a value".format(operation_type)
+            )
+
+        if operation_type in ("copy", "move"):
+            from_pointer = operation["from"]
+
+            if operation_type == "move" and pointer.startswith(from_pointer + "/"):
+                raise ValueError(
+                    "JSON Pointer '{0}' can not be moved into itself".format(
+                        from_pointer
+                    )
+                )
+
+            data = self._get_pointer_value(from_pointer)
+
+            if operation_type == "copy":
+                data = deepcopy(data)
+            elif pointer == from_pointer:
+                return
+            else:
+                self._remove_pointer_node(from_pointer, undo_log)
+
+            self._add_pointer_node(pointer, data, undo_log)
+        elif operation_type == "add":
+            self._add_pointer_node(pointer, operation["value"], undo_log)
+        elif operation_type == "remove":
+            self._remove_pointer_node(pointer, undo_log)
+        elif operation_type == "replace":
+            self._add_pointer_node(pointer, operation["value"], undo_log, True)
+        elif operation_type == "test":
+            if self._get_pointer_value(pointer) != operation["value"]:
+                raise ValueError("JSON Patch test failed for '{0}'".format(pointer))
+        else:
+            raise ValueError(
+                "JSON Patch operation '{0}' is not supported".format(operation_type)
+            )
+
+    def _add_pointer_node(self, pointer, data, undo_log, is_replaced=False):
+        """
+        Adds or replaces the node referenced by the given JSON Pointer. New
+        list entries are inserted before the referenced position.
+
+        :param pointer: JSON Pointer
+        :param data: Data for the node
+        :param undo_log: List of undo records
+        :param is_replaced: True to require an existing node to be replaced
+
+        :since: v1.1.0
+        """
+
+        if pointer == "":
+            undo_log.append(("root", None, None, self._data))
+
+            if self._patch_recorders is not None:
+                self._record_patch_operation("replace", (), data)
+
+            self._data = data
+            self._node_cache.clear()
+            self._reset_fragment_cache()
+            self._node_index = None
+        else:
+            node_path, node_ptr, node_key = self._get_pointer_node(
+                pointer, not is_replaced
+            )
+
+            if isinstance(node_ptr, MutableMapping):
+                if node_key in node_ptr:
+                    undo_log.append(("set", node_ptr, node_key, node_ptr[node_key]))
+                elif is_replaced:
+                    raise ValueError("JSON Pointer '{0}' not found".format(pointer))
+                else:
+                    undo_log.append(("delete", node_ptr, node_key, None))
+
+                self._change_node_ptr(node_ptr, node_path, data, True)
+            elif is_replaced:
+                if node_key >= len(node_ptr):
+                    raise ValueError("JSON Pointer '{0}' not found".format(pointer))
+
+                undo_log.append(("set", node_ptr, node_key, node_ptr[node_key]))
+                self._change_node_ptr(node_ptr, node_path, data, False)
+            else:
+                if node_key > len(node_ptr):
+                    raise ValueError("JSON Pointer '{0}' not found".format(pointer))
+
+                self._insert_node_ptr(node_path, node_ptr, node_key, data)
+                undo_log.append(("delete", node_ptr, node_key, None))
+
+    def _get_node_pointer(self, node_path_steps):
+        """
+        Returns the JSON Pointer of the node of the given path. All structs
+        containing the node must already be decoded.
+
+        :param node_path_steps: Tuple of node name and list position tuples
+
+        :return: (str) JSON Pointer
+        :since:  v1.1.0
+        """
+
+        tokens = []
+        node_ptr = self._data
+        node_path_steps_count = len(node_path_steps)
+
+        for index, (node_name, node_position) in enumerate(node_path_steps, 1):
+            if isinstance(node_ptr, Mapping) and (
+                node_position < 0 or node_name in node_ptr
+            ):
+                tokens.append(node_name)
+                node_ptr = node_ptr.get(node_name)
+
+            """
+List positions out of range are ignored while walking to the parent node.
+            """
+
+            if isinstance(node_ptr, list) and 0 <= node_position < len(node_ptr):
+                tokens.append(str(node_position))
+                node_ptr = node_ptr[node_position]
+            elif node_position >= 0 and index == node_path_steps_count:
+                tokens.append(str(node_position))
+
+        return "".join(
+            "/" + str(token).replace("~", "~0").replace("/", "~1") for token in tokens
+        )
+
+    def _get_pointer_node(self, pointer, is_appendable=False):
+        """
+        Resolves the given JSON Pointer to the path of the referenced node and
+        the mutable struct containing it. The referenced node itself may not
+        exist.
+
+        :param pointer: JSON Pointer
+        :param is_appendable: True to accept "-" referencing the position after
+                              the last list entry
+
+        :return: (tuple) Compiled path to the node, mutable struct and key or
+                 list position
+        :since:  v1.1.0
+        """
+
+        if not (isinstance(pointer, str) and pointer.startswith("/")):
+            raise ValueError("Invalid JSON Pointer '{0}'".format(pointer))
+
+        tokens = [
+            token.replace("~1", "/").replace("~0", "~")
+            for token in pointer[1:].split("/")
+        ]
+
+        tokens_count = len(tokens)
+        node_path_steps = []
+        node_ptr = self._data
+
+        for index, token in enumerate(tokens, 1):
+            if isinstance(node_ptr, MutableMapping):
+                node_key = token
+                node_step = (token, -1)
+                node_path_steps.append(node_step)
+            elif isinstance(node_ptr, MutableSequence):
+                if token == "-" and is_appendable and index == tokens_count:
+                    node_key = len(node_ptr)
+                elif JsonPatchMixin.RE_POINTER_INDEX.match(token) is None:
+                    raise ValueError("Invalid JSON Pointer '{0}'".format(pointer))
+                else:
+                    node_key = int(token)
+
+                node_step = ("", node_key)
+
+                if len(node_path_steps) > 0 and node_path_steps[-1][1] < 0:
+                    node_path_steps[-1] = (node_path_steps[-1][0], node_key)
+                else:
+                    """
+Node paths can not address lists nested in lists. Cached node pointers
+below them are discarded as they would not be invalidated otherwise.
+                    """
+
+                    if len(node_path_steps) > 0:
+                        self._node_cache.clear()
+
+                    node_path_steps.append(node_step)
+            else:
+                raise ValueError("JSON Pointer '{0}' not found".format(pointer))
+
+            if index < tokens_count:
+                node_ptr = self._walk_node_ptr(node_ptr, (node_step,))
+
+        return (JsonNodePath.from_steps(node_path_steps), node_ptr, node_key)
+
+    def _get_pointer_value(self, pointer):
+        """
+        Returns the node referenced by the given JSON Pointer.
+
+        :param pointer: JSON Pointer
+
+        :return: (mixed) JSON data
+        :since:  v1.1.0
+        """
+
+        if pointer == "":
+            node_ptr = self._data
+        else:
+            _, node_ptr, node_key = self._get_pointer_node(pointer)
+
+            if (
+                node_key not in node_ptr
+                if isinstance(node_ptr, Mapping)
+                else node_key >= len(node_ptr)
+            ):
+                raise ValueError("JSON Pointer '{0}' not found".format(pointer))
+
+            node_ptr = self._walk_node_ptr(
+                node_ptr,
+                (
+                    ((node_key, -1),)
+                    if isinstance(node_ptr, Mapping)
+                    else (("", node_key),)
+                ),
+            )
+
+        if self._lazy_source is not None:
+            self._materialize_lazy_values(node_ptr)
+
+        return node_ptr
+
+    def _insert_node_ptr(self, node_path, node_ptr, node_key, data):
+        """
+        Inserts the given data at the given list position and updates cached
+        and indexed node pointers.
+
+        :param node_path: Compiled path to the node
+        :param node_ptr: List to insert the node into
+        :param node_key: List position of the new node
+        :param data: Data for the new node
+
+        :since: v1.1.0
+        """
+
+        if self._node_index is not None:
+            self._remove_indexed_nodes(node_path, node_ptr, node_key, True)
+
+        if self._fragment_cache is not None:
+            self._mark_fragments_dirty(node_path.steps, True)
+
+        if self._patch_recorders is not None:
+            self._record_patch_operation("add", node_path.steps, data)
+
+        node_ptr.insert(node_key, data)
+
+        if self._node_index is not None:
+            self._add_indexed_nodes(node_path, node_ptr, node_key, True)
+
+        if len(self._node_cache) > 0:
+            self._remove_cached_nodes(node_path.steps, True)
+
+    @contextmanager
+    def record_patch(self):
+        """
+        Records all changes made through "add_node()", "change_node()",
+        "remove_node()" and their batch and patch variants as JSON Patch
+        (RFC 6902) operations while the context is active. Recordings may be
+        nested.
+
+        :return: (object) Context manager yielding the list of recorded JSON
+                 Patch operations
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.record_patch()- (#echo(__LINE__)#)"
+            )
+
+        patch = []
+
+        if self._patch_recorders is None:
+            self._patch_recorders = []
+
+        self._patch_recorders.append(patch)
+
+        try:
+            yield patch
+        finally:
+            """
+Recordings may end in any order and their lists may be equal.
+            """
+
+            self._patch_recorders = [
+                patch_recorder
+                for patch_recorder in self._patch_recorders
+                if patch_recorder is not patch
+            ]
+
+            if len(self._patch_recorders) < 1:
+                self._patch_recorders = None
+
+    def _record_patch_operation(
+        self, operation_type, node_path_steps, data=None, node_pointer=None
+    ):
+        """
+        Appends a JSON Patch operation for the node of the given path to all
+        active recordings. It must be called before the node is changed.
+
+        :param operation_type: JSON Patch operation type
+        :param node_path_steps: Tuple of node name and list position tuples
+        :param data: Data for the node
+        :param node_pointer: JSON Pointer of the node if already resolved
+
+        :since: v1.1.0
+        """
+
+        operation = {
+            "op": operation_type,
+            "path": (
+                self._get_node_pointer(node_path_steps)
+                if (node_pointer is None)
+                else node_pointer
+            ),
+        }
+
+        if operation_type != "remove":
+            operation["value"] = deepcopy(data)
+
+        for patch in self._patch_recorders:
+            patch.append(operation)
+
+    def _remove_pointer_node(self, pointer, undo_log):
+        """
+        Removes the node referenced by the given JSON Pointer.
+
+        :param pointer: JSON Pointer
+        :param undo_log: List of undo records
+
+        :since: v1.1.0
+        """
+
+        if pointer == "":
+            raise ValueError("The JSON document root can not be removed")
+
+        node_path, node_ptr, node_key = self._get_pointer_node(pointer)
+
+        if isinstance(node_ptr, MutableMapping):
+            if node_key not in node_ptr:
+                raise ValueError("JSON Pointer '{0}' not found".format(pointer))
+
+            undo_log.append(
+                (
+                    "restore",
+                    node_ptr,
+                    node_key,
+                    (node_ptr[node_key], list(node_ptr).index(node_key)),
+                )
+            )
+        elif node_key >= len(node_ptr):
+            raise ValueError("JSON Pointer '{0}' not found".format(pointer))
+        else:
+            undo_log.append(("insert", node_ptr, node_key, node_ptr[node_key]))
+
+        self._remove_node_ptr(node_path, node_ptr, node_key)
+
+    def _rollback_patch(self, undo_log):
+        """
+        Reverts all changes of the given undo log in reverse order. Cached
+        node pointers, encoded fragments and the index are discarded.
+
+        :param undo_log: List of undo records
+
+        :since: v1.1.0
+        """
+
+        for undo_type, node_ptr, node_key, data in reversed(undo_log):
+            if undo_type == "delete":
+                del node_ptr[node_key]
+            elif undo_type == "insert":
+                node_ptr.insert(node_key, data)
+            elif undo_type == "restore":
+                data, position = data
+
+                if position < len(node_ptr):
+                    items = list(node_ptr.items())
+                    items.insert(position, (node_key, data))
+
+                    node_ptr.clear()
+                    node_ptr.update(items)
+                else:
+                    node_ptr[node_key] = data
+            elif undo_type == "root":
+                self._data = data
+            else:
+                node_ptr[node_key] = data
+
+        if len(undo_log) > 0:
+            self._node_cache.clear()
+            self._reset_fragment_cache()
+            self._node_index = None
@@ -14,9 +14,14 @@ obtain one at http://mozilla.org/MPL/2.0/.
 
 # pylint: disable=invalid-name,undefined-variable
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from copy import copy
+from itertools import repeat
+from time import perf_counter
 from weakref import proxy, ProxyTypes
-import json
+import mmap
+import os
 import re
 
 try:
@@ -30,8 +35,32 @@ try:
 except ImportError:
     from collections import Iterable, Mapping, MutableMapping, MutableSequence, Sequence
 
-
-class JsonResource(object):
+from .json_backends import (
+    InternalJsonBackend,
+    MsgspecJsonBackend,
+    NativeJsonBackend,
+    OrjsonJsonBackend,
+    UjsonJsonBackend,
+)
+from .json_column import JsonColumnMixin
+from .json_incremental_export import JsonIncrementalExportMixin
+from .json_lazy_source import JsonLazySource, JsonLazyValue
+from .json_node_index import JsonNodeIndexMixin
+from .json_node_path import JsonNodePath
+from .json_parse_cache import JsonParseCache
+from .json_patch import JsonPatchMixin
+from .json_snapshot import JsonSnapshotMixin
+from .json_stats import JsonStats
+from .json_views import get_json_view
+
+
+class JsonResource(
+    JsonColumnMixin,
+    JsonIncrementalExportMixin,
+    JsonNodeIndexMixin,
+    JsonPatchMixin,
+    JsonSnapshotMixin,
+):
     """
     This class provides a bridge between Python and JSON to read JSON on the
     fly.
@@ -44,6 +73,11 @@ class JsonResource(object):
                  Mozilla Public License, v. 2.0
     """
 
+    IMPLEMENTATION_AUTO = -1
+    """
+Use the fastest registered backend supporting the instance configuration for
+decoding and the native one for encoding
+    """
     IMPLEMENTATION_INTERNAL = 1
     """
 Use internal parser for JSON operations
@@ -52,23 +86,175 @@ Use internal parser for JSON operations
     """
 Use native Python functions for JSON operations
     """
+    IMPLEMENTATION_MSGSPEC = 3
+    """
+Use "msgspec" for decoding JSON data
+    """
+    IMPLEMENTATION_ORJSON = 4
+    """
+Use "orjson" for decoding JSON data
+    """
+    IMPLEMENTATION_UJSON = 5
+    """
+Use "ujson" for decoding JSON data
+    """
+
+    INTERNING_NONE = 0
+    """
+Create a new string instance for each decoded string
+    """
+    INTERNING_KEYS = 1
+    """
+Share one string instance for equal object keys of a parsed document
+    """
+    INTERNING_STRINGS = 2
+    """
+Share one string instance for equal object keys and short string values of a
+parsed document
+    """
+    INTERNING_STRING_LENGTH = 32
+    """
+Maximum length of string values shared with "INTERNING_STRINGS"
+    """
 
     RE_ESCAPED = re.compile("(\\\\+)$")
     """
 RegExp to find escape characters
     """
-    RE_NODE_POSITION = re.compile("^(.+)#(\\d+)$")
+    RE_JSON_ESCAPE_CHARS = re.compile('[\\x00-\\x1f"\\\\]')
+    """
+RegExp to find characters to be escaped in JSON strings
+    """
+    RE_NODE_POSITION = JsonNodePath.RE_NODE_POSITION
     """
 RegExp to find node names with a specified position in a list
     """
+    RE_NUMBER = re.compile("(-?(?:0|[1-9]\\d*))(\\.\\d+)?([eE][-+]?\\d+)?")
+    """
+RegExp to match a JSON number
+    """
+    RE_SINGLE_QUOTED_STRING_CHUNK = re.compile("([^'\\\\]*)(['\\\\])")
+    """
+RegExp to match the content of a single quoted string up to the next
+terminating or escape character
+    """
+    RE_STRING_CHUNK = re.compile('([^"\\\\]*)(["\\\\])')
+    """
+RegExp to match the content of a string up to the next terminating or escape
+character
+    """
+    RE_UNICODE_ESCAPE = re.compile("[0-9A-Fa-f]{4}")
+    """
+RegExp to match the four hexadecimal digits of a unicode escape sequence
+    """
+    RE_WHITESPACE = re.compile("[ \\t\\n\\r]*")
+    """
+RegExp to match insignificant whitespace
+    """
+
+    JSON_ESCAPE_TABLE = {
+        **{code: "\\u{0:04x}".format(code) for code in range(32)},
+        ord('"'): '\\"',
+        ord("\\"): "\\\\",
+        ord("\x08"): "\\b",
+        ord("\f"): "\\f",
+        ord("\n"): "\\n",
+        ord("\r"): "\\r",
+        ord("\t"): "\\t",
+    }
+    """
+Translation table for characters to be escaped in JSON strings
+    """
+
+    ESCAPE_SEQUENCES = {
+        '"': '"',
+        "'": "'",
+        "/": "/",
+        "\\": "\\",
+        "b": "\x08",
+        "f": "\f",
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+    }
+    """
+Characters represented by single character escape sequences
+    """
+    STRING_TAG_CHARS = "\"'"
+    """
+Characters accepted as string delimiters
+    """
+    WHITESPACE_CHARS = " \t\n\r"
+    """
+Characters treated as insignificant whitespace
+    """
+
+    EXPORT_CHUNK_SIZE = 65536
+    """
+Default size of chunks written by "export_to()"
+    """
+    EXPORT_PARTS_COUNT = 512
+    """
+Number of encoded parts joined into one fragment yielded by "iter_json()"
+    """
+    FILE_CHUNK_SIZE = 1048576
+    """
+Size of chunks read from JSON files parsed with the internal parser
+    """
+    PARALLEL_CHUNKS_PER_PROCESS = 4
+    """
+Number of list element ranges per worker process decoded by
+"parse_parallel()"
+    """
+    PARALLEL_SIZE_MIN = 1048576
+    """
+Minimum length of JSON data decoded in worker processes by "parse_parallel()"
+    """
+    NODE_CACHE_SIZE = 16
+    """
+Default number of cached node pointers
+    """
+    PARSE_CACHE_ENTRIES = 128
+    """
+Default maximum number of entries of the "json_to_data_view()" parse cache
+    """
+    PARSE_CACHE_SIZE = 67108864
+    """
+Default maximum total input length of the "json_to_data_view()" parse cache
+    """
+
+    _STRUCT_END = object()
+    """
+Sentinel marking the end of a struct iterator
+    """
+
+    _backends = {}
+    """
+Registered JSON backends by implementation identifier
+    """
+    _parse_cache = None
+    """
+Parse cache used by "json_to_data_view()"; None if disabled
+    """
 
     __slots__ = (
         "__weakref__",
         "_data",
-        "data_cache_node",
-        "data_cache_ptr",
+        "_fragment_cache",
         "_implementation",
+        "_intern_table",
+        "_interning",
+        "_is_auto_implementation",
+        "_lazy_source",
         "_log_handler",
+        "_node_cache",
+        "_node_cache_hits",
+        "_node_cache_misses",
+        "_node_cache_size",
+        "_node_index",
+        "_patch_recorders",
+        "_stats",
+        "skipkeys",
         "struct_type",
     )
     """
@@ -76,12 +262,14 @@ python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
 
-    def __init__(self, struct_type=dict, log_handler=None):
+    def __init__(self, struct_type=dict, log_handler=None, skipkeys=True):
         """
         Constructor __init__(JsonResource)
 
         :param struct_type: Dict implementation for new struct elements
         :param log_handler: Log handler to use
+        :param skipkeys: False to raise a "TypeError" for object keys that can
+                         not be encoded instead of skipping them
 
         :since: v1.0.0
         """
@@ -90,22 +278,67 @@ the automatic creation of __dict__ and __weakref__ for each instance.
         """
 JSON data
         """
-        self.data_cache_node = ""
-        """
-Path of the cached node pointer
+        self._fragment_cache = None
         """
-        self.data_cache_ptr = ""
-        """
-Reference of the cached node pointer (string if unset)
+Fragment node of the encoded JSON data; None if incremental export is
+disabled
         """
         self._implementation = 0
         """
 Implementation identifier
+        """
+        self._intern_table = None
+        """
+Shared string instances of the document being parsed; None if not interning
+        """
+        self._interning = JsonResource.INTERNING_NONE
+        """
+String interning mode of the document being parsed
+        """
+        self._is_auto_implementation = False
+        """
+True if the implementation has been selected by "IMPLEMENTATION_AUTO"
+        """
+        self._lazy_source = None
+        """
+JSON data source of structs not yet decoded in lazy mode
         """
         self._log_handler = None
         """
 The log handler is called whenever debug messages should be logged or errors
 happened.
+        """
+        self._node_cache = OrderedDict()
+        """
+Cached node pointers by node path steps in least recently used order
+        """
+        self._node_cache_hits = 0
+        """
+Number of node lookups started at a cached node pointer
+        """
+        self._node_cache_misses = 0
+        """
+Number of node lookups without a matching cached node pointer
+        """
+        self._node_cache_size = JsonResource.NODE_CACHE_SIZE
+        """
+Maximum number of cached node pointers
+        """
+        self._node_index = None
+        """
+Node pointers by node path steps of all indexed nodes; None if not built
+        """
+        self._patch_recorders = None
+        """
+Lists of JSON Patch operations currently recorded; None if not recording
+        """
+        self._stats = None
+        """
+Instrumentation data; None if disabled
+        """
+        self.skipkeys = skipkeys
+        """
+True to skip object keys that can not be encoded
         """
         self.struct_type = struct_type
         """
@@ -126,6 +359,9 @@ Dict implementation used to create new struct elements
         :since:  v1.0.0
         """
 
+        if self._lazy_source is not None:
+            self._materialize_lazy_values(self._data)
+
         return self._data.copy() if hasattr(self._data, "copy") else copy(self._data)
 
     @data.setter
@@ -140,6 +376,117 @@ Dict implementation used to create new struct elements
 
         self.set_json(data_dict, True)
 
+    @property
+    def data_view(self):
+        """
+        Returns a read-only view of the Python representation data without
+        copying it. Nested structs are returned as views created on access.
+
+        :return: (mixed) Read-only view; None if not parsed
+        :since:  v1.1.0
+        """
+
+        return get_json_view(self, self._data)
+
+    @property
+    def data_cache_node(self):
+        """
+        Returns the path of the most recently used cached node pointer.
+
+        :return: (str) Node path; empty if no node pointer is cached
+        :since:  v1.0.0
+        """
+
+        node_cache = self._node_cache
+
+        return (
+            JsonNodePath.from_steps(next(reversed(node_cache))).path
+            if (len(node_cache) > 0)
+            else ""
+        )
+
+    @data_cache_node.setter
+    def data_cache_node(self, node_path):
+        """
+        Sets the cache pointer to a specific node. All cached node pointers
+        are removed for an empty node path.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :since: v1.0.0
+        """
+
+        if node_path:
+            self.set_cached_node(node_path)
+        else:
+            self._node_cache.clear()
+
+    @property
+    def data_cache_ptr(self):
+        """
+        Returns the most recently used cached node pointer.
+
+        :return: (mixed) JSON tree element; Python representation data if no
+                 node pointer is cached
+        :since:  v1.0.0
+        """
+
+        node_cache = self._node_cache
+
+        return (
+            node_cache[next(reversed(node_cache))]
+            if (len(node_cache) > 0)
+            else self._data
+        )
+
+    @data_cache_ptr.setter
+    def data_cache_ptr(self, node_ptr):
+        """
+        Replaces the most recently used cached node pointer. Nothing is changed
+        if no node pointer is cached.
+
+        :param node_ptr: JSON tree element of the node set with
+                         "data_cache_node"
+
+        :since: v1.0.0
+        """
+
+        node_cache = self._node_cache
+
+        if len(node_cache) > 0:
+            node_cache[next(reversed(node_cache))] = node_ptr
+
+    @property
+    def backend(self):
+        """
+        Returns the JSON backend of the implementation in use.
+
+        :return: (object) JsonBackend instance
+        :since:  v1.1.0
+        """
+
+        return JsonResource._backends.get(
+            self._implementation,
+            JsonResource._backends[JsonResource.IMPLEMENTATION_INTERNAL],
+        )
+
+    @property
+    def _encoding_backend(self):
+        """
+        Returns the JSON backend used for encoding. Output is encoded with the
+        native backend if the implementation has been selected by
+        "IMPLEMENTATION_AUTO" to keep it independent of installed backends.
+
+        :return: (object) JsonBackend instance
+        :since:  v1.1.0
+        """
+
+        return (
+            JsonResource._backends[JsonResource.IMPLEMENTATION_NATIVE]
+            if (self._is_auto_implementation)
+            else self.backend
+        )
+
     @property
     def implementation(self):
         """
@@ -154,7 +501,14 @@ Dict implementation used to create new struct elements
     @implementation.setter
     def implementation(self, implementation):
         """
-        Set the parser implementation to use.
+        Set the parser implementation to use. "IMPLEMENTATION_AUTO" selects the
+        fastest registered backend supporting the configured "struct_type" and
+        "skipkeys" settings for decoding and encodes output with the native
+        one. Bundled backends other than the internal one encode output like
+        "json.dumps()". Bundled backends decode input they can not decode
+        like "json.loads()", e.g. integers exceeding 64 bits or "NaN", with the
+        native one instead. Unsupported implementations fall back to the
+        internal one.
 
         :param implementation: Implementation identifier
 
@@ -166,12 +520,29 @@ Dict implementation used to create new struct elements
                 "#echo(__FILEPATH__)# -json.implementation()- (#echo(__LINE__)#)"
             )
 
-        if self.struct_type != dict:
-            self._implementation = JsonResource.IMPLEMENTATION_INTERNAL
-        elif implementation is None:
-            self._implementation = JsonResource.IMPLEMENTATION_NATIVE
-        else:
-            self._implementation = implementation
+        self._is_auto_implementation = (
+            implementation == JsonResource.IMPLEMENTATION_AUTO
+        )
+
+        if implementation is None:
+            implementation = JsonResource.IMPLEMENTATION_NATIVE
+        elif implementation == JsonResource.IMPLEMENTATION_AUTO:
+            implementation = max(
+                (
+                    (backend.PRIORITY, backend_implementation)
+                    for backend_implementation, backend in JsonResource._backends.items()
+                    if backend.is_supported(self)
+                ),
+                default=(0, JsonResource.IMPLEMENTATION_INTERNAL),
+            )[1]
+
+        backend = JsonResource._backends.get(implementation)
+
+        self._implementation = (
+            implementation
+            if (backend is not None and backend.is_supported(self))
+            else JsonResource.IMPLEMENTATION_INTERNAL
+        )
 
     @property
     def json(self):
@@ -209,6 +580,56 @@ Dict implementation used to create new struct elements
             log_handler if isinstance(log_handler, ProxyTypes) else proxy(log_handler)
         )
 
+    @property
+    def node_cache_hits(self):
+        """
+        Returns the number of node lookups started at a cached node pointer.
+
+        :return: (int) Number of cache hits
+        :since:  v1.1.0
+        """
+
+        return self._node_cache_hits
+
+    @property
+    def node_cache_misses(self):
+        """
+        Returns the number of node lookups without a matching cached node
+        pointer.
+
+        :return: (int) Number of cache misses
+        :since:  v1.1.0
+        """
+
+        return self._node_cache_misses
+
+    @property
+    def node_cache_size(self):
+        """
+        Returns the maximum number of cached node pointers.
+
+        :return: (int) Number of cache entries
+        :since:  v1.1.0
+        """
+
+        return self._node_cache_size
+
+    @node_cache_size.setter
+    def node_cache_size(self, size):
+        """
+        Sets the maximum number of cached node pointers. Least recently used
+        entries are removed if the cache exceeds the new size.
+
+        :param size: Number of cache entries
+
+        :since: v1.1.0
+        """
+
+        self._node_cache_size = max(0, size)
+
+        while len(self._node_cache) > self._node_cache_size:
+            self._node_cache.popitem(False)
+
     def add_node(self, node_path, data):
         """
         Adds a node with content. Recursion is not supported because both arrays
@@ -227,10 +648,23 @@ Dict implementation used to create new struct elements
                 node_path,
             )
 
+        started = None if (self._stats is None) else perf_counter()
+
+        _return = False
+
         if self._data is None:
             self._data = self.struct_type()
 
-        return self.change_node(node_path, data, True)
+        node_path = JsonResource.compile_node_path(node_path)
+
+        if node_path is not None and len(node_path) > 0:
+            node_ptr = self._get_node_ptr(node_path.parent)
+            _return = self._change_node_ptr(node_ptr, node_path, data, True)
+
+        if started is not None:
+            self._stats.record("add_node", started)
+
+        return _return
 
     def change_node(self, node_path, data, add_recursively=False):
         """
@@ -250,78 +684,146 @@ Dict implementation used to create new struct elements
                 node_path,
             )
 
+        started = None if (self._stats is None) else perf_counter()
+
         _return = False
 
-        if isinstance(node_path, str):
+        node_path = JsonResource.compile_node_path(node_path)
+
+        if node_path is not None and len(node_path) > 0:
             """
 Get the parent node of the target.
             """
 
-            node_path_list = node_path.split(" ")
+            node_ptr = self._get_node_ptr(node_path.parent)
 
-            node_path_count = len(node_path_list)
-            node_name = node_path if (node_path_count < 2) else None
+            _return = self._change_node_ptr(node_ptr, node_path, data, add_recursively)
 
-            if node_path_count > 1 or JsonResource.RE_NODE_POSITION.match(node_path):
-                if node_path_count > 1:
-                    node_name = node_path_list.pop()
-                    node_path = " ".join(node_path_list)
+        if started is not None:
+            self._stats.record("change_node", started)
 
-                    node_ptr = self._get_node_ptr(node_path)
-                else:
-                    node_path = ""
+        return _return
 
-                    node_ptr = self._get_node_ptr(
-                        JsonResource.RE_NODE_POSITION.match(node_name).group(1)
-                    )
-            else:
-                node_path = ""
-                node_ptr = self._data
+    def _change_node_ptr(self, node_ptr, node_path, data, add_recursively):
+        """
+        Changes the content of the node of the given path below its already
+        resolved parent node.
 
-            """
-Change the node
-            """
+        :param node_ptr: Parent JSON tree element of the node
+        :param node_path: Compiled path to the node
+        :param data: Data for the new node
+        :param add_recursively: True to create undefined nodes
 
-            re_result = JsonResource.RE_NODE_POSITION.match(node_name)
+        :return: (bool) False on error
+        :since:  v1.1.0
+        """
 
-            if re_result is None:
-                node_position = -1
-            else:
-                node_name = re_result.group(1)
-                node_position = int(re_result.group(2))
+        _return = False
 
-            if isinstance(node_ptr, MutableMapping) and (
-                node_name in node_ptr or add_recursively
-            ):
-                node_ptr[node_name] = data
-                _return = True
+        node_name, node_position = node_path.steps[-1]
 
-                if self.data_cache_node != "":
-                    node_path_changed = (
-                        "{0} {1}".format(node_path, node_name)
-                        if len(node_path) > 0
-                        else node_name
-                    )
+        node_ptr, node_key = self._get_node_container_ptr(
+            node_ptr, node_name, node_position
+        )
 
-                    if self.data_cache_node == node_path_changed:
-                        self.data_cache_ptr = node_ptr[node_name]
-            elif isinstance(node_ptr, MutableSequence) and 0 <= node_position < len(
-                node_ptr
-            ):
-                node_ptr[node_position] = data
-                _return = True
+        if node_ptr is not None and (
+            node_position >= 0 or node_key in node_ptr or add_recursively
+        ):
+            if self._node_index is not None:
+                self._remove_indexed_nodes(node_path, node_ptr, node_key)
+
+            if self._fragment_cache is not None:
+                self._mark_fragments_dirty(node_path.steps)
+
+            if self._patch_recorders is not None:
+                self._record_patch_operation(
+                    (
+                        "replace"
+                        if (node_position >= 0 or node_key in node_ptr)
+                        else "add"
+                    ),
+                    node_path.steps,
+                    data,
+                )
 
-                if self.data_cache_node != "":
-                    node_path_changed = (
-                        "{0} {1}".format(node_path, node_name)
-                        if len(node_path) > 0
-                        else node_name
-                    )
+            node_ptr[node_key] = data
+            _return = True
+
+            if self._node_index is not None:
+                self._add_indexed_nodes(node_path, node_ptr, node_key)
+
+            if len(self._node_cache) > 0:
+                is_cached = node_path.steps in self._node_cache
+                self._remove_cached_nodes(node_path.steps)
+
+                if is_cached:
+                    self._node_cache[node_path.steps] = data
+
+        return _return
+
+    def change_nodes(self, node_paths_data, add_recursively=False):
+        """
+        Change the content of all specified nodes. Parent nodes sharing a path
+        prefix are resolved only once.
+
+        :param node_paths_data: Mapping of node paths to the data for the new
+                                nodes
+        :param add_recursively: True to create undefined nodes
+
+        :return: (bool) False if at least one node could not be changed
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.change_nodes()- (#echo(__LINE__)#)"
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        _return = True
+
+        node_paths = [
+            JsonResource.compile_node_path(node_path) for node_path in node_paths_data
+        ]
+
+        node_ptrs = self._get_node_ptrs(
+            [
+                (
+                    node_path.parent
+                    if (node_path is not None and len(node_path) > 0)
+                    else None
+                )
+                for node_path in node_paths
+            ]
+        )
+
+        changed_node_paths_steps = set()
 
-                    node_path_changed += "#{0:d}".format(node_position)
+        for node_path, node_ptr, data in zip(
+            node_paths, node_ptrs, node_paths_data.values()
+        ):
+            if node_path is None or len(node_path) < 1:
+                _return = False
+                continue
+
+            """
+Parent nodes below a node changed previously in this call are resolved again.
+            """
+
+            if len(changed_node_paths_steps) > 0 and any(
+                node_prefix_steps in changed_node_paths_steps
+                for node_prefix_steps, _ in node_path.parent.prefix_steps
+            ):
+                node_ptr = self._get_node_ptr(node_path.parent)
+
+            if self._change_node_ptr(node_ptr, node_path, data, add_recursively):
+                changed_node_paths_steps.add(node_path.steps)
+            else:
+                _return = False
 
-                    if self.data_cache_node == node_path_changed:
-                        self.data_cache_ptr = node_ptr[node_position]
+        if started is not None:
+            self._stats.record("change_nodes", started)
 
         return _return
 
@@ -341,25 +843,34 @@ Change the node
                 node_path,
             )
 
+        started = None if (self._stats is None) else perf_counter()
+
         _return = 0
 
-        if isinstance(node_path, str):
+        node_path = JsonResource.compile_node_path(node_path)
+
+        if node_path is not None:
             """
 Get the parent node of the target.
             """
 
-            node_ptr = self._get_node_ptr(node_path) if " " in node_path else self._data
+            node_ptr = (
+                self._get_node_ptr(node_path) if (len(node_path) > 1) else self._data
+            )
 
             if node_ptr is not None:
                 _return = (
                     len(node_ptr) if isinstance(node_ptr, (Mapping, Sequence)) else 1
                 )
 
+        if started is not None:
+            self._stats.record("count_node", started)
+
         return _return
 
     def data_to_json(self, data):
         """
-        Builds recursively a valid JSON ouput reflecting the given data.
+        Builds a valid JSON ouput reflecting the given data.
 
         :param data: Python data
 
@@ -372,52 +883,26 @@ Get the parent node of the target.
                 "#echo(__FILEPATH__)# -json.data_to_json()- (#echo(__LINE__)#)"
             )
 
-        _return = ""
+        return self._encoding_backend.encode(self, data)
 
-        if self.implementation == JsonResource.IMPLEMENTATION_NATIVE:
-            _return = json.dumps(
-                data, default=self._get_native_serializable_data, skipkeys=True
-            )
-        else:
-            if isinstance(data, bool):
-                _return = "true" if (data) else "false"
-            elif isinstance(data, Mapping):
-                _return = ""
-
-                if len(data) > 0:
-                    for key in data:
-                        if _return != "":
-                            _return += ","
-
-                        _return += "{0}:{1}".format(
-                            self.data_to_json(str(key)), self.data_to_json(data[key])
-                        )
+    def disable_stats(self):
+        """
+        Disables the instrumentation and discards all data collected.
 
-                _return = "{{{0}}}".format(_return)
-            elif isinstance(data, Iterable):
-                _return = ""
-
-                for value in data:
-                    if _return != "":
-                        _return += ","
-                    _return += self.data_to_json(value)
-
-                _return = "[{0}]".format(_return)
-            elif isinstance(data, (float, int)):
-                _return = str(data)
-            elif isinstance(data, str):
-                data = data.replace("\\", "\\\\")
-                data = data.replace('"', '\\"')
-                data = data.replace("\x08", "\\b")
-                data = data.replace("\f", "\\f")
-                data = data.replace("\n", "\\n")
-                data = data.replace("\r", "\\r")
-                data = data.replace("\t", "\\t")
-                _return = '"{0}"'.format(data)
-            else:
-                _return = "null"
+        :since: v1.1.0
+        """
 
-        return _return
+        self._stats = None
+
+    def enable_stats(self):
+        """
+        Enables the instrumentation of parse, export and node operations.
+        Collected data is reset if already enabled.
+
+        :since: v1.1.0
+        """
+
+        self._stats = JsonStats()
 
     def export_data(self, flush=False):
         """
@@ -434,13 +919,85 @@ Get the parent node of the target.
                 "#echo(__FILEPATH__)# -json.export_data()- (#echo(__LINE__)#)"
             )
 
+        started = None if (self._stats is None) else perf_counter()
+
         if self._data is None:
             _return = ""
         else:
-            _return = self.data_to_json(self._data)
+            if self._lazy_source is not None:
+                self._materialize_lazy_values(self._data)
+
+            _return = (
+                self.data_to_json(self._data)
+                if (self._fragment_cache is None)
+                else self._get_incremental_json()
+            )
 
             if flush:
                 self._data = None
+                self._reset_loaded_data()
+
+        if started is not None:
+            self._stats.record("export_data", started, 0, JsonStats.get_size(_return))
+
+        return _return
+
+    def export_to(self, fp, chunk_size=None, encoding=None):
+        """
+        Writes the JSON output of the Python representation data to the given
+        file-like object in chunks.
+
+        :param fp: File-like object to write to
+        :param chunk_size: Minimum number of characters written at once
+        :param encoding: Encoding to write bytes; None to write strings
+
+        :return: (int) Number of characters written
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.export_to()- (#echo(__LINE__)#)"
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        if chunk_size is None:
+            chunk_size = JsonResource.EXPORT_CHUNK_SIZE
+
+        _return = 0
+        bytes_out = 0
+
+        parts = []
+        parts_size = 0
+
+        for part in self.iter_json():
+            parts.append(part)
+            parts_size += len(part)
+
+            if parts_size >= chunk_size:
+                chunk = "".join(parts)
+                fp.write(chunk if (encoding is None) else chunk.encode(encoding))
+
+                _return += parts_size
+
+                if started is not None:
+                    bytes_out += JsonStats.get_size(chunk)
+
+                parts = []
+                parts_size = 0
+
+        if parts_size > 0:
+            chunk = "".join(parts)
+            fp.write(chunk if (encoding is None) else chunk.encode(encoding))
+
+            _return += parts_size
+
+            if started is not None:
+                bytes_out += JsonStats.get_size(chunk)
+
+        if started is not None:
+            self._stats.record("export_to", started, 0, bytes_out)
 
         return _return
 
@@ -460,354 +1017,1356 @@ Get the parent node of the target.
         elif isinstance(o, Iterable):
             _return = list(o)
         else:
-            _return = None
+            _return = None
+
+        return _return
+
+    def _get_json_key(self, key):
+        """
+        Returns the JSON object key for the given non-string key.
+
+        :param key: Object key
+
+        :return: (str) JSON object key; None if skipped
+        :since:  v1.1.0
+        """
+
+        if key is True:
+            _return = "true"
+        elif key is False:
+            _return = "false"
+        elif key is None:
+            _return = "null"
+        elif isinstance(key, (float, int)):
+            _return = str(key)
+        elif self.skipkeys:
+            _return = None
+        else:
+            raise TypeError(
+                "Object keys must be str, int, float, bool or None, not {0}".format(
+                    key.__class__.__name__
+                )
+            )
+
+        return _return
+
+    def _get_lazy_struct(self, lazy_value):
+        """
+        Decodes the struct of the given lazy value. Nested structs are returned
+        as lazy values.
+
+        :param lazy_value: JsonLazyValue instance
+
+        :return: (mixed) Decoded struct
+        :since:  v1.1.0
+        """
+
+        data = lazy_value.source.data
+        position = lazy_value.position
+        spans = lazy_value.source.spans
+
+        is_object = data[position] == "{"
+        end_position = spans[position]
+
+        _return = self.struct_type() if is_object else []
+        position = JsonResource.RE_WHITESPACE.match(data, position + 1).end()
+
+        while position < end_position:
+            if is_object:
+                char = data[position]
+
+                if char not in JsonResource.STRING_TAG_CHARS:
+                    raise ValueError(
+                        "Object key expected at position {0:d}".format(position)
+                    )
+
+                key, position = JsonResource._json_string_to_data(
+                    data, position + 1, char
+                )
+
+                if self._intern_table is not None:
+                    key = self._intern_table.setdefault(key, key)
+
+                position = JsonResource.RE_WHITESPACE.match(data, position).end()
+
+                if data[position] != ":":
+                    raise ValueError(
+                        "Delimiter ':' expected at position {0:d}".format(position)
+                    )
+
+                position = JsonResource.RE_WHITESPACE.match(data, position + 1).end()
+
+            if data[position] in "{[":
+                value = JsonLazyValue(lazy_value.source, position)
+                position = spans[position] + 1
+            else:
+                value, position = self._json_to_data_walker(data, position)
+
+            if is_object:
+                _return[key] = value
+            else:
+                _return.append(value)
+
+            position = JsonResource.RE_WHITESPACE.match(data, position).end()
+
+            if data[position] == ",":
+                position = JsonResource.RE_WHITESPACE.match(data, position + 1).end()
+
+                if position == end_position:
+                    raise ValueError(
+                        "Unexpected delimiter ',' before position {0:d}".format(
+                            position
+                        )
+                    )
+            elif position != end_position:
+                raise ValueError(
+                    "Delimiter ',' expected at position {0:d}".format(position)
+                )
+
+        return _return
+
+    def _get_node_container_ptr(self, node_ptr, node_name, node_position):
+        """
+        Returns the mutable struct containing the node of the given name and
+        list position below the given parent node together with its key.
+
+        :param node_ptr: Parent JSON tree element of the node
+        :param node_name: Node name
+        :param node_position: List position; -1 if not given
+
+        :return: (tuple) Mutable struct and key or list position; (None, None)
+                 on error
+        :since:  v1.1.0
+        """
+
+        _return = (None, None)
+
+        if node_position < 0:
+            if isinstance(node_ptr, MutableMapping):
+                _return = (node_ptr, node_name)
+        else:
+            if isinstance(node_ptr, Mapping) and node_name in node_ptr:
+                node_ptr = self._walk_node_ptr(node_ptr, ((node_name, -1),))
+
+            if isinstance(node_ptr, MutableSequence) and node_position < len(node_ptr):
+                _return = (node_ptr, node_position)
+
+        return _return
+
+    def get_node(self, node_path):
+        """
+        Read a specified node including all children if applicable.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :return: (mixed) JSON data; None on error
+        :since:  v1.0.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.get_node({0})- (#echo(__LINE__)#)",
+                node_path,
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        node_ptr = self._get_node_ptr(node_path)
+
+        if self._lazy_source is not None:
+            self._materialize_lazy_values(node_ptr)
+
+        _return = node_ptr.copy() if (isinstance(node_ptr, dict)) else node_ptr
+
+        if started is not None:
+            self._stats.record("get_node", started)
+
+        return _return
+
+    def get_node_view(self, node_path):
+        """
+        Read a specified node without copying it. Structs are returned as
+        read-only views of the live tree.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :return: (mixed) JSON data; read-only view for structs; None on error
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.get_node_view({0})- (#echo(__LINE__)#)",
+                node_path,
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        _return = get_json_view(self, self._get_node_ptr(node_path))
+
+        if started is not None:
+            self._stats.record("get_node_view", started)
+
+        return _return
+
+    def get_nodes(self, node_paths):
+        """
+        Read all specified nodes including all children if applicable. Nodes
+        sharing a path prefix are resolved only once.
+
+        :param node_paths: Iterable of paths to the nodes - delimiter is space
+
+        :return: (list) JSON data of each node in the given order; None for
+                 each node not found
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.get_nodes()- (#echo(__LINE__)#)"
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        _return = self._get_node_ptrs(node_paths)
+
+        for index, node_ptr in enumerate(_return):
+            if self._lazy_source is not None:
+                self._materialize_lazy_values(node_ptr)
+
+            if isinstance(node_ptr, dict):
+                _return[index] = node_ptr.copy()
+
+        if started is not None:
+            self._stats.record("get_nodes", started)
+
+        return _return
+
+    def _get_node_ptr(self, node_path):
+        """
+        Returns the pointer to a specific node.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :return: (dict) JSON tree element; None on error
+        :since:  v1.0.0
+        """
+
+        _return = None
+
+        node_path = JsonResource.compile_node_path(node_path)
+
+        if (
+            node_path is not None
+            and self._node_index is not None
+            and node_path.steps in self._node_index
+        ):
+            return self._node_index[node_path.steps]
+
+        if node_path is not None:
+            node_path_steps = node_path.steps
+            node_ptr = self._data
+
+            if len(self._node_cache) > 0:
+                is_cached = False
+
+                for node_cache_steps, node_path_steps_left in node_path.prefix_steps:
+                    if node_cache_steps in self._node_cache:
+                        node_ptr = self._node_cache[node_cache_steps]
+
+                        """
+A prefix addressing the list of a list position step is only valid if the
+cached node is a list containing the position. Otherwise the position is
+ignored like in "_walk_node_ptr()" and a shorter prefix is used.
+                        """
+
+                        if len(node_cache_steps) + len(node_path_steps_left) > len(
+                            node_path_steps
+                        ) and not (
+                            isinstance(node_ptr, list)
+                            and node_path_steps_left[0][1] < len(node_ptr)
+                        ):
+                            node_ptr = self._data
+                            continue
+
+                        is_cached = True
+                        self._node_cache.move_to_end(node_cache_steps)
+
+                        node_path_steps = node_path_steps_left
+                        break
+
+                if is_cached:
+                    self._node_cache_hits += 1
+                else:
+                    self._node_cache_misses += 1
+
+            _return = self._walk_node_ptr(node_ptr, node_path_steps)
+
+        return _return
+
+    def _get_node_ptrs(self, node_paths):
+        """
+        Returns the pointers to all specified nodes. The paths are grouped in a
+        prefix trie to walk each shared prefix only once.
+
+        :param node_paths: Iterable of paths to the nodes - delimiter is space
+
+        :return: (list) JSON tree elements in the given order; None for each
+                 node not found
+        :since:  v1.1.0
+        """
+
+        _return = []
+
+        node_trie = ({}, [])
+
+        for index, node_path in enumerate(node_paths):
+            _return.append(None)
+            node_path = JsonResource.compile_node_path(node_path)
+
+            if node_path is not None:
+                node_trie_level = node_trie
+
+                for step in node_path.steps:
+                    node_trie_children = node_trie_level[0]
+
+                    if step not in node_trie_children:
+                        node_trie_children[step] = ({}, [])
+
+                    node_trie_level = node_trie_children[step]
+
+                node_trie_level[1].append(index)
+
+        for index in node_trie[1]:
+            _return[index] = self._data
+
+        stack = [(self._data, node_trie[0])]
+
+        while len(stack) > 0:
+            node_ptr, node_trie_children = stack.pop()
+
+            for step, (node_trie_step_children, indices) in node_trie_children.items():
+                node_step_ptr = self._walk_node_ptr(node_ptr, (step,))
+
+                if node_step_ptr is not None:
+                    for index in indices:
+                        _return[index] = node_step_ptr
+
+                    if len(node_trie_step_children) > 0:
+                        stack.append((node_step_ptr, node_trie_step_children))
+
+        return _return
+
+    def _intern_struct_strings(self, node_ptr):
+        """
+        Replaces object keys and, for "INTERNING_STRINGS", short string values
+        of the given JSON tree element recursively with the shared instances
+        of the intern table.
+
+        :param node_ptr: JSON tree element
+
+        :since: v1.1.0
+        """
+
+        intern_table = self._intern_table
+        is_value_interned = self._interning == JsonResource.INTERNING_STRINGS
+        string_length = JsonResource.INTERNING_STRING_LENGTH
+        stack = [node_ptr]
+
+        while len(stack) > 0:
+            struct = stack.pop()
+
+            if isinstance(struct, Mapping):
+                items = list(struct.items())
+
+                if any(
+                    intern_table.setdefault(key, key) is not key for key, _ in items
+                ):
+                    struct.clear()
+                    struct.update((intern_table[key], value) for key, value in items)
+            else:
+                items = enumerate(struct)
+
+            for key, value in items:
+                if isinstance(value, str):
+                    if is_value_interned and len(value) <= string_length:
+                        struct[key] = intern_table.setdefault(value, value)
+                elif isinstance(value, (Mapping, list)):
+                    stack.append(value)
+
+    def _iter_json_parts(self, data, parts_count=None):
+        """
+        Yields the JSON output reflecting the given data using the internal
+        encoder. Nested structs are encoded with an explicit stack.
+
+        :param data: Python data
+        :param parts_count: Number of encoded parts joined into one yielded
+                            fragment; None to yield the complete output
+
+        :return: (object) Generator yielding JSON output fragments
+        :since:  v1.1.0
+        """
+
+        # pylint: disable=too-many-branches
+
+        parts = []
+        append = parts.append
+        stack = []
+        value = data
+
+        while True:
+            if isinstance(value, str):
+                append(JsonResource._get_json_string(value))
+            elif value is None:
+                append("null")
+            elif value is True:
+                append("true")
+            elif value is False:
+                append("false")
+            elif isinstance(value, (float, int)):
+                append(str(value))
+            elif isinstance(value, dict) or isinstance(value, Mapping):
+                append("{")
+                stack.append([iter(value.items()), True, True])
+            elif isinstance(value, list) or isinstance(value, Iterable):
+                append("[")
+                stack.append([iter(value), False, True])
+            else:
+                append("null")
+
+            is_value_found = False
+
+            while len(stack) > 0:
+                struct_iterator, is_mapping, is_first = stack[-1]
+                item = next(struct_iterator, JsonResource._STRUCT_END)
+
+                if item is JsonResource._STRUCT_END:
+                    append("}" if is_mapping else "]")
+                    stack.pop()
+                else:
+                    if is_mapping:
+                        key, value = item
+
+                        if not isinstance(key, str):
+                            key = self._get_json_key(key)
+
+                            if key is None:
+                                continue
+                    else:
+                        value = item
+
+                    if is_first:
+                        stack[-1][2] = False
+                    else:
+                        append(",")
+
+                    if is_mapping:
+                        append(JsonResource._get_json_string(key))
+                        append(":")
+
+                    is_value_found = True
+                    break
+
+            if not is_value_found:
+                break
+
+            if parts_count is not None and len(parts) >= parts_count:
+                yield "".join(parts)
+                del parts[:]
+
+        if len(parts) > 0:
+            yield "".join(parts)
+
+    def iter_json(self):
+        """
+        Returns a generator yielding the JSON output of the Python
+        representation data in parts.
+
+        :return: (object) Generator yielding JSON string parts
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.iter_json()- (#echo(__LINE__)#)"
+            )
+
+        if self._data is not None:
+            if self._lazy_source is not None:
+                self._materialize_lazy_values(self._data)
+
+            yield from self._encoding_backend.iter_encode(self, self._data)
+
+    def iter_nodes(self, node_path, is_missing_yielded=False):
+        """
+        Returns a generator yielding all nodes selected by the given path in
+        document order. The path may select all list positions ("items#*") or
+        a slice of them ("items#10:20", "items#-5:") at any level. All nodes
+        are found in one traversal without building intermediate lists. Nodes
+        not found are skipped.
+
+        :param node_path: Path to the nodes - delimiter is space
+        :param is_missing_yielded: True to yield None for each selected list
+                                   position without the node instead of
+                                   skipping it
+
+        :return: (object) Generator yielding the JSON data of each node
+                 including all children if applicable
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.iter_nodes({0})- (#echo(__LINE__)#)",
+                node_path,
+            )
+
+        node_path = JsonResource.compile_node_path(node_path)
+
+        if node_path is not None:
+            pattern_steps = node_path.pattern_steps
+            prefix_length = 0
+
+            for _, node_selection in pattern_steps:
+                if isinstance(node_selection, tuple):
+                    break
+
+                prefix_length += 1
+
+            node_ptr = (
+                self._data
+                if (prefix_length == 0)
+                else self._get_node_ptr(
+                    JsonNodePath.from_steps(node_path.steps[:prefix_length])
+                )
+            )
+
+            if node_ptr is not None:
+                for node_ptr in self._iter_node_ptrs(
+                    node_ptr, pattern_steps[prefix_length:], is_missing_yielded
+                ):
+                    if self._lazy_source is not None:
+                        self._materialize_lazy_values(node_ptr)
+
+                    yield (
+                        node_ptr.copy() if (isinstance(node_ptr, dict)) else node_ptr
+                    )
+
+    def _iter_node_ptrs(self, node_ptr, pattern_steps, is_missing_yielded=False):
+        """
+        Returns a generator yielding the pointers to all nodes selected by the
+        given pattern steps below the given node pointer.
+
+        :param node_ptr: JSON tree element to start at
+        :param pattern_steps: Tuple of node name and list position or
+                              selection tuples
+        :param is_missing_yielded: True to yield None for nodes not found
+
+        :return: (object) Generator yielding JSON tree elements
+        :since:  v1.1.0
+        """
+
+        for index, (node_name, node_selection) in enumerate(pattern_steps):
+            if isinstance(node_selection, tuple):
+                if index > 0:
+                    node_ptr = self._walk_node_ptr(node_ptr, pattern_steps[:index])
+
+                if isinstance(node_ptr, Mapping):
+                    node_ptr = self._walk_node_ptr(node_ptr, ((node_name, -1),))
+
+                if isinstance(node_ptr, list):
+                    is_lazy = self._lazy_source is not None
+                    pattern_steps_left = pattern_steps[1 + index :]
+
+                    for position in range(
+                        *slice(*node_selection).indices(len(node_ptr))
+                    ):
+                        node_position_ptr = node_ptr[position]
+
+                        if is_lazy and isinstance(node_position_ptr, JsonLazyValue):
+                            node_position_ptr = self._materialize_lazy_value(
+                                node_ptr, position, node_position_ptr
+                            )
+
+                        if len(pattern_steps_left) == 0:
+                            yield node_position_ptr
+                        elif node_position_ptr is not None:
+                            yield from self._iter_node_ptrs(
+                                node_position_ptr,
+                                pattern_steps_left,
+                                is_missing_yielded,
+                            )
+                        elif is_missing_yielded:
+                            yield None
+
+                break
+        else:
+            node_ptr = self._walk_node_ptr(node_ptr, pattern_steps)
+
+            if node_ptr is not None or is_missing_yielded:
+                yield node_ptr
+
+    def _json_to_data_walker(self, data, position=0):
+        """
+        Converts JSON data recursively into the corresponding Python data. The
+        input is scanned in place starting at the given position.
+
+        :param data: Input JSON data
+        :param position: Position of the first character to scan
+
+        :return: (tuple) Python data and the position after the scanned value
+        :since:  v1.1.0
+        """
+
+        if data[position] in JsonResource.WHITESPACE_CHARS:
+            position = JsonResource.RE_WHITESPACE.match(data, position).end()
+
+        char = data[position]
+
+        if char == "{":
+            _return = self.struct_type()
+            intern_table = self._intern_table
+            position = JsonResource.RE_WHITESPACE.match(data, position + 1).end()
+
+            if data[position] == "}":
+                return _return, position + 1
+
+            while True:
+                char = data[position]
+
+                if char not in JsonResource.STRING_TAG_CHARS:
+                    raise ValueError(
+                        "Object key expected at position {0:d}".format(position)
+                    )
+
+                key, position = JsonResource._json_string_to_data(
+                    data, position + 1, char
+                )
+
+                if intern_table is not None:
+                    key = intern_table.setdefault(key, key)
+
+                if data[position] in JsonResource.WHITESPACE_CHARS:
+                    position = JsonResource.RE_WHITESPACE.match(data, position).end()
+
+                if data[position] != ":":
+                    raise ValueError(
+                        "Delimiter ':' expected at position {0:d}".format(position)
+                    )
+
+                _return[key], position = self._json_to_data_walker(data, position + 1)
+
+                if data[position] in JsonResource.WHITESPACE_CHARS:
+                    position = JsonResource.RE_WHITESPACE.match(data, position).end()
+
+                char = data[position]
+
+                if char == "}":
+                    return _return, position + 1
+                elif char != ",":
+                    raise ValueError(
+                        "Delimiter ',' expected at position {0:d}".format(position)
+                    )
+
+                position = JsonResource.RE_WHITESPACE.match(data, position + 1).end()
+        elif char == "[":
+            _return = []
+            position = JsonResource.RE_WHITESPACE.match(data, position + 1).end()
+
+            if data[position] == "]":
+                return _return, position + 1
+
+            while True:
+                value, position = self._json_to_data_walker(data, position)
+                _return.append(value)
+
+                if data[position] in JsonResource.WHITESPACE_CHARS:
+                    position = JsonResource.RE_WHITESPACE.match(data, position).end()
+
+                char = data[position]
+
+                if char == "]":
+                    return _return, position + 1
+                elif char != ",":
+                    raise ValueError(
+                        "Delimiter ',' expected at position {0:d}".format(position)
+                    )
+
+                position += 1
+        elif char in JsonResource.STRING_TAG_CHARS:
+            _return, position = JsonResource._json_string_to_data(
+                data, position + 1, char
+            )
+
+            if (
+                self._interning == JsonResource.INTERNING_STRINGS
+                and len(_return) <= JsonResource.INTERNING_STRING_LENGTH
+            ):
+                _return = self._intern_table.setdefault(_return, _return)
+
+            return _return, position
+        elif char == "t" and data.startswith("true", position):
+            return True, position + 4
+        elif char == "f" and data.startswith("false", position):
+            return False, position + 5
+        elif char == "n" and data.startswith("null", position):
+            return None, position + 4
+
+        re_result = JsonResource.RE_NUMBER.match(data, position)
+
+        if re_result is None:
+            raise ValueError("Unexpected data at position {0:d}".format(position))
+
+        integer, fraction, exponent = re_result.groups()
+
+        _return = (
+            int(integer)
+            if (fraction is None and exponent is None)
+            else float(re_result.group())
+        )
+
+        return _return, re_result.end()
+
+    def _json_to_data_internal(self, data, is_scalar_allowed=False):
+        """
+        Converts JSON data with a top level object or list into the
+        corresponding Python data using the internal parser.
+
+        :param data: Input JSON data
+        :param is_scalar_allowed: True to accept a top level scalar value
+
+        :return: (mixed) Python data; None on error
+        :since:  v1.1.0
+        """
+
+        _return = None
+
+        try:
+            if not isinstance(data, str):
+                raise ValueError("JSON data is not a string")
+
+            position = JsonResource.RE_WHITESPACE.match(data).end()
+
+            if is_scalar_allowed or data[position] in "{[":
+                data_parsed, position = self._json_to_data_walker(data, position)
+                position = JsonResource.RE_WHITESPACE.match(data, position).end()
+
+                if position == len(data):
+                    _return = data_parsed
+        except (IndexError, RecursionError, ValueError):
+            pass
+
+        return _return
+
+    def _materialize_lazy_value(self, node_ptr, key, lazy_value):
+        """
+        Decodes the struct of the given lazy value. Nested structs are kept as
+        lazy values. The decoded struct replaces the lazy value in its parent.
+        An invalid struct is kept as lazy value and raises a "ValueError"
+        each time it is accessed.
+
+        :param node_ptr: Parent JSON tree element
+        :param key: Key or list position of the lazy value in its parent
+        :param lazy_value: JsonLazyValue instance
+
+        :return: (mixed) Decoded struct
+        :since:  v1.1.0
+        """
+
+        try:
+            _return = self._get_lazy_struct(lazy_value)
+        except IndexError:
+            raise ValueError(
+                "Unterminated JSON struct at position {0:d}".format(lazy_value.position)
+            )
+
+        node_ptr[key] = _return
+
+        return _return
+
+    def _materialize_lazy_values(self, node_ptr, excluded_ptr=None):
+        """
+        Decodes all lazy values of the given JSON tree element recursively. A
+        "ValueError" is raised for the first invalid struct found.
+
+        :param node_ptr: JSON tree element
+        :param excluded_ptr: JSON tree element not to descend into
+
+        :since: v1.1.0
+        """
+
+        stack = [node_ptr]
+
+        while len(stack) > 0:
+            struct = stack.pop()
+
+            if isinstance(struct, Mapping):
+                keys = struct.keys()
+            elif isinstance(struct, list):
+                keys = range(len(struct))
+            else:
+                continue
+
+            for key in keys:
+                value = struct[key]
+
+                if isinstance(value, JsonLazyValue):
+                    value = self._materialize_lazy_value(struct, key, value)
+
+                if isinstance(value, (Mapping, list)) and value is not excluded_ptr:
+                    stack.append(value)
+
+        if node_ptr is self._data and excluded_ptr is None:
+            self._reset_interning()
+            self._lazy_source = None
+
+    def parse(self, data, lazy=False, interning=None):
+        """
+        Parses the given JSON data.
+
+        :param data: Input JSON data
+        :param lazy: True to decode nested structs only if accessed. Accessing
+                     an invalid nested struct raises a "ValueError".
+        :param interning: String interning mode ("INTERNING_KEYS" or
+                          "INTERNING_STRINGS") sharing equal strings of the
+                          document
+
+        :since: v1.0.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.parse()- (#echo(__LINE__)#)"
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        self._reset_loaded_data(interning)
+
+        if lazy:
+            self._parse_lazy(data)
+        else:
+            self._data = self.backend.decode(self, data)
+
+            if self._interning > self.backend.INTERNING and self._data is not None:
+                self._intern_struct_strings(self._data)
+
+        if self._lazy_source is None:
+            """
+Lazy values decoded later on share the strings of the parsed document.
+            """
+
+            self._reset_interning()
+
+        if started is not None:
+            self._stats.record("parse", started, JsonStats.get_size(data))
+
+    def parse_file(self, file_path, memory_map=False):
+        """
+        Parses the JSON data of the given UTF-8 encoded file. The internal
+        parser is fed in chunks while all other backends decode the file
+        content at once. Backends accepting binary input ("msgspec" and
+        "orjson") decode the file content or memory-mapped buffer directly.
+        All others need a decoded copy of the complete content in memory.
+
+        :param file_path: Path to the JSON file
+        :param memory_map: True to read the JSON data from a memory-mapped
+                           buffer
+
+        :since: v1.1.0
+        """
+
+        # pylint: disable=import-outside-toplevel
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.parse_file({0})- (#echo(__LINE__)#)",
+                file_path,
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        with open(file_path, "rb") as file_obj:
+            file_size = os.fstat(file_obj.fileno()).st_size
+
+            if self.implementation != JsonResource.IMPLEMENTATION_INTERNAL:
+                if memory_map and file_size > 0:
+                    with mmap.mmap(
+                        file_obj.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped_data:
+                        with memoryview(mapped_data) as mapped_view:
+                            self._data = self._decode_file_data(mapped_view)
+                else:
+                    self._data = self._decode_file_data(file_obj.read())
+            else:
+                from .json_feed_parser import JsonFeedParser
+
+                json_parser = JsonFeedParser(self.struct_type, self._log_handler)
+
+                if memory_map and file_size > 0:
+                    with mmap.mmap(
+                        file_obj.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped_data:
+                        with memoryview(mapped_data) as mapped_view:
+                            for position in range(
+                                0, len(mapped_view), JsonResource.FILE_CHUNK_SIZE
+                            ):
+                                if not json_parser.feed(
+                                    mapped_view[
+                                        position : position
+                                        + JsonResource.FILE_CHUNK_SIZE
+                                    ]
+                                ):
+                                    break
+                elif not memory_map:
+                    for chunk in iter(
+                        lambda: file_obj.read(JsonResource.FILE_CHUNK_SIZE), b""
+                    ):
+                        if not json_parser.feed(chunk):
+                            break
+
+                self._data = json_parser.close()._data
+
+        self._reset_loaded_data()
+
+        if started is not None:
+            self._stats.record("parse_file", started, file_size)
+
+    def _decode_file_data(self, data):
+        """
+        Decodes the given UTF-8 encoded file content with the backend of the
+        configured implementation. It is converted to a string first if the
+        backend does not accept binary input.
+
+        :param data: UTF-8 encoded bytes-like JSON data
+
+        :return: (mixed) Python representation data; None on error
+        :since:  v1.1.0
+        """
+
+        if not self.backend.BINARY_INPUT:
+            try:
+                data = str(data, "utf-8")
+            except UnicodeDecodeError:
+                data = ""
+
+        return self.backend.decode(self, data)
+
+    def parse_parallel(self, data, node_path=None, processes=None):
+        """
+        Parses the given JSON data and decodes the elements of the top level
+        list or the list of the given node path in a process pool. Element
+        boundaries are found by a serial structural scan before decoding.
+
+        The scan alone takes longer than decoding the whole document with the
+        native implementation or one of the fast backends. Only the internal
+        implementation is therefore decoded in worker processes, and only for
+        at least two worker processes and data of "PARALLEL_SIZE_MIN" or more.
+        All other cases are decoded serially and recorded as
+        "parse_parallel_serial" in the stats.
+
+        :param data: Input JSON data
+        :param node_path: Path to the list to decode in parallel - delimiter
+                          is space; None for the top level list
+        :param processes: Number of worker processes; None for one per CPU
+
+        :return: (bool) True if list elements have been decoded in worker
+                 processes
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.parse_parallel()- (#echo(__LINE__)#)"
+            )
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        _return = False
+
+        if (
+            self._implementation != JsonResource.IMPLEMENTATION_INTERNAL
+            or processes < 2
+            or len(data) < JsonResource.PARALLEL_SIZE_MIN
+        ):
+            """
+Decoding the whole document at once is faster than scanning it serially and
+transferring the element ranges to worker processes in these cases.
+            """
+
+            started = None if (self._stats is None) else perf_counter()
+
+            self.parse(data)
+
+            if started is not None:
+                self._stats.record("parse_parallel_serial", started)
+        else:
+            started = None if (self._stats is None) else perf_counter()
+
+            self._reset_loaded_data()
+            self._parse_lazy(data)
+
+            if self._lazy_source is not None:
+                lazy_source = self._lazy_source
+
+                try:
+                    node_ptr = self._get_node_ptr(
+                        "" if (node_path is None) else node_path
+                    )
+
+                    if not isinstance(node_ptr, list):
+                        node_ptr = None
+
+                    self._materialize_lazy_values(self._data, node_ptr)
+
+                    if node_ptr is not None:
+                        _return = self._parse_list_in_processes(
+                            lazy_source, node_ptr, processes
+                        )
+                except (IndexError, RecursionError, ValueError):
+                    self._data = None
+                    _return = False
+
+                self._reset_loaded_data()
+
+            if started is not None:
+                self._stats.record(
+                    "parse_parallel" if _return else "parse_parallel_serial",
+                    started,
+                    JsonStats.get_size(data),
+                )
+
+        return _return
+
+    def _parse_list_in_processes(self, lazy_source, node_ptr, processes):
+        """
+        Decodes all lazy list elements in a process pool. Consecutive structs
+        are grouped into ranges of roughly equal size.
+
+        :param lazy_source: JsonLazySource instance
+        :param node_ptr: List containing lazy values
+        :param processes: Number of worker processes
+
+        :return: (bool) True if decoded in worker processes
+        :since:  v1.1.0
+        """
+
+        data = lazy_source.data
+        spans = lazy_source.spans
+
+        lazy_ranges = []
+        lazy_range = None
+
+        chunk_size_max = 1 + len(data) // (
+            processes * JsonResource.PARALLEL_CHUNKS_PER_PROCESS
+        )
+
+        for index, value in enumerate(node_ptr):
+            if isinstance(value, JsonLazyValue):
+                end_position = spans[value.position] + 1
+
+                if (
+                    lazy_range is None
+                    or lazy_range[0] + lazy_range[1] != index
+                    or end_position - lazy_range[2] > chunk_size_max
+                ):
+                    lazy_range = [index, 0, value.position, end_position]
+                    lazy_ranges.append(lazy_range)
+
+                lazy_range[1] += 1
+                lazy_range[3] = end_position
+
+        chunks = [
+            "[" + data[start_position:end_position] + "]"
+            for _, _, start_position, end_position in lazy_ranges
+        ]
+
+        _return = processes > 1 and len(chunks) > 1
+
+        if _return:
+            with ProcessPoolExecutor(processes) as executor:
+                chunks_data = list(
+                    executor.map(
+                        _decode_json_chunk,
+                        repeat(self.struct_type),
+                        repeat(self._implementation),
+                        chunks,
+                    )
+                )
+        else:
+            chunks_data = [self.backend.decode(self, chunk) for chunk in chunks]
+
+        for (index, count, _, _), chunk_data in zip(lazy_ranges, chunks_data):
+            if not isinstance(chunk_data, list) or len(chunk_data) != count:
+                raise ValueError(
+                    "Invalid list elements starting at index {0:d}".format(index)
+                )
+
+            node_ptr[index : index + count] = chunk_data
 
         return _return
 
-    def get_node(self, node_path):
+    def _parse_lazy(self, data):
         """
-        Read a specified node including all children if applicable.
+        Scans the given JSON data for structs and decodes the top level struct
+        only.
 
-        :param node_path: Path to the node - delimiter is space
+        :param data: Input JSON data
 
-        :return: (mixed) JSON data; None on error
-        :since:  v1.0.0
+        :since: v1.1.0
         """
 
-        if self._log_handler is not None:
-            self._log_handler.debug(
-                "#echo(__FILEPATH__)# -json.get_node({0})- (#echo(__LINE__)#)",
-                node_path,
-            )
+        self._data = None
 
-        _return = None
+        lazy_source = JsonLazySource.scan(data)
 
-        if isinstance(node_path, str):
-            node_ptr = self._get_node_ptr(node_path)
+        if lazy_source is not None:
+            position = JsonResource.RE_WHITESPACE.match(data).end()
 
-            if node_ptr is not None:
-                _return = node_ptr.copy() if (isinstance(node_ptr, dict)) else node_ptr
+            if position in lazy_source.spans and JsonResource.RE_WHITESPACE.match(
+                data, lazy_source.spans[position] + 1
+            ).end() == len(data):
+                self._lazy_source = lazy_source
 
-        return _return
+                try:
+                    self._data = self._get_lazy_struct(
+                        JsonLazyValue(lazy_source, position)
+                    )
+                except (IndexError, ValueError):
+                    self._lazy_source = None
 
-    def _get_node_ptr(self, node_path):
+    def remove_node(self, node_path):
         """
-        Returns the pointer to a specific node.
+        Remove a node and all children if applicable.
 
         :param node_path: Path to the node - delimiter is space
 
-        :return: (dict) JSON tree element; None on error
+        :return: (bool) False on error
         :since:  v1.0.0
         """
 
         if self._log_handler is not None:
             self._log_handler.debug(
-                "#echo(__FILEPATH__)# -json._get_node_ptr({0})- (#echo(__LINE__)#)",
+                "#echo(__FILEPATH__)# -json.remove_node({0})- (#echo(__LINE__)#)",
                 node_path,
             )
 
-        _return = None
+        started = None if (self._stats is None) else perf_counter()
 
-        if isinstance(node_path, str):
-            if (
-                self.data_cache_node != ""
-                and node_path[: len(self.data_cache_node)].lower()
-                == self.data_cache_node.lower()
-            ):
-                node_path = node_path[len(self.data_cache_node) :].strip()
-                node_ptr = self.data_cache_ptr
-            else:
-                node_ptr = self._data
+        _return = False
 
-            is_valid = True
-            node_path_list = node_path.split(" ") if (len(node_path) > 0) else []
+        node_path = JsonResource.compile_node_path(node_path)
 
-            while is_valid and len(node_path_list) > 0:
-                is_valid = False
-                node_name = node_path_list.pop(0)
+        if node_path is not None and len(node_path) > 0:
+            """
+Get the parent node of the target.
+            """
 
-                re_result = JsonResource.RE_NODE_POSITION.match(node_name)
+            node_name, node_position = node_path.steps[-1]
+            node_ptr = self._get_node_ptr(node_path.parent)
 
-                if re_result is None:
-                    node_position = -1
-                else:
-                    node_name = re_result.group(1)
-                    node_position = int(re_result.group(2))
+            """
+Delete the node
+            """
 
-                if isinstance(node_ptr, Mapping):
-                    if node_name in node_ptr:
-                        is_valid = True
-                        node_ptr = node_ptr[node_name]
+            node_ptr, node_key = self._get_node_container_ptr(
+                node_ptr, node_name, node_position
+            )
 
-                if (
-                    node_position >= 0
-                    and isinstance(node_ptr, Sequence)
-                    and node_position < len(node_ptr)
-                ):
-                    is_valid = True
-                    node_ptr = node_ptr[node_position]
+            if node_ptr is not None and (node_position >= 0 or node_key in node_ptr):
+                self._remove_node_ptr(node_path, node_ptr, node_key)
+                _return = True
 
-            if is_valid:
-                _return = node_ptr
+        if started is not None:
+            self._stats.record("remove_node", started)
 
         return _return
 
-    def _json_to_data_walker(self, data, end_tag=""):
+    def remove_nodes(self, node_paths):
         """
-        Converts JSON data recursively into the corresponding PHP data ...
+        Remove all specified nodes and their children if applicable. All paths
+        refer to the nodes before any of them is removed. Parent nodes sharing
+        a path prefix are resolved only once, nodes below another removed node
+        are removed with it and list entries are deleted from the highest
+        position downwards.
 
-        :param data: Input JSON data
-        :param end_tag: Ending delimiter
+        :param node_paths: Iterable of paths to the nodes - delimiter is space
 
-        :return: (mixed) JSON data; None on error
-        :since:  v1.0.0
+        :return: (bool) False if at least one node could not be removed
+        :since:  v1.1.0
         """
 
         if self._log_handler is not None:
             self._log_handler.debug(
-                "#echo(__FILEPATH__)# -json._json_to_data_walker()- (#echo(__LINE__)#)"
+                "#echo(__FILEPATH__)# -json.remove_nodes()- (#echo(__LINE__)#)"
             )
 
-        _return = None
-
-        data = data.strip()
+        started = None if (self._stats is None) else perf_counter()
 
-        if end_tag == "]":
-            _return = []
+        _return = True
 
-            while len(data) > 0:
-                if data[0] == "{":
-                    data_part = JsonResource._find_string(data, "}", "{")
-                elif data[0] == "[":
-                    data_part = JsonResource._find_string(data, "]", "[")
-                else:
-                    data_part = JsonResource._find_string(data, ",")
+        node_paths = [
+            JsonResource.compile_node_path(node_path) for node_path in node_paths
+        ]
 
-                if data_part is None:
-                    data_part = JsonResource._find_string(data, "]")
+        node_ptrs = self._get_node_ptrs(
+            [
+                (
+                    node_path.parent
+                    if (node_path is not None and len(node_path) > 0)
+                    else None
+                )
+                for node_path in node_paths
+            ]
+        )
 
-                if data_part is not None:
-                    data = data[len(data_part) + 1 :].strip()
+        removals = {}
 
-                    if len(data_part) > 0:
-                        if data_part[0] == "{":
-                            _return.append(
-                                self._json_to_data_walker(data_part[1:], "}")
-                            )
-                        elif data_part[0] == "[":
-                            _return.append(
-                                self._json_to_data_walker(data_part[1:], "]")
-                            )
-                        else:
-                            _return.append(self._json_to_data_walker(data_part))
-                else:
-                    if len(data) > 0 and data != "]":
-                        _return = None
-                    break
-        elif end_tag == "}":
-            _return = self.struct_type()
+        for node_path, node_ptr in zip(node_paths, node_ptrs):
+            if node_path is None or len(node_path) < 1:
+                _return = False
+                continue
 
-            while len(data) > 0:
-                if data == "}":
-                    break
-                else:
-                    if data[0] == ",":
-                        data = data[1:].strip()
+            node_name, node_position = node_path.steps[-1]
 
-                    if data[0] == '"':
-                        key_string_tag = '"'
-                    elif data[0] == "'":
-                        key_string_tag = "'"
-                    else:
-                        key_string_tag = None
+            node_ptr, node_key = self._get_node_container_ptr(
+                node_ptr, node_name, node_position
+            )
 
-                    key = None
+            if node_ptr is None or (node_position < 0 and node_key not in node_ptr):
+                _return = False
+            else:
+                node_pointer = self._get_node_pointer(node_path.steps)
+                removals[node_pointer] = (node_ptr, node_key, node_path)
 
-                    if key_string_tag is not None:
-                        key = JsonResource._find_string(data[1:], key_string_tag)
+        """
+Skip nodes removed together with one of their parents. Delete the deepest
+nodes first and list entries in descending position order to keep the
+positions of entries still to be deleted stable.
+        """
 
-                        if key is not None:
-                            data = data[len(key) + 2 :].strip()
+        for node_pointer in sorted(
+            removals,
+            key=lambda node_pointer: (
+                -node_pointer.count("/"),
+                (
+                    0
+                    if isinstance(removals[node_pointer][0], MutableMapping)
+                    else -removals[node_pointer][1]
+                ),
+            ),
+        ):
+            position = node_pointer.rfind("/")
 
-                    if (
-                        key is not None
-                        and len(key) > 0
-                        and len(data) > 1
-                        and data[0] == ":"
-                    ):
-                        data = data[1:].strip()
-
-                        if data[0] == "{":
-                            data_part = JsonResource._find_string(data, "}", "{")
-                        elif data[0] == "[":
-                            data_part = JsonResource._find_string(data, "]", "[")
-                        else:
-                            data_part = JsonResource._find_string(data, ",")
-
-                        if data_part is None:
-                            data_part = JsonResource._find_string(data, "}")
-
-                        if data_part is not None:
-                            data = data[len(data_part) :].strip()
-
-                            if len(data_part) > 0:
-                                if data_part[0] == "{":
-                                    _return[key] = self._json_to_data_walker(
-                                        data_part[1:], "}"
-                                    )
-                                elif data_part[0] == "[":
-                                    _return[key] = self._json_to_data_walker(
-                                        data_part[1:], "]"
-                                    )
-                                else:
-                                    _return[key] = self._json_to_data_walker(data_part)
-                        elif len(data) > 0 and data != "}":
-                            data = None
-                        else:
-                            data = ""
-                    else:
-                        _return = None
-                        break
-        elif data == "true":
-            _return = True
-        elif data == "false":
-            _return = False
-        elif len(data) > 0 and data != "null":
-            if data[0] == '"':
-                value_string_tag = '"'
-            elif data[0] == "'":
-                value_string_tag = "'"
-            else:
-                value_string_tag = None
+            while position > 0 and node_pointer[:position] not in removals:
+                position = node_pointer.rfind("/", 0, position)
 
-            if value_string_tag is None:
-                try:
-                    _return = int(data)
-                except ValueError:
-                    pass
-
-                if _return is None:
-                    try:
-                        _return = float(data)
-                    except ValueError:
-                        pass
-            else:
-                _return = JsonResource._find_string(data[1:], value_string_tag)
+            if position < 1:
+                node_ptr, node_key, node_path = removals[node_pointer]
+                self._remove_node_ptr(node_path, node_ptr, node_key, node_pointer)
 
-                if _return is not None:
-                    _return = _return.replace('"', '"')
-                    _return = _return.replace("\\\\", "\\")
-                    _return = _return.replace("\\b", "\x08")
-                    _return = _return.replace("\\f", "\f")
-                    _return = _return.replace("\\n", "\n")
-                    _return = _return.replace("\\r", "\r")
-                    _return = _return.replace("\\t", "\t")
+        if started is not None:
+            self._stats.record("remove_nodes", started)
 
         return _return
 
-    def parse(self, data):
+    def _remove_node_ptr(self, node_path, node_ptr, node_key, node_pointer=None):
         """
-        Parses the given JSON data.
+        Deletes the given key or list position of the given struct and updates
+        cached and indexed node pointers.
 
-        :param data: Input JSON data
+        :param node_path: Compiled path to the node
+        :param node_ptr: Mutable struct containing the node
+        :param node_key: Key or list position of the node
+        :param node_pointer: JSON Pointer of the node if already resolved
 
-        :since: v1.0.0
+        :since: v1.1.0
         """
 
-        if self._log_handler is not None:
-            self._log_handler.debug(
-                "#echo(__FILEPATH__)# -json.parse()- (#echo(__LINE__)#)"
-            )
+        if self._node_index is not None:
+            self._remove_indexed_nodes(node_path, node_ptr, node_key, True)
 
-        data = data.strip()
+        if self._fragment_cache is not None:
+            self._mark_fragments_dirty(node_path.steps, True)
 
-        if self.implementation == JsonResource.IMPLEMENTATION_NATIVE:
-            native_error_class = getattr(json, "JSONDecodeError", ValueError)
+        if self._patch_recorders is not None:
+            self._record_patch_operation(
+                "remove", node_path.steps, node_pointer=node_pointer
+            )
 
-            try:
-                self._data = json.loads(data)
-            except native_error_class:
-                self._data = None
-        elif data[0] == "{":
-            self._data = self._json_to_data_walker(data[1:], "}")
-        elif data[0] == "[":
-            self._data = self._json_to_data_walker(data[1:], "]")
-        else:
-            self._data = None
+        del node_ptr[node_key]
 
-    def remove_node(self, node_path):
-        """
-        Remove a node and all children if applicable.
+        if self._node_index is not None:
+            self._add_indexed_nodes(node_path, node_ptr, node_key, True)
 
-        :param node_path: Path to the node - delimiter is space
+        if len(self._node_cache) > 0:
+            self._remove_cached_nodes(node_path.steps, True)
 
-        :return: (bool) False on error
-        :since:  v1.0.0
+    def _remove_cached_nodes(self, node_path_steps, is_position_removed=False):
         """
+        Removes all cached node pointers invalidated by changing or removing
+        the node of the given path.
 
-        if self._log_handler is not None:
-            self._log_handler.debug(
-                "#echo(__FILEPATH__)# -json.remove_node({0})- (#echo(__LINE__)#)",
-                node_path,
-            )
+        :param node_path_steps: Steps of the changed or removed node path
+        :param is_position_removed: True if a list entry has been removed and
+                                    all following positions shifted
 
-        _return = False
+        :since: v1.1.0
+        """
 
-        if isinstance(node_path, str):
-            """
-Get the parent node of the target.
-            """
+        node_path_length = len(node_path_steps)
+        node_parent_steps = node_path_steps[:-1]
+        node_name, node_position = node_path_steps[-1]
 
-            node_path_list = node_path.split(" ")
+        for node_cache_steps in list(self._node_cache):
+            if (
+                len(node_cache_steps) >= node_path_length
+                and node_cache_steps[: node_path_length - 1] == node_parent_steps
+            ):
+                node_cache_name, node_cache_position = node_cache_steps[
+                    node_path_length - 1
+                ]
+
+                if node_cache_name == node_name and (
+                    node_position < 0
+                    or node_cache_position == node_position
+                    or (is_position_removed and node_cache_position > node_position)
+                ):
+                    del self._node_cache[node_cache_steps]
 
-            node_path_count = len(node_path_list)
-            node_name = node_path if (node_path_count < 2) else None
+    def _reset_interning(self, interning=None):
+        """
+        Sets the string interning mode for the document loaded next and
+        discards the strings shared with the previous one.
 
-            if node_path_count > 1 or JsonResource.RE_NODE_POSITION.match(node_path):
-                if node_path_count > 1:
-                    node_name = node_path_list.pop()
-                    node_ptr = self._get_node_ptr(" ".join(node_path_list))
-                else:
-                    node_ptr = self._get_node_ptr(
-                        JsonResource.RE_NODE_POSITION.match(node_name).group(1)
-                    )
+        :param interning: String interning mode; None for "INTERNING_NONE"
 
-                if (
-                    self.data_cache_node != ""
-                    and node_path[: len(self.data_cache_node)] == self.data_cache_node
-                ):
-                    self.data_cache_node = ""
-                    self.data_cache_ptr = self._data
-            else:
-                node_ptr = self._data
+        :since: v1.1.0
+        """
 
-                self.data_cache_node = ""
-                self.data_cache_ptr = self._data
+        if interning is None:
+            interning = JsonResource.INTERNING_NONE
 
-            """
-Delete the node
-            """
+        self._intern_table = None if (interning == JsonResource.INTERNING_NONE) else {}
+        self._interning = interning
 
-            re_result = JsonResource.RE_NODE_POSITION.match(node_name)
+    def _reset_loaded_data(self, interning=None):
+        """
+        Discards the lazy source, cached node pointers, encoded fragments, the
+        node index and shared strings of the previously loaded data.
 
-            if re_result is None:
-                node_position = -1
-            else:
-                node_name = re_result.group(1)
-                node_position = int(re_result.group(2))
+        :param interning: String interning mode for the data loaded next;
+                          None for "INTERNING_NONE"
 
-            if isinstance(node_ptr, MutableMapping) and node_name in node_ptr:
-                del node_ptr[node_name]
-                _return = True
-            elif (
-                isinstance(node_ptr, MutableSequence)
-                and node_position >= 0
-                and node_position < len(node_ptr)
-            ):
-                del node_ptr[node_position]
-                _return = True
+        :since: v1.1.0
+        """
 
-        return _return
+        self._lazy_source = None
+        self._node_cache.clear()
+        self._reset_fragment_cache()
+        self._reset_interning(interning)
+        self._node_index = None
 
     def set_json(self, data_dict, overwrite=False):
         """
@@ -831,6 +2390,8 @@ Delete the node
             isinstance(data_dict, (Mapping, Sequence))
         ):
             self._data = data_dict
+            self._reset_loaded_data()
+
             _return = True
 
         return _return
@@ -853,76 +2414,285 @@ Delete the node
 
         _return = False
 
-        if isinstance(node_path, str):
-            if node_path == self.data_cache_node:
+        node_path = JsonResource.compile_node_path(node_path)
+
+        if node_path is not None and len(node_path) > 0:
+            if node_path.steps in self._node_cache:
+                self._node_cache.move_to_end(node_path.steps)
                 _return = True
-            else:
+            elif self._node_cache_size > 0:
                 node_ptr = self._get_node_ptr(node_path)
 
                 if node_ptr is not None:
-                    self.data_cache_node = node_path
-                    self.data_cache_ptr = node_ptr
+                    self._node_cache[node_path.steps] = node_ptr
+
+                    if len(self._node_cache) > self._node_cache_size:
+                        self._node_cache.popitem(False)
+
                     _return = True
 
         return _return
 
+    def stats(self):
+        """
+        Returns the collected instrumentation data and node cache statistics.
+
+        :return: (dict) Dict with "enabled", "operations" (see
+                 "JsonStats.get_operations()"), "bytes_in", "bytes_out",
+                 "node_cache" and "node_index"
+        :since:  v1.1.0
+        """
+
+        node_cache_lookups = self._node_cache_hits + self._node_cache_misses
+
+        return {
+            "enabled": self._stats is not None,
+            "operations": (
+                {} if (self._stats is None) else self._stats.get_operations()
+            ),
+            "bytes_in": 0 if (self._stats is None) else self._stats.bytes_in,
+            "bytes_out": 0 if (self._stats is None) else self._stats.bytes_out,
+            "node_cache": {
+                "entries": len(self._node_cache),
+                "hits": self._node_cache_hits,
+                "misses": self._node_cache_misses,
+                "hit_rate": (
+                    (self._node_cache_hits / node_cache_lookups)
+                    if (node_cache_lookups > 0)
+                    else 0.0
+                ),
+            },
+            "node_index": {
+                "entries": (0 if (self._node_index is None) else len(self._node_index)),
+                "size": self.node_index_size,
+            },
+        }
+
+    def _walk_node_ptr(self, node_ptr, node_path_steps):
+        """
+        Walks the given steps starting at the given node pointer.
+
+        :param node_ptr: JSON tree element to start at
+        :param node_path_steps: Tuple of node name and list position tuples
+
+        :return: (mixed) JSON tree element; None on error
+        :since:  v1.1.0
+        """
+
+        is_lazy = self._lazy_source is not None
+
+        for node_name, node_position in node_path_steps:
+            is_valid = False
+
+            if isinstance(node_ptr, Mapping) and node_name in node_ptr:
+                is_valid = True
+                node_parent_ptr = node_ptr
+                node_ptr = node_ptr[node_name]
+
+                if is_lazy and isinstance(node_ptr, JsonLazyValue):
+                    node_ptr = self._materialize_lazy_value(
+                        node_parent_ptr, node_name, node_ptr
+                    )
+
+            if (
+                node_position >= 0
+                and isinstance(node_ptr, Sequence)
+                and node_position < len(node_ptr)
+            ):
+                is_valid = True
+                node_parent_ptr = node_ptr
+                node_ptr = node_ptr[node_position]
+
+                if is_lazy and isinstance(node_ptr, JsonLazyValue):
+                    node_ptr = self._materialize_lazy_value(
+                        node_parent_ptr, node_position, node_ptr
+                    )
+
+            if not is_valid:
+                node_ptr = None
+                break
+
+        return node_ptr
+
     @staticmethod
-    def _find_string(data, end_tag, zone_tag=None):
+    def compile_node_path(node_path):
+        """
+        Returns the pre-compiled form of the given node path. Compiled paths
+        may be passed to all methods taking a node path.
+
+        :param node_path: Path to the node - delimiter is space
+
+        :return: (object) JsonNodePath instance; None if invalid
+        :since:  v1.1.0
         """
-        Searches the given data for a matching end tag. Sub zone end tags are
-        ignored.
 
-        :param data: Input data
-        :param end_tag: Ending delimiter
-        :param zone_tag: Zone start tag for sub zones
+        return JsonNodePath.compile(node_path)
 
-        :return: (str) Matched data; None if not found
-        :since:  v1.0.0
+    @staticmethod
+    def disable_parse_cache():
         """
+        Disables and clears the parse cache of "json_to_data_view()".
 
-        _return = None
+        :since: v1.1.0
+        """
+
+        JsonResource._parse_cache = None
 
-        zone_count = 0
+    @staticmethod
+    def enable_parse_cache(max_entries=None, max_size=None):
+        """
+        Enables a parse cache for "json_to_data_view()" returning the shared
+        view of identical input from memory. An enabled cache is cleared and
+        resized.
+
+        :param max_entries: Maximum number of cached entries
+        :param max_size: Maximum total length of the inputs cached
+
+        :since: v1.1.0
+        """
+
+        JsonResource._parse_cache = JsonParseCache(
+            (
+                JsonResource.PARSE_CACHE_ENTRIES
+                if (max_entries is None)
+                else max_entries
+            ),
+            JsonResource.PARSE_CACHE_SIZE if (max_size is None) else max_size,
+        )
+
+    @staticmethod
+    def parse_cache_stats():
+        """
+        Returns the counters of the parse cache of "json_to_data_view()".
+
+        :return: (dict) Dict with "enabled" and the counters returned by
+                 "JsonParseCache.stats()" if enabled
+        :since:  v1.1.0
+        """
+
+        parse_cache = JsonResource._parse_cache
+
+        _return = {"enabled": parse_cache is not None}
+
+        if parse_cache is not None:
+            _return.update(parse_cache.stats())
+
+        return _return
+
+    @staticmethod
+    def register_backend(implementation, backend):
+        """
+        Registers a JSON backend for the given implementation identifier.
+
+        :param implementation: Implementation identifier
+        :param backend: JsonBackend instance; None to unregister
+
+        :since: v1.1.0
+        """
 
-        if zone_tag is None:
-            cache = ""
+        if backend is None:
+            JsonResource._backends.pop(implementation, None)
         else:
-            cache = data[0]
-            data = data[1:]
+            JsonResource._backends[implementation] = backend
 
-        data_list = data.split(end_tag)
+    @staticmethod
+    def _get_json_string(data):
+        """
+        Returns the given string as an escaped JSON string.
 
-        if zone_tag is not None:
-            re_zone_tag = re.compile("([\\\\]*){0}".format(re.escape(zone_tag)))
+        :param data: String
 
-        while _return is None and len(data_list) > 0:
-            data = data_list.pop(0)
+        :return: (str) JSON string
+        :since:  v1.1.0
+        """
 
-            if zone_tag is not None:
-                for result in re_zone_tag.finditer(data):
-                    if len(result.group(1)) % 2 == 0:
-                        zone_count += 1
+        if JsonResource.RE_JSON_ESCAPE_CHARS.search(data) is not None:
+            data = data.translate(JsonResource.JSON_ESCAPE_TABLE)
 
-            re_result = JsonResource.RE_ESCAPED.search(data)
+        return '"' + data + '"'
 
-            if re_result is not None and (len(re_result.group(1)) % 2) == 1:
-                cache += data
-            elif len(data_list) > 0:
-                if zone_count:
-                    cache += data
-                    zone_count -= 1
-                else:
-                    _return = cache + data
+    @staticmethod
+    def _json_string_to_data(data, position, string_tag):
+        """
+        Decodes the JSON string starting at the given position. Escape sequences
+        are resolved while scanning.
+
+        :param data: Input JSON data
+        :param position: Position of the first character after the opening tag
+        :param string_tag: String delimiter used
+
+        :return: (tuple) Decoded string and the position after the closing tag
+        :since:  v1.1.0
+        """
+
+        re_string_chunk = (
+            JsonResource.RE_STRING_CHUNK
+            if (string_tag == '"')
+            else JsonResource.RE_SINGLE_QUOTED_STRING_CHUNK
+        )
+
+        re_result = re_string_chunk.match(data, position)
+
+        if re_result is None:
+            raise ValueError(
+                "Unterminated string starting at position {0:d}".format(position)
+            )
+
+        content, terminator = re_result.groups()
+
+        if terminator != "\\":
+            return content, re_result.end()
+
+        chunks = [content]
+
+        while terminator == "\\":
+            position = re_result.end()
+            escape_char = data[position]
+
+            if escape_char == "u":
+                if JsonResource.RE_UNICODE_ESCAPE.match(data, position + 1) is None:
+                    raise ValueError(
+                        "Invalid escape sequence at position {0:d}".format(position)
+                    )
+
+                code_point = int(data[position + 1 : position + 5], 16)
+                position += 5
+
+                if (
+                    0xD800 <= code_point <= 0xDBFF
+                    and data.startswith("\\u", position)
+                    and JsonResource.RE_UNICODE_ESCAPE.match(data, position + 2)
+                    is not None
+                ):
+                    code_point_low = int(data[position + 2 : position + 6], 16)
+
+                    if 0xDC00 <= code_point_low <= 0xDFFF:
+                        code_point = 0x10000 + (
+                            ((code_point - 0xD800) << 10) | (code_point_low - 0xDC00)
+                        )
+
+                        position += 6
+
+                chunks.append(chr(code_point))
+            elif escape_char in JsonResource.ESCAPE_SEQUENCES:
+                chunks.append(JsonResource.ESCAPE_SEQUENCES[escape_char])
+                position += 1
             else:
-                cache += data
+                raise ValueError(
+                    "Invalid escape sequence at position {0:d}".format(position)
+                )
 
-            if len(data_list) > 0:
-                if _return is not None and zone_tag is not None:
-                    _return += end_tag
-                else:
-                    cache += end_tag
+            re_result = re_string_chunk.match(data, position)
 
-        return _return
+            if re_result is None:
+                raise ValueError(
+                    "Unterminated string at position {0:d}".format(position)
+                )
+
+            content, terminator = re_result.groups()
+            chunks.append(content)
+
+        return "".join(chunks), re_result.end()
 
     @staticmethod
     def json_to_data(data):
@@ -941,3 +2711,79 @@ Delete the node
         json_resource.parse(data)
 
         return json_resource.data
+
+    @staticmethod
+    def json_to_data_view(data):
+        """
+        Converts JSON data into a read-only view of its Python representation.
+        Views of identical input are shared from the parse cache if enabled.
+
+        :param data: Input JSON data
+
+        :return: (mixed) Read-only view for structs; JSON data otherwise; None
+                 on error
+        :since:  v1.1.0
+        """
+
+        parse_cache = (
+            JsonResource._parse_cache if isinstance(data, (bytes, str)) else None
+        )
+
+        _return = None
+
+        if parse_cache is not None:
+            key = JsonParseCache.get_key(data)
+            _return = parse_cache.get(key, data)
+
+        if _return is None:
+            json_resource = JsonResource()
+            json_resource.parse(data)
+
+            """
+The view does not refer to the instance as the data contains no lazy values.
+            """
+
+            _return = get_json_view(None, json_resource._data)
+
+            if parse_cache is not None and _return is not None:
+                parse_cache.put(key, data, _return)
+
+        return _return
+
+
+JsonResource.register_backend(
+    JsonResource.IMPLEMENTATION_INTERNAL, InternalJsonBackend()
+)
+
+JsonResource.register_backend(JsonResource.IMPLEMENTATION_NATIVE, NativeJsonBackend())
+
+if MsgspecJsonBackend.is_available():
+    JsonResource.register_backend(
+        JsonResource.IMPLEMENTATION_MSGSPEC, MsgspecJsonBackend()
+    )
+
+if OrjsonJsonBackend.is_available():
+    JsonResource.register_backend(
+        JsonResource.IMPLEMENTATION_ORJSON, OrjsonJsonBackend()
+    )
+
+if UjsonJsonBackend.is_available():
+    JsonResource.register_backend(JsonResource.IMPLEMENTATION_UJSON, UjsonJsonBackend())
+
+
+def _decode_json_chunk(struct_type, implementation, data):
+    """
+    Decodes the given JSON data in a worker process.
+
+    :param struct_type: Dict implementation for new struct elements
+    :param implementation: Implementation identifier
+    :param data: Input JSON data
+
+    :return: (mixed) Python representation data; None on error
+    :since:  v1.1.0
+    """
+
+    json_resource = JsonResource(struct_type)
+    json_resource.implementation = implementation
+
+    return json_resource.backend.decode(json_resource, data)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from time import perf_counter
+
+from .json_snapshot_codec import JsonSnapshotCodec
+
+
+class JsonSnapshotMixin(object):
+    """
+    "JsonSnapshotMixin" saves the Python representation data to binary
+    snapshot files and loads it from them without parsing JSON text.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    SNAPSHOT_MAGIC = b"PPTJSNAP"
+    """
+Leading bytes of snapshot files
+    """
+    SNAPSHOT_VERSION = 2
+    """
+Version of the snapshot file format
+    """
+
+    __slots__ = ()
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def load_snapshot(self, file_path):
+        """
+        Loads the Python representation data from a snapshot file written by
+        "save_snapshot()". Objects are restored using "struct_type". The
+        snapshot is decoded by "JsonSnapshotCodec" and results in JSON types
+        only. Malformed snapshots and ones of other format versions are
+        rejected.
+
+        :param file_path: Path to the snapshot file
+
+        :return: (bool) True on success
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.load_snapshot({0})- (#echo(__LINE__)#)",
+                file_path,
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        _return = False
+
+        with open(file_path, "rb") as file_obj:
+            snapshot = file_obj.read()
+
+        header_length = 1 + len(JsonSnapshotMixin.SNAPSHOT_MAGIC)
+
+        if (
+            len(snapshot) > header_length
+            and snapshot.startswith(JsonSnapshotMixin.SNAPSHOT_MAGIC)
+            and snapshot[header_length - 1] == JsonSnapshotMixin.SNAPSHOT_VERSION
+        ):
+            try:
+                with memoryview(snapshot) as snapshot_view:
+                    with snapshot_view[header_length:] as payload_view:
+                        data = JsonSnapshotCodec.decode(payload_view, self.struct_type)
+
+                _return = True
+            except ValueError:
+                pass
+
+        if _return:
+            self._data = data
+            self._reset_loaded_data()
+
+        if started is not None:
+            self._stats.record("load_snapshot", started)
+
+        return _return
+
+    def save_snapshot(self, file_path):
+        """
+        Writes the Python representation data to a binary snapshot file that
+        is loaded without parsing JSON text. Equal strings are written once
+        and shared again after loading.
+
+        :param file_path: Path to the snapshot file
+
+        :return: (bool) False if the data can not be written or contains
+                 other types than JSON ones
+        :since:  v1.1.0
+        """
+
+        if self._log_handler is not None:
+            self._log_handler.debug(
+                "#echo(__FILEPATH__)# -json.save_snapshot({0})- (#echo(__LINE__)#)",
+                file_path,
+            )
+
+        started = None if (self._stats is None) else perf_counter()
+
+        if self._lazy_source is not None:
+            self._materialize_lazy_values(self._data)
+
+        try:
+            payload = JsonSnapshotCodec.encode(self._data)
+            _return = True
+        except (RecursionError, TypeError):
+            _return = False
+
+        if _return:
+            with open(file_path, "wb") as file_obj:
+                file_obj.write(
+                    JsonSnapshotMixin.SNAPSHOT_MAGIC
+                    + bytes((JsonSnapshotMixin.SNAPSHOT_VERSION,))
+                )
+
+                file_obj.write(payload)
+
+        if started is not None:
+            self._stats.record("save_snapshot", started)
+
+        return _return
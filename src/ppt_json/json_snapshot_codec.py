@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from struct import Struct, error as StructError
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+class JsonSnapshotCodec(object):
+    """
+    "JsonSnapshotCodec" encodes and decodes the self-describing binary
+    payload of snapshot files. Each value starts with a type tag byte.
+    Integers are written as zigzag encoded variable-length integers ("varint"),
+    floats as 8 byte IEEE 754 values and strings and lists are prefixed with
+    their varint length.
+
+    Each distinct string is written once and referenced by its varint position
+    in the string table afterwards. Objects refer to their tuple of keys
+    ("shape") the same way and are followed by their values only.
+
+    The payload is decoded by this class only. Malformed or truncated data
+    raises a "ValueError" and never results in other types than JSON ones.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    FLOAT_STRUCT = Struct("<d")
+    """
+Struct of encoded float values
+    """
+    TAG_NULL = 0
+    """
+Type tag of None
+    """
+    TAG_FALSE = 1
+    """
+Type tag of False
+    """
+    TAG_TRUE = 2
+    """
+Type tag of True
+    """
+    TAG_INT = 3
+    """
+Type tag of integers followed by the zigzag encoded varint value
+    """
+    TAG_FLOAT = 4
+    """
+Type tag of floats followed by the 8 byte IEEE 754 value
+    """
+    TAG_STRING = 5
+    """
+Type tag of strings followed by the varint length and the UTF-8 encoded value
+    """
+    TAG_STRING_REFERENCE = 6
+    """
+Type tag of strings followed by the varint position in the string table
+    """
+    TAG_LIST = 7
+    """
+Type tag of lists followed by the varint number of values
+    """
+    TAG_OBJECT = 8
+    """
+Type tag of objects followed by the varint position in the shape table and
+the values. The position of the next shape is followed by the varint number
+of keys and the keys defining it.
+    """
+
+    @staticmethod
+    def decode(data, struct_type=dict):
+        """
+        Decodes the given snapshot payload.
+
+        :param data: Snapshot payload bytes
+        :param struct_type: Mapping type used for objects
+
+        :return: (mixed) Python representation data
+        :since:  v1.1.0
+        """
+
+        try:
+            _return = JsonSnapshotCodec._decode(data, struct_type)
+        except (IndexError, StructError):
+            raise ValueError("Truncated snapshot data")
+
+        return _return
+
+    @staticmethod
+    def _decode(data, struct_type):
+        """
+        Decodes the given snapshot payload without recursion.
+
+        :param data: Snapshot payload bytes
+        :param struct_type: Mapping type used for objects
+
+        :return: (mixed) Python representation data
+        :since:  v1.1.0
+        """
+
+        read_float = JsonSnapshotCodec.FLOAT_STRUCT.unpack_from
+        read_varint = JsonSnapshotCodec._read_varint
+
+        tag_false = JsonSnapshotCodec.TAG_FALSE
+        tag_float = JsonSnapshotCodec.TAG_FLOAT
+        tag_int = JsonSnapshotCodec.TAG_INT
+        tag_list = JsonSnapshotCodec.TAG_LIST
+        tag_null = JsonSnapshotCodec.TAG_NULL
+        tag_object = JsonSnapshotCodec.TAG_OBJECT
+        tag_string = JsonSnapshotCodec.TAG_STRING
+        tag_string_reference = JsonSnapshotCodec.TAG_STRING_REFERENCE
+        tag_true = JsonSnapshotCodec.TAG_TRUE
+
+        _return = None
+
+        data_length = len(data)
+        position = 0
+        shapes = []
+        stack = []
+        strings = []
+
+        """
+"container" is the struct the values decoded are added to, "container_keys"
+its shape if it is an object and "remaining" the number of its values not
+decoded yet. Varints below 0x80 are read inline as they are the most common
+ones.
+        """
+
+        container = None
+        container_keys = None
+        remaining = 1
+
+        while True:
+            tag = data[position]
+            position += 1
+
+            keys = None
+            struct_length = 0
+
+            if tag == tag_string_reference:
+                value = data[position]
+                position += 1
+
+                if value > 0x7F:
+                    value, position = read_varint(data, position - 1)
+
+                value = strings[value]
+            elif tag == tag_string:
+                value = data[position]
+                position += 1
+
+                if value > 0x7F:
+                    value, position = read_varint(data, position - 1)
+
+                end_position = position + value
+
+                if end_position > data_length:
+                    raise ValueError("Truncated snapshot data")
+
+                value = str(data[position:end_position], "utf-8", "surrogatepass")
+                strings.append(value)
+                position = end_position
+            elif tag == tag_int:
+                value = data[position]
+                position += 1
+
+                if value > 0x7F:
+                    value, position = read_varint(data, position - 1)
+
+                value = (value >> 1) ^ -(value & 1)
+            elif tag == tag_float:
+                value = read_float(data, position)[0]
+                position += 8
+            elif tag == tag_null:
+                value = None
+            elif tag == tag_false:
+                value = False
+            elif tag == tag_true:
+                value = True
+            elif tag == tag_object:
+                value, position = read_varint(data, position)
+
+                if value == len(shapes):
+                    keys, position = JsonSnapshotCodec._read_keys(
+                        data, position, strings
+                    )
+
+                    shapes.append(keys)
+                else:
+                    keys = shapes[value]
+
+                struct_length = len(keys)
+                value = struct_type()
+            elif tag == tag_list:
+                struct_length = data[position]
+                position += 1
+
+                if struct_length > 0x7F:
+                    struct_length, position = read_varint(data, position - 1)
+
+                value = []
+            else:
+                raise ValueError(
+                    "Invalid type tag at position {0:d}".format(position - 1)
+                )
+
+            if container_keys is not None:
+                container[container_keys[-remaining]] = value
+            elif container is not None:
+                container.append(value)
+            else:
+                _return = value
+
+            remaining -= 1
+
+            if struct_length > 0:
+                stack.append((container, container_keys, remaining))
+
+                container = value
+                container_keys = keys
+                remaining = struct_length
+            else:
+                while remaining == 0 and len(stack) > 0:
+                    container, container_keys, remaining = stack.pop()
+
+                if remaining == 0:
+                    break
+
+        if position != data_length:
+            raise ValueError(
+                "Unexpected snapshot data at position {0:d}".format(position)
+            )
+
+        return _return
+
+    @staticmethod
+    def encode(data):
+        """
+        Encodes the given Python representation data. A "TypeError" is raised
+        if it contains other types than JSON ones.
+
+        :param data: Python representation data
+
+        :return: (bytes) Snapshot payload
+        :since:  v1.1.0
+        """
+
+        _return = bytearray()
+        JsonSnapshotCodec._encode_value(_return, {}, {}, data)
+
+        return bytes(_return)
+
+    @staticmethod
+    def _encode_value(buffer, strings, shapes, value):
+        """
+        Encodes the given value recursively.
+
+        :param buffer: Bytearray to write to
+        :param strings: Dict of strings written with their table position
+        :param shapes: Dict of object shapes written with their table position
+        :param value: Python representation data
+
+        :since: v1.1.0
+        """
+
+        value_type = type(value)
+
+        if value_type is str:
+            position = strings.get(value)
+
+            if position is None:
+                strings[value] = len(strings)
+                value = value.encode("utf-8", "surrogatepass")
+
+                buffer.append(JsonSnapshotCodec.TAG_STRING)
+                JsonSnapshotCodec._write_varint(buffer, len(value))
+                buffer += value
+            else:
+                buffer.append(JsonSnapshotCodec.TAG_STRING_REFERENCE)
+                JsonSnapshotCodec._write_varint(buffer, position)
+        elif value_type is int:
+            buffer.append(JsonSnapshotCodec.TAG_INT)
+
+            JsonSnapshotCodec._write_varint(
+                buffer, (value << 1) if (value >= 0) else ((-value << 1) - 1)
+            )
+        elif value_type is float:
+            buffer.append(JsonSnapshotCodec.TAG_FLOAT)
+            buffer += JsonSnapshotCodec.FLOAT_STRUCT.pack(value)
+        elif value is None:
+            buffer.append(JsonSnapshotCodec.TAG_NULL)
+        elif value_type is bool:
+            buffer.append(
+                JsonSnapshotCodec.TAG_TRUE if value else JsonSnapshotCodec.TAG_FALSE
+            )
+        elif isinstance(value, Mapping):
+            keys = tuple(value.keys())
+
+            """
+Shapes with keys of other types than str are identified by their types as well
+as 1, 1.0 and True are equal.
+            """
+
+            shape = (
+                keys
+                if all(type(key) is str for key in keys)
+                else tuple((type(key), key) for key in keys)
+            )
+
+            position = shapes.get(shape)
+
+            buffer.append(JsonSnapshotCodec.TAG_OBJECT)
+
+            if position is None:
+                JsonSnapshotCodec._write_varint(buffer, len(shapes))
+                shapes[shape] = len(shapes)
+
+                JsonSnapshotCodec._write_varint(buffer, len(keys))
+
+                for key in keys:
+                    if isinstance(key, Mapping):
+                        raise TypeError("Object keys of type dict are not supported")
+
+                    JsonSnapshotCodec._encode_value(buffer, strings, shapes, key)
+            else:
+                JsonSnapshotCodec._write_varint(buffer, position)
+
+            for item in value.values():
+                JsonSnapshotCodec._encode_value(buffer, strings, shapes, item)
+        elif isinstance(value, list):
+            buffer.append(JsonSnapshotCodec.TAG_LIST)
+            JsonSnapshotCodec._write_varint(buffer, len(value))
+
+            for item in value:
+                JsonSnapshotCodec._encode_value(buffer, strings, shapes, item)
+        else:
+            raise TypeError(
+                "Values of type {0} are not supported".format(value_type.__name__)
+            )
+
+    @staticmethod
+    def _read_keys(data, position, strings):
+        """
+        Reads the varint number of keys and the keys of an object shape.
+
+        :param data: Snapshot payload bytes
+        :param position: Position to read from
+        :param strings: List of strings read
+
+        :return: (tuple) Tuple of keys and position after it
+        :since:  v1.1.0
+        """
+
+        keys = []
+        length, position = JsonSnapshotCodec._read_varint(data, position)
+
+        for _ in range(length):
+            tag = data[position]
+            position += 1
+
+            if tag == JsonSnapshotCodec.TAG_STRING_REFERENCE:
+                key, position = JsonSnapshotCodec._read_varint(data, position)
+                key = strings[key]
+            elif tag == JsonSnapshotCodec.TAG_STRING:
+                key, position = JsonSnapshotCodec._read_varint(data, position)
+                end_position = position + key
+
+                if end_position > len(data):
+                    raise ValueError("Truncated snapshot data")
+
+                key = str(data[position:end_position], "utf-8", "surrogatepass")
+                strings.append(key)
+                position = end_position
+            elif tag == JsonSnapshotCodec.TAG_INT:
+                key, position = JsonSnapshotCodec._read_varint(data, position)
+                key = (key >> 1) ^ -(key & 1)
+            elif tag == JsonSnapshotCodec.TAG_FLOAT:
+                key = JsonSnapshotCodec.FLOAT_STRUCT.unpack_from(data, position)[0]
+                position += 8
+            elif tag == JsonSnapshotCodec.TAG_NULL:
+                key = None
+            elif tag == JsonSnapshotCodec.TAG_FALSE:
+                key = False
+            elif tag == JsonSnapshotCodec.TAG_TRUE:
+                key = True
+            else:
+                raise ValueError(
+                    "Object key expected at position {0:d}".format(position - 1)
+                )
+
+            keys.append(key)
+
+        return (tuple(keys), position)
+
+    @staticmethod
+    def _read_varint(data, position):
+        """
+        Reads an unsigned variable-length integer. Each byte holds 7 bits of
+        the value starting with the least significant ones. The highest bit is
+        set if another byte follows.
+
+        :param data: Snapshot payload bytes
+        :param position: Position to read from
+
+        :return: (tuple) Integer value and position after it
+        :since:  v1.1.0
+        """
+
+        _return = data[position]
+        position += 1
+
+        if _return > 0x7F:
+            _return &= 0x7F
+            shift = 7
+
+            while True:
+                byte = data[position]
+                position += 1
+
+                _return |= (byte & 0x7F) << shift
+
+                if byte < 0x80:
+                    break
+
+                shift += 7
+
+        return (_return, position)
+
+    @staticmethod
+    def _write_varint(buffer, value):
+        """
+        Writes an unsigned variable-length integer.
+
+        :param buffer: Bytearray to write to
+        :param value: Non-negative integer value
+
+        :since: v1.1.0
+        """
+
+        while value > 0x7F:
+            buffer.append(0x80 | (value & 0x7F))
+            value >>= 7
+
+        buffer.append(value)
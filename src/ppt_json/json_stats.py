@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from threading import Lock
+from time import perf_counter
+
+
+class JsonStats(object):
+    """
+    "JsonStats" collects operation counters, latency histograms and the
+    number of UTF-8 encoded bytes read and written.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    HISTOGRAM_BUCKETS = 32
+    """
+Number of latency histogram buckets. Bucket N counts operations taking less
+than 2^N microseconds; the last one counts all slower operations.
+    """
+
+    __slots__ = ("_lock", "_operations", "bytes_in", "bytes_out")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+        Constructor __init__(JsonStats)
+
+        :since: v1.1.0
+        """
+
+        self._lock = Lock()
+        """
+Lock guarding the counters
+        """
+        self._operations = {}
+        """
+Count, total duration and histogram list by operation name
+        """
+        self.bytes_in = 0
+        """
+Number of UTF-8 encoded JSON bytes parsed
+        """
+        self.bytes_out = 0
+        """
+Number of UTF-8 encoded JSON bytes exported
+        """
+
+    def get_operations(self):
+        """
+        Returns the counters and latency histograms of all recorded
+        operations.
+
+        :return: (dict) Dict of operation names to dicts with "count",
+                 "seconds" and "histogram" (upper bound in microseconds to
+                 number of operations)
+        :since:  v1.1.0
+        """
+
+        with self._lock:
+            _return = {
+                operation: {
+                    "count": count,
+                    "seconds": seconds,
+                    "histogram": {
+                        (1 << bucket): bucket_count
+                        for bucket, bucket_count in enumerate(histogram)
+                        if bucket_count > 0
+                    },
+                }
+                for operation, (count, seconds, histogram) in self._operations.items()
+            }
+
+        return _return
+
+    def record(self, operation, started, bytes_in=0, bytes_out=0):
+        """
+        Records an operation started at the given "perf_counter()" value.
+
+        :param operation: Operation name
+        :param started: "perf_counter()" value at the start of the operation
+        :param bytes_in: Number of UTF-8 encoded JSON bytes parsed
+        :param bytes_out: Number of UTF-8 encoded JSON bytes exported
+
+        :since: v1.1.0
+        """
+
+        duration = perf_counter() - started
+
+        bucket = min(
+            int(duration * 1000000).bit_length(), JsonStats.HISTOGRAM_BUCKETS - 1
+        )
+
+        with self._lock:
+            if operation not in self._operations:
+                self._operations[operation] = [
+                    0,
+                    0.0,
+                    [0] * JsonStats.HISTOGRAM_BUCKETS,
+                ]
+
+            operation_stats = self._operations[operation]
+
+            operation_stats[0] += 1
+            operation_stats[1] += duration
+            operation_stats[2][bucket] += 1
+
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+
+    @staticmethod
+    def get_size(data):
+        """
+        Returns the size of the given JSON data UTF-8 encoded. Strings are
+        only encoded if they contain non-ASCII characters.
+
+        :param data: JSON data
+
+        :return: (int) Size in bytes
+        :since:  v1.1.0
+        """
+
+        if isinstance(data, str) and not data.isascii():
+            data = data.encode("utf-8", "surrogatepass")
+
+        return len(data)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from copy import deepcopy
+
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:
+    from collections import Mapping, Sequence
+
+from .json_lazy_source import JsonLazyValue
+
+
+class JsonMappingView(Mapping):
+    """
+    "JsonMappingView" is a read-only proxy of a JSON object of the live tree.
+    Nested structs are returned as views created on access.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ("_json_resource", "_struct")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, json_resource, struct):
+        """
+        Constructor __init__(JsonMappingView)
+
+        :param json_resource: JsonResource instance owning the struct; None
+                              if the struct contains no lazy values
+        :param struct: JSON object of the live tree
+
+        :since: v1.1.0
+        """
+
+        self._json_resource = json_resource
+        """
+JsonResource instance used to decode lazy values
+        """
+        self._struct = struct
+        """
+JSON object of the live tree
+        """
+
+    def __contains__(self, key):
+        """
+        python.org: Called to implement membership test operators.
+
+        :param key: Object key
+
+        :return: (bool) True if the key exists
+        :since:  v1.1.0
+        """
+
+        return key in self._struct
+
+    def __getitem__(self, key):
+        """
+        python.org: Called to implement evaluation of self[key].
+
+        :param key: Object key
+
+        :return: (mixed) Value; read-only view for structs
+        :since:  v1.1.0
+        """
+
+        return get_json_view(
+            self._json_resource,
+            _get_json_value(self._json_resource, self._struct, key),
+        )
+
+    def __iter__(self):
+        """
+        python.org: Return an iterator object.
+
+        :return: (object) Iterator over the object keys
+        :since:  v1.1.0
+        """
+
+        return iter(self._struct)
+
+    def __len__(self):
+        """
+        python.org: Called to implement the built-in function len().
+
+        :return: (int) Number of object keys
+        :since:  v1.1.0
+        """
+
+        return len(self._struct)
+
+    def __repr__(self):
+        """
+        python.org: Called by the repr() built-in function to compute the
+        "official" string representation of an object.
+
+        :return: (str) String representation
+        :since:  v1.1.0
+        """
+
+        return "<{0} {1!r}>".format(self.__class__.__name__, self._struct)
+
+
+class JsonSequenceView(Sequence):
+    """
+    "JsonSequenceView" is a read-only proxy of a JSON list of the live tree.
+    Nested structs are returned as views created on access.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ("_json_resource", "_struct")
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, json_resource, struct):
+        """
+        Constructor __init__(JsonSequenceView)
+
+        :param json_resource: JsonResource instance owning the struct; None
+                              if the struct contains no lazy values
+        :param struct: JSON list of the live tree
+
+        :since: v1.1.0
+        """
+
+        self._json_resource = json_resource
+        """
+JsonResource instance used to decode lazy values
+        """
+        self._struct = struct
+        """
+JSON list of the live tree
+        """
+
+    def __eq__(self, other):
+        """
+        python.org: The correspondence between operator symbols and method names
+        is as follows: x==y calls x.__eq__(y)
+
+        :param other: Object to compare with
+
+        :return: (bool) True if equal
+        :since:  v1.1.0
+        """
+
+        if not isinstance(other, Sequence) or isinstance(other, (bytes, str)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            value == other_value for value, other_value in zip(self, other)
+        )
+
+    __hash__ = None
+    """
+Views of mutable structs are unhashable
+    """
+
+    def __getitem__(self, index):
+        """
+        python.org: Called to implement evaluation of self[key].
+
+        :param index: List position or slice
+
+        :return: (mixed) Value; read-only view for structs; tuple for slices
+        :since:  v1.1.0
+        """
+
+        if isinstance(index, slice):
+            _return = tuple(
+                self[position] for position in range(*index.indices(len(self._struct)))
+            )
+        else:
+            if index < 0:
+                index += len(self._struct)
+
+                if index < 0:
+                    raise IndexError("list index out of range")
+
+            _return = get_json_view(
+                self._json_resource,
+                _get_json_value(self._json_resource, self._struct, index),
+            )
+
+        return _return
+
+    def __iter__(self):
+        """
+        python.org: Return an iterator object.
+
+        :return: (object) Generator yielding each value; read-only views for
+                 structs
+        :since:  v1.1.0
+        """
+
+        for position in range(len(self._struct)):
+            yield self[position]
+
+    def __len__(self):
+        """
+        python.org: Called to implement the built-in function len().
+
+        :return: (int) Number of list entries
+        :since:  v1.1.0
+        """
+
+        return len(self._struct)
+
+    def __repr__(self):
+        """
+        python.org: Called by the repr() built-in function to compute the
+        "official" string representation of an object.
+
+        :return: (str) String representation
+        :since:  v1.1.0
+        """
+
+        return "<{0} {1!r}>".format(self.__class__.__name__, self._struct)
+
+
+def get_json_view(json_resource, value):
+    """
+    Returns a read-only view for the given value of the live tree.
+
+    :param json_resource: JsonResource instance owning the value; None if the
+                          value contains no lazy values
+    :param value: JSON tree element
+
+    :return: (mixed) Read-only view for structs; the value otherwise
+    :since:  v1.1.0
+    """
+
+    if isinstance(value, Mapping):
+        _return = JsonMappingView(json_resource, value)
+    elif isinstance(value, list):
+        _return = JsonSequenceView(json_resource, value)
+    else:
+        _return = value
+
+    return _return
+
+
+def get_json_view_copy(value):
+    """
+    Returns a read-only view of a deep copy of the struct of the given view.
+
+    :param value: Read-only view or other value
+
+    :return: (mixed) Read-only view of the copied struct; the value otherwise
+    :since:  v1.1.0
+    """
+
+    if isinstance(value, (JsonMappingView, JsonSequenceView)):
+        value = get_json_view(None, deepcopy(value._struct))
+
+    return value
+
+
+def _get_json_value(json_resource, struct, key):
+    """
+    Returns the value of the given key and decodes it if not done yet in lazy
+    mode.
+
+    :param json_resource: JsonResource instance owning the struct
+    :param struct: JSON tree element
+    :param key: Object key or list position
+
+    :return: (mixed) JSON tree element
+    :since:  v1.1.0
+    """
+
+    _return = struct[key]
+
+    if isinstance(_return, JsonLazyValue):
+        _return = json_resource._materialize_lazy_value(struct, key, _return)
+
+    return _return
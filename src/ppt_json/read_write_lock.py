@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+# pylint: disable=invalid-name
+
+from threading import Condition, get_ident, local
+
+
+class ReadWriteLock(object):
+    """
+    "ReadWriteLock" allows many concurrent readers or one exclusive writer.
+    Waiting writers block new readers to prevent writer starvation. Both
+    locks are reentrant for the owning thread and the write lock owner may
+    acquire the read lock as well.
+
+    :author:     Tobias "NotTheEvilOne" Wolf et al.
+    :copyright:  Tobias "NotTheEvilOne" Wolf - All rights reserved
+    :package:    ppt
+    :since:      v1.1.0
+    :license:    http://mozilla.org/MPL/2.0/
+                 Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = (
+        "_condition",
+        "_readers",
+        "_thread_local",
+        "_writer",
+        "_writer_depth",
+        "_writers_waiting",
+    )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+        Constructor __init__(ReadWriteLock)
+
+        :since: v1.1.0
+        """
+
+        self._condition = Condition()
+        """
+Condition guarding the lock state
+        """
+        self._readers = 0
+        """
+Number of threads holding the read lock
+        """
+        self._thread_local = local()
+        """
+Read lock depth of the current thread
+        """
+        self._writer = None
+        """
+Identifier of the thread holding the write lock
+        """
+        self._writer_depth = 0
+        """
+Number of nested acquisitions by the write lock owner
+        """
+        self._writers_waiting = 0
+        """
+Number of threads waiting for the write lock
+        """
+
+    def acquire_read(self):
+        """
+        Acquires the read lock.
+
+        :since: v1.1.0
+        """
+
+        thread_local = self._thread_local
+        read_depth = getattr(thread_local, "read_depth", 0)
+
+        if read_depth > 0:
+            thread_local.read_depth = 1 + read_depth
+        elif self._writer == get_ident():
+            self._writer_depth += 1
+        else:
+            condition = self._condition
+
+            with condition:
+                while self._writer is not None or self._writers_waiting > 0:
+                    condition.wait()
+
+                self._readers += 1
+
+            thread_local.read_depth = 1
+
+    def acquire_write(self):
+        """
+        Acquires the write lock.
+
+        :since: v1.1.0
+        """
+
+        thread_id = get_ident()
+
+        if self._writer == thread_id:
+            self._writer_depth += 1
+        else:
+            if getattr(self._thread_local, "read_depth", 0) > 0:
+                raise RuntimeError("Read lock held can not be upgraded")
+
+            with self._condition:
+                self._writers_waiting += 1
+
+                try:
+                    while self._writer is not None or self._readers > 0:
+                        self._condition.wait()
+                finally:
+                    self._writers_waiting -= 1
+
+                self._writer = thread_id
+                self._writer_depth = 1
+
+    def release_read(self):
+        """
+        Releases the read lock.
+
+        :since: v1.1.0
+        """
+
+        thread_local = self._thread_local
+        read_depth = getattr(thread_local, "read_depth", 0)
+
+        if read_depth > 1:
+            thread_local.read_depth = read_depth - 1
+        elif read_depth == 1:
+            thread_local.read_depth = 0
+            condition = self._condition
+
+            with condition:
+                self._readers -= 1
+
+                if self._readers == 0 and self._writers_waiting > 0:
+                    condition.notify_all()
+        elif self._writer == get_ident():
+            self._writer_depth -= 1
+        else:
+            raise RuntimeError("Read lock released without being held")
+
+    def release_write(self):
+        """
+        Releases the write lock.
+
+        :since: v1.1.0
+        """
+
+        if self._writer != get_ident():
+            raise RuntimeError("Write lock released without being held")
+
+        self._writer_depth -= 1
+
+        if self._writer_depth == 0:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import unittest
+
+from ppt_json import AsyncJsonResource, JsonResource
+
+
+class _BufferWriter(object):
+    """
+    asyncio stream writer collecting all written data.
+    """
+
+    def __init__(self):
+        self.data = b""
+        self.drain_count = 0
+
+    async def drain(self):
+        self.drain_count += 1
+
+    def write(self, data):
+        self.data += data
+
+
+class TestAsyncJsonResource(unittest.TestCase):
+    """
+    Unittest for AsyncJsonResource
+
+    :since: v1.1.0
+    """
+
+    def _get_reader(self, data):
+        """
+        Returns an asyncio stream reader providing the given data.
+
+        :return: (object) asyncio stream reader
+        """
+
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+
+        return reader
+
+    def test_parse_export(self):
+        """
+        Tests parsing from and exporting to asyncio streams.
+        """
+
+        data = {"items": [{"id": i, "name": "ä{0:d}".format(i)} for i in range(5000)]}
+        data_json = json.dumps(data).encode("utf-8")
+
+        async def run(implementation, offload_size):
+            json_resource = AsyncJsonResource(
+                executor=ThreadPoolExecutor(1),
+                offload_size=offload_size,
+                time_slice=0,
+            )
+
+            json_resource.implementation = implementation
+
+            await json_resource.aparse(self._get_reader(data_json))
+            self.assertEqual(data, json_resource.data)
+
+            writer = _BufferWriter()
+
+            data_size = await json_resource.aexport(writer)
+
+            self.assertEqual(len(writer.data), data_size)
+            self.assertEqual(data, json.loads(writer.data))
+            self.assertGreater(writer.drain_count, 1)
+
+            await json_resource.aparse(self._get_reader(b'{"a": [1,'))
+            self.assertIsNone(json_resource.data)
+
+            json_resource.enable_incremental_export()
+            json_resource.parse('{"a": [1]}', True, JsonResource.INTERNING_STRINGS)
+            json_resource.export_data()
+
+            await json_resource.aparse(self._get_reader(b'{"b": "c"}'))
+
+            self.assertEqual({"b": "c"}, json.loads(json_resource.export_data()))
+            self.assertIsNone(json_resource._intern_table)
+
+            json_resource.executor.shutdown()
+
+        for implementation, offload_size in (
+            (JsonResource.IMPLEMENTATION_INTERNAL, None),
+            (JsonResource.IMPLEMENTATION_NATIVE, None),
+            (JsonResource.IMPLEMENTATION_NATIVE, 0),
+        ):
+            asyncio.run(run(implementation, offload_size))
+
+    def test_node_coroutines(self):
+        """
+        Tests reading and changing nodes with coroutines.
+        """
+
+        async def run():
+            json_resource = AsyncJsonResource()
+            await json_resource.aparse(self._get_reader(b'{"a": {"b": [1, 2]}}'))
+
+            self.assertTrue(await json_resource.achange_node("a b#0", 3))
+            self.assertTrue(await json_resource.aadd_node("a c", "d"))
+            self.assertEqual(2, await json_resource.acount_node("a b"))
+            self.assertEqual([3, "d"], await json_resource.aget_nodes(["a b#0", "a c"]))
+            self.assertTrue(await json_resource.aremove_node("a b"))
+            self.assertEqual({"c": "d"}, await json_resource.aget_node("a"))
+
+        asyncio.run(run())
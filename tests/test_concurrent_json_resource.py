@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from threading import Barrier, Thread
+import json
+import sys
+import unittest
+
+from ppt_json import ConcurrentJsonResource, ReadWriteLock
+
+
+class TestConcurrentJsonResource(unittest.TestCase):
+    """
+    Unittest for ConcurrentJsonResource
+
+    :since: v1.1.0
+    """
+
+    def setUp(self):
+        """
+        Lowers the thread switch interval to provoke interleaving.
+        """
+
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        """
+        Restores the thread switch interval.
+        """
+
+        sys.setswitchinterval(self._switch_interval)
+
+    def test_read_write_lock(self):
+        """
+        Tests reentrancy of the read and write lock.
+        """
+
+        lock = ReadWriteLock()
+
+        lock.acquire_read()
+        lock.acquire_read()
+
+        with self.assertRaises(RuntimeError):
+            lock.acquire_write()
+
+        lock.release_read()
+        lock.release_read()
+
+        with self.assertRaises(RuntimeError):
+            lock.release_read()
+
+        lock.acquire_write()
+        lock.acquire_read()
+        lock.acquire_write()
+        lock.release_write()
+        lock.release_read()
+        lock.release_write()
+
+        with self.assertRaises(RuntimeError):
+            lock.release_write()
+
+    def test_cached_nodes_per_thread(self):
+        """
+        Tests that cached node pointers are kept per thread.
+        """
+
+        json_resource = ConcurrentJsonResource()
+        json_resource.parse('{"a": {"x": 1}, "b": {"x": 2}}')
+
+        barrier = Barrier(2)
+        results = {}
+
+        def read(node_path):
+            barrier.wait()
+            json_resource.set_cached_node(node_path)
+            barrier.wait()
+
+            results[node_path] = (
+                json_resource.data_cache_node,
+                json_resource.data_cache_ptr,
+            )
+
+        threads = [Thread(target=read, args=(node_path,)) for node_path in "ab"]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({"a": ("a", {"x": 1}), "b": ("b", {"x": 2})}, results)
+        self.assertEqual("", json_resource.data_cache_node)
+
+        json_resource.set_cached_node("a")
+        json_resource.change_node("b x", 3)
+
+        self.assertEqual("", json_resource.data_cache_node)
+
+    def test_iter_with_changes(self):
+        """
+        Tests changing the data while iterating and closing iterators in
+        another thread.
+        """
+
+        json_resource = ConcurrentJsonResource()
+        json_resource.parse('{"items": [{"id": 0}, {"id": 1}, {"id": 2}]}')
+
+        for position, node in enumerate(json_resource.iter_nodes("items#*")):
+            json_resource.change_node(
+                "items#{0:d} id".format(position), node["id"] + 10
+            )
+
+        self.assertEqual(
+            [10, 11, 12], [node["id"] for node in json_resource.get_node("items")]
+        )
+
+        parts = json_resource.iter_json()
+        next(parts)
+
+        thread = Thread(target=json_resource.change_node, args=("items#0 id", 0))
+        thread.start()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(0, json_resource.get_node("items#0 id"))
+
+        del parts
+
+        self.assertEqual(
+            json_resource.data, json.loads("".join(json_resource.iter_json()))
+        )
+
+    def test_locked_properties(self):
+        """
+        Tests reading the data and recording patches while other threads
+        change the data.
+        """
+
+        json_resource = ConcurrentJsonResource()
+        json_resource.parse("{}")
+        json_resource.build_index()
+
+        errors = []
+
+        def read():
+            try:
+                for _ in range(500):
+                    data = json_resource.data
+                    len(json_resource.data_view)
+                    json_resource.node_index_size
+
+                    if len(data) != len(json.loads(json.dumps(data))):
+                        errors.append(data)
+            except Exception as handled_exception:
+                errors.append(handled_exception)
+
+        def write(thread_id):
+            try:
+                for iteration in range(500):
+                    with json_resource.record_patch():
+                        json_resource.add_node(
+                            "k{0:d}_{1:d}".format(thread_id, iteration), iteration
+                        )
+
+                    json_resource.implementation = (
+                        ConcurrentJsonResource.IMPLEMENTATION_INTERNAL
+                        if (iteration % 2)
+                        else ConcurrentJsonResource.IMPLEMENTATION_NATIVE
+                    )
+            except Exception as handled_exception:
+                errors.append(handled_exception)
+
+        threads = [Thread(target=read) for _ in range(2)]
+        threads += [Thread(target=write, args=(i,)) for i in range(2)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(1000, len(json_resource.data))
+        self.assertIsNone(json_resource._patch_recorders)
+
+    def test_view_copies(self):
+        """
+        Tests read-only views referring to a copy of the data.
+        """
+
+        json_resource = ConcurrentJsonResource()
+        json_resource.parse('{"a": {"b": [1, 2]}}')
+
+        data_view = json_resource.data_view
+        node_view = json_resource.get_node_view("a b")
+
+        json_resource.change_node("a b#0", 3)
+        json_resource.add_node("c", 4)
+
+        self.assertEqual({"a": {"b": [1, 2]}}, data_view)
+        self.assertEqual([1, 2], node_view)
+        self.assertEqual(3, json_resource.get_node_view("a b#0"))
+
+    def test_stats(self):
+        """
+        Tests recording statistics of concurrent readers.
+        """
+
+        json_resource = ConcurrentJsonResource()
+        json_resource.parse('{"a": 1}')
+        json_resource.enable_stats()
+
+        def read():
+            for _ in range(1000):
+                json_resource.get_node("a")
+
+        threads = [Thread(target=read) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(4000, json_resource.stats()["operations"]["get_node"]["count"])
+
+        errors = []
+
+        def toggle():
+            for _ in range(200):
+                json_resource.disable_stats()
+                json_resource.enable_stats()
+
+        def read_checked():
+            try:
+                read()
+            except Exception as handled_exception:
+                errors.append(handled_exception)
+
+        threads = [Thread(target=read_checked) for _ in range(4)]
+        threads.append(Thread(target=toggle))
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+
+    def test_stress(self):
+        """
+        Tests concurrent readers and writers for consistent results.
+        """
+
+        items_count = 20
+        json_resource = ConcurrentJsonResource()
+
+        json_resource.parse(
+            json.dumps(
+                {"items": [{"id": i, "a": 0, "b": 0} for i in range(items_count)]}
+            )
+        )
+
+        errors = []
+
+        def read(thread_id):
+            for iteration in range(2000):
+                position = (thread_id + iteration) % items_count
+                node_path = "items#{0:d}".format(position)
+
+                json_resource.set_cached_node(node_path)
+                data = json_resource.get_node(node_path)
+
+                if data["id"] != position or data["a"] != data["b"]:
+                    errors.append(data)
+
+                if json_resource.data_cache_node not in ("", node_path):
+                    errors.append(json_resource.data_cache_node)
+
+        def write(thread_id):
+            for iteration in range(500):
+                position = (thread_id * 7 + iteration) % items_count
+
+                json_resource.change_node(
+                    "items#{0:d}".format(position),
+                    {"id": position, "a": iteration, "b": iteration},
+                )
+
+                if iteration % 50 == 0:
+                    json_resource.build_index()
+
+        threads = [Thread(target=read, args=(i,)) for i in range(4)]
+        threads += [Thread(target=write, args=(i,)) for i in range(2)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(items_count, len(json_resource.get_node("items")))
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from collections import OrderedDict
+from io import StringIO
+import json
+import unittest
+
+from ppt_json import JsonBackend, JsonResource
+from ppt_json.json_backends import (
+    MsgspecJsonBackend,
+    OrjsonJsonBackend,
+    UjsonJsonBackend,
+)
+
+
+class TestJsonBackends(unittest.TestCase):
+    """
+    Unittest for JsonBackend implementations
+
+    :since: v1.1.0
+    """
+
+    def _get_json_test_data(self):
+        """
+        Test data with nested structs, escape sequences and all value types.
+
+        :return: (str) Test data
+        """
+
+        return """
+{
+"hello": "w\\u00f6rld \\"quoted\\"",
+"more_complex": [ "this", "that", true, false, null, 1, -2.5e3, {} ],
+"nested": { "list": [ [], { "key": "value" } ] }
+}
+        """
+
+    def _test_backend(self, implementation):
+        """
+        Tests parsing and encoding with the given implementation.
+
+        :param implementation: Implementation identifier
+        """
+
+        data = self._get_json_test_data()
+        expected_data = json.loads(data)
+
+        json_resource = JsonResource()
+        json_resource.implementation = implementation
+
+        self.assertEqual(implementation, json_resource.implementation)
+
+        json_resource.parse(data)
+
+        self.assertEqual(expected_data, json_resource.data)
+        self.assertEqual(expected_data, json.loads(json_resource.export_data()))
+
+        json_resource.parse('{"a": 1')
+        self.assertIsNone(json_resource.data)
+
+        json_resource.set_json({"data": OrderedDict(a=(1, 2)), (1, 2): "skipped"})
+
+        self.assertEqual({"data": {"a": [1, 2]}}, json.loads(json_resource.json))
+
+        file_obj = StringIO()
+        json_resource.export_to(file_obj)
+
+        self.assertEqual({"data": {"a": [1, 2]}}, json.loads(file_obj.getvalue()))
+
+    def test_auto(self):
+        """
+        Tests the backend selection of "IMPLEMENTATION_AUTO".
+        """
+
+        json_resource = JsonResource()
+        json_resource.implementation = JsonResource.IMPLEMENTATION_AUTO
+
+        self.assertEqual(
+            max(
+                backend.PRIORITY
+                for backend in (
+                    JsonResource._backends[implementation]
+                    for implementation in JsonResource._backends
+                )
+            ),
+            json_resource.backend.PRIORITY,
+        )
+
+        json_resource = JsonResource(OrderedDict)
+        json_resource.implementation = JsonResource.IMPLEMENTATION_AUTO
+
+        self.assertEqual(
+            JsonResource.IMPLEMENTATION_INTERNAL, json_resource.implementation
+        )
+
+        json_resource = JsonResource(skipkeys=False)
+        json_resource.implementation = JsonResource.IMPLEMENTATION_AUTO
+
+        self.assertEqual(
+            JsonResource.IMPLEMENTATION_NATIVE, json_resource.implementation
+        )
+
+        with self.assertRaises(TypeError):
+            json_resource.data_to_json({(1, 2): "not skipped"})
+
+    def test_internal(self):
+        """
+        Tests the internal backend.
+        """
+
+        self._test_backend(JsonResource.IMPLEMENTATION_INTERNAL)
+
+    def test_native(self):
+        """
+        Tests the native backend.
+        """
+
+        self._test_backend(JsonResource.IMPLEMENTATION_NATIVE)
+
+    @unittest.skipUnless(MsgspecJsonBackend.is_available(), "msgspec not installed")
+    def test_msgspec(self):
+        """
+        Tests the "msgspec" backend.
+        """
+
+        self._test_backend(JsonResource.IMPLEMENTATION_MSGSPEC)
+
+    @unittest.skipUnless(OrjsonJsonBackend.is_available(), "orjson not installed")
+    def test_orjson(self):
+        """
+        Tests the "orjson" backend.
+        """
+
+        self._test_backend(JsonResource.IMPLEMENTATION_ORJSON)
+
+    @unittest.skipUnless(UjsonJsonBackend.is_available(), "ujson not installed")
+    def test_ujson(self):
+        """
+        Tests the "ujson" backend.
+        """
+
+        self._test_backend(JsonResource.IMPLEMENTATION_UJSON)
+
+    def test_auto_results(self):
+        """
+        Tests "IMPLEMENTATION_AUTO" decoding the same results as the native
+        backend.
+        """
+
+        json_resource = JsonResource()
+        json_resource.implementation = JsonResource.IMPLEMENTATION_AUTO
+
+        for data in (
+            '{"a": 12345678901234567890123}',
+            "[-9223372036854775809, 18446744073709551616]",
+            "[NaN, Infinity, -Infinity]",
+            "[1e400]",
+            '["\\ud800"]',
+        ):
+            self.assertEqual(
+                repr(json.loads(data)), repr(json_resource.json_to_data(data))
+            )
+
+        self.assertIsNone(json_resource.json_to_data("[1, "))
+
+        with self.assertRaises(TypeError):
+            JsonBackend()
+
+    def test_auto_export(self):
+        """
+        Tests "IMPLEMENTATION_AUTO" and the bundled backends except the internal
+        one encoding the same output as the native backend.
+        """
+
+        data = {"a": [1, 2], "b": float("nan"), 1: 2.5, (1, 2): "skipped"}
+
+        native_json_resource = JsonResource()
+        native_json_resource.implementation = JsonResource.IMPLEMENTATION_NATIVE
+        native_json_resource.set_json(data)
+
+        expected_json = native_json_resource.export_data()
+
+        for struct_type in (dict, OrderedDict):
+            json_resource = JsonResource(struct_type)
+            json_resource.implementation = JsonResource.IMPLEMENTATION_AUTO
+            json_resource.set_json(data)
+
+            self.assertEqual(expected_json, json_resource.export_data())
+            self.assertEqual(expected_json, "".join(json_resource.iter_json()))
+
+        for implementation in (
+            JsonResource.IMPLEMENTATION_MSGSPEC,
+            JsonResource.IMPLEMENTATION_ORJSON,
+            JsonResource.IMPLEMENTATION_UJSON,
+        ):
+            json_resource = JsonResource()
+            json_resource.implementation = implementation
+            json_resource.set_json(data)
+
+            if json_resource.implementation == implementation:
+                self.assertEqual(expected_json, json_resource.export_data())
+
+    def test_register_backend(self):
+        """
+        Tests registering a custom backend.
+        """
+
+        class UpperJsonBackend(JsonBackend):
+            PRIORITY = 100
+
+            def decode(self, json_resource, data):
+                return json.loads(data.upper())
+
+            def encode(self, json_resource, data):
+                return json.dumps(data)
+
+        JsonResource.register_backend(100, UpperJsonBackend())
+
+        try:
+            json_resource = JsonResource()
+            json_resource.implementation = JsonResource.IMPLEMENTATION_AUTO
+
+            self.assertEqual(100, json_resource.implementation)
+
+            json_resource.parse('{"a": "b"}')
+            self.assertEqual({"A": "B"}, json_resource.data)
+        finally:
+            JsonResource.register_backend(100, None)
+
+        json_resource.implementation = 100
+
+        self.assertEqual(
+            JsonResource.IMPLEMENTATION_INTERNAL, json_resource.implementation
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from collections import OrderedDict
+import json
+import unittest
+
+from ppt_json import JsonFeedParser
+
+
+class TestJsonFeedParser(unittest.TestCase):
+    """
+    Unittest for JsonFeedParser
+
+    :since: v1.1.0
+    """
+
+    def _get_json_test_data(self):
+        """
+        Test data with nested structs, escape sequences and all value types.
+
+        :return: (str) Test data
+        """
+
+        return """
+{
+"hello": "w\\u00f6rld \\"quoted\\"",
+"more_complex": [ "this", "that", true, false, null, 1, -2.5e3, {} ],
+"nested": { "list": [ [], { "key": "value" } ] }
+}
+        """
+
+    def test_chunks(self):
+        """
+        Tests feeding data in chunks of different sizes.
+        """
+
+        data = self._get_json_test_data()
+        expected_data = json.loads(data)
+
+        for chunk_size in (1, 2, 3, 7, 64):
+            json_parser = JsonFeedParser()
+
+            for position in range(0, len(data), chunk_size):
+                self.assertTrue(
+                    json_parser.feed(data[position : position + chunk_size])
+                )
+
+            self.assertEqual(expected_data, json_parser.close().data)
+
+    def test_long_string_chunks(self):
+        """
+        Tests feeding strings spanning many chunks with escape sequences split
+        at chunk boundaries.
+        """
+
+        value = ("x" * 1000 + '\\"\\' + "\\u00e4") * 200
+        data = json.dumps({"key" * 300: value, "list": [value, "'"]})
+
+        for chunk_size in (1, 3, 16384):
+            json_parser = JsonFeedParser()
+
+            for position in range(0, len(data), chunk_size):
+                self.assertTrue(
+                    json_parser.feed(data[position : position + chunk_size])
+                )
+
+            self.assertEqual(json.loads(data), json_parser.close().data)
+
+        json_parser = JsonFeedParser()
+        json_parser.feed('{"a": "x\\')
+        json_parser.feed('"')
+        self.assertIsNone(json_parser.close().data)
+
+    def test_binary_chunks(self):
+        """
+        Tests feeding UTF-8 encoded data split within multi-byte characters.
+        """
+
+        data = '{"text": "äöü€"}'.encode("utf-8")
+        json_parser = JsonFeedParser(struct_type=OrderedDict)
+
+        for position in range(len(data)):
+            json_parser.feed(data[position : position + 1])
+
+        json_data = json_parser.close().data
+
+        self.assertIsInstance(json_data, OrderedDict)
+        self.assertEqual("äöü€", json_data["text"])
+
+    def test_invalid(self):
+        """
+        Tests that invalid JSON data is rejected.
+        """
+
+        for data in ('{"a": 1', '{"a" 1}', "[1, 2] 3", '"string"', "[1,]", "[tru]"):
+            json_parser = JsonFeedParser()
+            json_parser.feed(data)
+
+            self.assertIsNone(json_parser.close().data, data)
+
+        json_parser = JsonFeedParser()
+
+        self.assertFalse(json_parser.feed("[1 2"))
+        self.assertFalse(json_parser.is_valid)
+
+
+if __name__ == "__main__":
+    unittest.main()
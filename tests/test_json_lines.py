@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from collections import OrderedDict
+from io import StringIO
+from multiprocessing import active_children
+from tempfile import TemporaryDirectory
+import os
+import unittest
+
+from ppt_json import JsonLinesReader, JsonLinesWriter, JsonResource
+
+
+class TestJsonLines(unittest.TestCase):
+    """
+    Unittest for JsonLinesReader and JsonLinesWriter
+
+    :since: v1.1.0
+    """
+
+    def _get_json_test_data(self):
+        """
+        Test data with one object per line.
+
+        :return: (list) Test data
+        """
+
+        return [
+            {"id": index, "tags": ["a", "b"], "ok": index % 2 == 0}
+            for index in range(25)
+        ]
+
+    def test_read(self):
+        """
+        Tests reading lines from an iterable in batches.
+        """
+
+        lines = ['{"a": 1}\n', b'{"b": "\xc3\xa4"}\r\n', "\n", "[1, 2]", '{"c":']
+
+        self.assertEqual(
+            [{"a": 1}, {"b": "ä"}, [1, 2], JsonLinesReader.INVALID_LINE],
+            list(JsonLinesReader(lines)),
+        )
+
+        for processes in (0, 2):
+            self.assertEqual(
+                [1, JsonLinesReader.INVALID_LINE, 2],
+                list(
+                    JsonLinesReader(
+                        [b"1\n", b'{"b": "\xe4"}\n', b"2\n"], processes=processes
+                    )
+                ),
+            )
+
+        for implementation in (
+            JsonResource.IMPLEMENTATION_INTERNAL,
+            JsonResource.IMPLEMENTATION_NATIVE,
+        ):
+            self.assertEqual(
+                [1, "s", None, -2.5, True, JsonLinesReader.INVALID_LINE],
+                list(
+                    JsonLinesReader(
+                        ["1", '"s"', " null ", "-2.5", "true", "nul"],
+                        implementation=implementation,
+                    )
+                ),
+            )
+
+        json_lines_reader = JsonLinesReader(
+            lines,
+            struct_type=OrderedDict,
+            implementation=JsonResource.IMPLEMENTATION_INTERNAL,
+            batch_size=2,
+        )
+
+        batches = list(json_lines_reader.iter_batches())
+
+        self.assertEqual([0, 2], [position for position, _ in batches])
+        self.assertIsInstance(batches[0][1][0], OrderedDict)
+
+    def test_write_read_file(self):
+        """
+        Tests writing and reading a JSON Lines file.
+        """
+
+        data = self._get_json_test_data()
+
+        with TemporaryDirectory() as temp_dir_path:
+            file_path = os.path.join(temp_dir_path, "test.jsonl")
+
+            with JsonLinesWriter(file_path, batch_size=10) as json_lines_writer:
+                self.assertEqual(len(data), json_lines_writer.write_all(data))
+                json_lines_writer.write({"last": True})
+
+            with JsonLinesReader(file_path, batch_size=7) as json_lines_reader:
+                self.assertEqual(data + [{"last": True}], list(json_lines_reader))
+
+            with open(file_path, "ab") as file_obj:
+                file_obj.write(b'"\xff"\n[0]\n')
+
+            with JsonLinesReader(file_path) as json_lines_reader:
+                self.assertEqual(
+                    [JsonLinesReader.INVALID_LINE, [0]], list(json_lines_reader)[-2:]
+                )
+
+        file_obj = StringIO()
+        JsonLinesWriter(file_obj).write_all(data[:2])
+
+        self.assertEqual(2, len(file_obj.getvalue().splitlines()))
+
+    def test_read_without_context(self):
+        """
+        Tests releasing the file and the process pool if iterated without a
+        "with" statement.
+        """
+
+        with TemporaryDirectory() as temp_dir_path:
+            file_path = os.path.join(temp_dir_path, "test.jsonl")
+
+            with JsonLinesWriter(file_path) as json_lines_writer:
+                json_lines_writer.write_all(self._get_json_test_data())
+
+            json_lines_reader = JsonLinesReader(file_path, batch_size=1, processes=2)
+            iterator = iter(json_lines_reader)
+
+            self.assertEqual(0, next(iterator)["id"])
+            self.assertIsNotNone(json_lines_reader._file_obj)
+            self.assertGreater(len(active_children()), 0)
+
+            iterator.close()
+
+            self.assertIsNone(json_lines_reader._file_obj)
+            self.assertEqual([], active_children())
+
+            json_lines_reader = JsonLinesReader(file_path)
+
+            self.assertEqual(25, len(list(json_lines_reader)))
+            self.assertIsNone(json_lines_reader._file_obj)
+
+    def test_read_processes(self):
+        """
+        Tests decoding batches in a process pool.
+        """
+
+        data = self._get_json_test_data()
+        lines = StringIO()
+
+        JsonLinesWriter(lines).write_all(data)
+        lines = lines.getvalue().splitlines()
+
+        self.assertEqual(data, list(JsonLinesReader(lines, batch_size=4, processes=2)))
+
+        self.assertIs(
+            JsonLinesReader.INVALID_LINE,
+            list(JsonLinesReader(["1", "{"], processes=2))[1],
+        )
+
+        batches = list(
+            JsonLinesReader(
+                lines, batch_size=4, processes=2, ordered=False
+            ).iter_batches()
+        )
+
+        self.assertEqual(
+            data,
+            [
+                value
+                for _, batch_data in sorted(batches, key=lambda batch: batch[0])
+                for value in batch_data
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+import unittest
+
+from ppt_json import JsonNodePath, JsonResource
+
+
+class TestJsonNodePath(unittest.TestCase):
+    """
+    Unittest for JsonNodePath
+
+    :since: v1.1.0
+    """
+
+    def test_compile(self):
+        """
+        Tests compiling a node path.
+        """
+
+        node_path = JsonResource.compile_node_path("items#3 name")
+
+        self.assertEqual((("items", 3), ("name", -1)), node_path.steps)
+        self.assertEqual("items#3 name", str(node_path))
+        self.assertEqual((("items", 3),), node_path.parent.steps)
+        self.assertEqual("items#3", node_path.parent.path)
+
+        self.assertEqual(
+            (
+                (node_path.steps, ()),
+                ((("items", 3),), (("name", -1),)),
+                ((("items", -1),), (("", 3), ("name", -1))),
+            ),
+            node_path.prefix_steps,
+        )
+
+        self.assertIs(node_path, JsonResource.compile_node_path("items#3 name"))
+        self.assertIs(node_path, JsonNodePath.compile(node_path))
+        self.assertEqual((), JsonNodePath.compile("").steps)
+        self.assertIsNone(JsonNodePath.compile(None))
+
+    def test_compile_pattern(self):
+        """
+        Tests compiling node paths with list selections.
+        """
+
+        node_path = JsonNodePath.compile("items#* tags#2:-1 name")
+
+        self.assertTrue(node_path.is_pattern)
+        self.assertEqual(
+            (("items", (None, None)), ("tags", (2, -1)), ("name", -1)),
+            node_path.pattern_steps,
+        )
+
+        self.assertEqual(
+            (("items", (10, None)),), JsonNodePath.compile("items#10:").pattern_steps
+        )
+
+        self.assertFalse(JsonNodePath.compile("items#3 name").is_pattern)
+
+    def test_compiled_node_access(self):
+        """
+        Tests reading and changing nodes with compiled node paths.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse('{"items": [{"name": "a"}, {"name": "b"}], "x": {}}')
+
+        node_path = JsonResource.compile_node_path("items#1 name")
+
+        self.assertEqual("b", json_resource.get_node(node_path))
+        self.assertTrue(json_resource.change_node(node_path, "c"))
+        self.assertEqual("c", json_resource.get_node("items#1 name"))
+        self.assertEqual(1, json_resource.count_node(node_path))
+
+        self.assertTrue(json_resource.set_cached_node(node_path.parent))
+        self.assertEqual("c", json_resource.get_node(node_path))
+
+        self.assertTrue(json_resource.remove_node(node_path))
+        self.assertIsNone(json_resource.get_node(node_path))
+
+    def test_nested_position_change(self):
+        """
+        Tests changing a list position below the top level.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse('{"x": {"list": [1, 2, 3]}}')
+
+        self.assertTrue(json_resource.change_node("x list#1", 5))
+        self.assertEqual([1, 5, 3], json_resource.get_node("x list"))
+
+        self.assertTrue(json_resource.remove_node("x list#0"))
+        self.assertEqual([5, 3], json_resource.get_node("x list"))
+
+
+if __name__ == "__main__":
+    unittest.main()
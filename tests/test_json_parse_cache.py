@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+import unittest
+
+from ppt_json import JsonMappingView, JsonParseCache, JsonResource
+
+
+class TestJsonParseCache(unittest.TestCase):
+    """
+    Unittest for JsonParseCache
+
+    :since: v1.1.0
+    """
+
+    def tearDown(self):
+        """
+        Disables the parse cache after each test.
+        """
+
+        JsonResource.disable_parse_cache()
+
+    def test_bounds(self):
+        """
+        Tests evicting least recently used entries.
+        """
+
+        parse_cache = JsonParseCache(2, 10)
+
+        parse_cache.put(b"a", "[10]", 1)
+        parse_cache.put(b"b", "[20]", 2)
+        self.assertEqual(1, parse_cache.get(b"a", "[10]"))
+
+        parse_cache.put(b"c", "[30]", 3)
+        self.assertEqual(2, len(parse_cache))
+        self.assertIsNone(parse_cache.get(b"b", "[20]"))
+        self.assertEqual(1, parse_cache.evictions)
+
+        parse_cache.put(b"d", "[40.0]", 4)
+        self.assertEqual(2, len(parse_cache))
+        self.assertEqual(10, parse_cache.size)
+        self.assertEqual(2, parse_cache.evictions)
+
+        parse_cache.put(b"e", "[50.00000]", 5)
+        parse_cache.put(b"f", "[60.000000]", 6)
+        self.assertIsNone(parse_cache.get(b"f", "[60.000000]"))
+        self.assertIsNone(parse_cache.get(b"d", "[40.1]"))
+        self.assertEqual(5, parse_cache.get(b"e", "[50.00000]"))
+
+        self.assertEqual(
+            {
+                "entries": 1,
+                "size": 10,
+                "hits": 2,
+                "misses": 3,
+                "evictions": 4,
+                "hit_rate": 0.4,
+            },
+            parse_cache.stats(),
+        )
+
+        parse_cache.clear()
+        self.assertEqual(0, len(parse_cache))
+        self.assertEqual(0, parse_cache.hits)
+
+    def test_get_key(self):
+        """
+        Tests sampling the key of long input.
+        """
+
+        data = "[{0}]".format(", ".join(str(i) for i in range(100)))
+        changed_data = data.replace("30", "03")
+
+        self.assertEqual((3, "[1]"), JsonParseCache.get_key("[1]"))
+        self.assertEqual(
+            JsonParseCache.get_key(data), JsonParseCache.get_key(changed_data)
+        )
+
+        parse_cache = JsonParseCache(2, 1000)
+        parse_cache.put(JsonParseCache.get_key(data), data, 1)
+
+        self.assertEqual(1, parse_cache.get(JsonParseCache.get_key(data), data))
+        self.assertIsNone(
+            parse_cache.get(JsonParseCache.get_key(changed_data), changed_data)
+        )
+
+    def test_json_to_data_view(self):
+        """
+        Tests caching the results of "json_to_data_view()".
+        """
+
+        self.assertEqual({"enabled": False}, JsonResource.parse_cache_stats())
+
+        data = JsonResource.json_to_data_view('{"a": [1]}')
+
+        self.assertIsInstance(data, JsonMappingView)
+        self.assertIsNot(data, JsonResource.json_to_data_view('{"a": [1]}'))
+
+        JsonResource.enable_parse_cache(1)
+
+        data = JsonResource.json_to_data_view('{"a": [1, {"b": 2}]}')
+
+        self.assertIsInstance(data, JsonMappingView)
+        self.assertEqual({"a": [1, {"b": 2}]}, data)
+        self.assertIs(data, JsonResource.json_to_data_view('{"a": [1, {"b": 2}]}'))
+
+        with self.assertRaises(TypeError):
+            data["a"][0] = 2
+
+        self.assertEqual([1, 2], JsonResource.json_to_data_view("[1, 2]"))
+        self.assertIsNone(JsonResource.json_to_data_view("[1, "))
+        self.assertIsNot(data, JsonResource.json_to_data_view('{"a": [1, {"b": 2}]}'))
+
+        parse_cache_stats = JsonResource.parse_cache_stats()
+
+        self.assertTrue(parse_cache_stats["enabled"])
+        self.assertEqual(1, parse_cache_stats["entries"])
+        self.assertEqual(1, parse_cache_stats["hits"])
+        self.assertEqual(4, parse_cache_stats["misses"])
+        self.assertEqual(2, parse_cache_stats["evictions"])
+
+        data = JsonResource.json_to_data('{"a": [1]}')
+
+        self.assertIsInstance(data, dict)
+        data["a"].append(2)
+
+        self.assertEqual({"a": [1]}, JsonResource.json_to_data('{"a": [1]}'))
+        self.assertEqual(4, JsonResource.parse_cache_stats()["misses"])
+
+
+if __name__ == "__main__":
+    unittest.main()
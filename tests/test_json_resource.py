@@ -12,10 +12,21 @@ v. 2.0. If a copy of the MPL was not distributed with this file, You can
 obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from collections import OrderedDict
+from io import BytesIO, StringIO
+from tempfile import TemporaryDirectory
+import json
+import os
+import random
 import unittest
 
 from ppt_json import JsonResource
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestJsonResource(unittest.TestCase):
     """
@@ -57,6 +68,66 @@ class TestJsonResource(unittest.TestCase):
         self.assertTrue("more_complex" in json_data)
         self.assertEqual(["this", "that", True, 1], json_data["more_complex"])
 
+    def test_internal_escapes(self):
+        """
+        Tests escape sequences and string delimiters of the internal parser.
+        """
+
+        json_resource = JsonResource()
+        json_resource.implementation = JsonResource.IMPLEMENTATION_INTERNAL
+        json_resource.parse(
+            '{"quote": "a\\"b", "unicode": "\\u00e9\\ud83d\\ude00", \'single\': \'it\\\'s\'}'
+        )
+
+        json_data = json_resource.data
+
+        self.assertEqual('a"b', json_data["quote"])
+        self.assertEqual("\u00e9\U0001f600", json_data["unicode"])
+        self.assertEqual("it's", json_data["single"])
+
+    def test_internal_invalid(self):
+        """
+        Tests that the internal parser rejects invalid JSON data.
+        """
+
+        json_resource = JsonResource()
+        json_resource.implementation = JsonResource.IMPLEMENTATION_INTERNAL
+
+        for data in (
+            '{"a": 1',
+            '{"a" 1}',
+            "[1, 2] 3",
+            '"string"',
+            "[1,]",
+            "",
+            '["\\u+0_1"]',
+            '["\\u 123"]',
+            '["\\u12"]',
+            '["\\ud83d\\u+e00"]',
+            b'{"a": 1}',
+        ):
+            json_resource.parse(data)
+            self.assertIsNone(json_resource.data, data)
+
+    def test_internal_struct_type(self):
+        """
+        Tests the internal parser with a custom dict implementation.
+        """
+
+        json_resource = JsonResource(struct_type=OrderedDict)
+        json_resource.parse('{"b": {"d": [1.5, -2e3, null]}, "a": false}')
+
+        json_data = json_resource.data
+
+        self.assertEqual(
+            JsonResource.IMPLEMENTATION_INTERNAL, json_resource.implementation
+        )
+        self.assertIsInstance(json_data, OrderedDict)
+        self.assertIsInstance(json_data["b"], OrderedDict)
+        self.assertEqual(["b", "a"], list(json_data))
+        self.assertEqual([1.5, -2000.0, None], json_data["b"]["d"])
+        self.assertIs(False, json_data["a"])
+
     def test_native(self):
         """
         Tests the native JSON Python parser.
@@ -106,6 +177,890 @@ class TestJsonResource(unittest.TestCase):
             "work but sometimes they do", json_resource.get_node("more_complex#1 never")
         )
 
+    def test_node_cache(self):
+        """
+        Tests looking up nodes through multiple cached node pointers.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse(
+            '{"a": {"b": {"c": 1}}, "x": {"y": [{"z": 2}, {"z": 3}, {"z": 4}]}}'
+        )
+
+        self.assertTrue(json_resource.set_cached_node("a b"))
+        self.assertTrue(json_resource.set_cached_node("x y"))
+        self.assertEqual("x y", json_resource.data_cache_node)
+
+        node_cache_misses = json_resource.node_cache_misses
+
+        self.assertEqual(1, json_resource.get_node("a b c"))
+        self.assertEqual(3, json_resource.get_node("x y#1 z"))
+        self.assertEqual(2, json_resource.node_cache_hits)
+
+        self.assertEqual(
+            {"y": [{"z": 2}, {"z": 3}, {"z": 4}]}, json_resource.get_node("x")
+        )
+        self.assertEqual(node_cache_misses + 1, json_resource.node_cache_misses)
+
+        self.assertIsNone(json_resource.get_node("A B c"))
+
+        json_resource.node_cache_size = 1
+        self.assertEqual("x y", json_resource.data_cache_node)
+
+        json_resource.data_cache_node = "a"
+        self.assertEqual("a", json_resource.data_cache_node)
+        self.assertEqual({"b": {"c": 1}}, json_resource.data_cache_ptr)
+
+        json_resource.data_cache_ptr = json_resource.get_node("x")
+        self.assertEqual(3, json_resource.get_node("a y#1 z"))
+
+        json_resource.data_cache_node = ""
+        self.assertEqual("", json_resource.data_cache_node)
+        self.assertEqual(json_resource.data, json_resource.data_cache_ptr)
+
+    def test_node_cache_positions(self):
+        """
+        Tests list positions applied to cached nodes which are not lists.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse('{"b": {"c": 1, "b": {"c": 2}}, "d": 3, "l": [4, 5]}')
+
+        for node_path in ("b", "d", "l"):
+            self.assertTrue(json_resource.set_cached_node(node_path))
+
+        self.assertEqual(1, json_resource.get_node("b#1 c"))
+        self.assertEqual(3, json_resource.get_node("d#1"))
+        self.assertEqual(5, json_resource.get_node("l#1"))
+        self.assertEqual([4, 5], json_resource.get_node("l#2"))
+
+    def test_node_cache_invalidation(self):
+        """
+        Tests that cached node pointers are invalidated on changes.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse('{"a": {"b": {"c": 1}}, "x": {"y": [{"z": 2}, {"z": 3}]}}')
+
+        json_resource.set_cached_node("a b")
+        json_resource.set_cached_node("x y#1")
+
+        self.assertTrue(json_resource.change_node("a", {"b": {"c": 5}}))
+        self.assertEqual(5, json_resource.get_node("a b c"))
+
+        self.assertTrue(json_resource.remove_node("x y#0"))
+        self.assertIsNone(json_resource.get_node("x y#1 z"))
+        self.assertEqual(3, json_resource.get_node("x y#0 z"))
+
+        json_resource.set_cached_node("x y#0")
+        self.assertTrue(json_resource.remove_node("x"))
+        self.assertIsNone(json_resource.get_node("x y#0 z"))
+
+        json_resource.set_cached_node("a b")
+        json_resource.set_json({"a": {"b": {"c": 6}}}, True)
+        self.assertEqual("", json_resource.data_cache_node)
+        self.assertEqual(6, json_resource.get_node("a b c"))
+
+    def test_node_index(self):
+        """
+        Tests looking up nodes through the node index and updating it.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse(
+            '{"a": {"b": [{"c": 1}, {"c": 2}, {"c": 3}]}, "x": {"y": "z"}}', lazy=True
+        )
+
+        self.assertEqual(0, json_resource.node_index_size)
+        self.assertGreater(json_resource.build_index(), 0)
+
+        self.assertEqual(2, json_resource.get_node("a b#1 c"))
+        self.assertEqual({"y": "z"}, json_resource.get_node("x"))
+
+        self.assertTrue(json_resource.change_node("a b#1", {"c": 5, "d": [6]}))
+        self.assertEqual(5, json_resource.get_node("a b#1 c"))
+        self.assertEqual(6, json_resource.get_node("a b#1 d#0"))
+
+        self.assertTrue(json_resource.remove_node("a b#0"))
+        self.assertEqual(6, json_resource.get_node("a b#0 d#0"))
+        self.assertEqual(3, json_resource.get_node("a b#1 c"))
+        self.assertIsNone(json_resource.get_node("a b#2 c"))
+
+        self.assertTrue(json_resource.add_node("x w", {"v": 7}))
+        self.assertEqual(7, json_resource.get_node("x w v"))
+
+        self.assertTrue(json_resource.remove_nodes(["x", "a b#0"]))
+        self.assertIsNone(json_resource.get_node("x w v"))
+        self.assertEqual({"c": 3}, json_resource.get_node("a b#0"))
+        self.assertGreater(json_resource.node_index_size, 0)
+
+        json_resource.set_json({"a": 1}, True)
+
+        self.assertEqual(0, json_resource.node_index_size)
+        self.assertEqual(1, json_resource.get_node("a"))
+
+    def test_stats(self):
+        """
+        Tests the instrumentation of operations.
+        """
+
+        data = self._get_json_test_data()
+
+        json_resource = JsonResource()
+        json_resource.parse(data)
+
+        self.assertEqual({}, json_resource.stats()["operations"])
+
+        json_resource.enable_stats()
+        json_resource.parse(data)
+        json_resource.set_cached_node("more_complex")
+
+        for _ in range(3):
+            json_resource.get_node("more_complex#1")
+
+        json_data = json_resource.export_data()
+        stats = json_resource.stats()
+
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(len(data), stats["bytes_in"])
+        self.assertEqual(len(json_data), stats["bytes_out"])
+        self.assertEqual(1, stats["operations"]["parse"]["count"])
+        self.assertEqual(3, stats["operations"]["get_node"]["count"])
+        self.assertEqual(3, sum(stats["operations"]["get_node"]["histogram"].values()))
+        self.assertEqual(1.0, stats["node_cache"]["hit_rate"])
+
+        json_resource.enable_stats()
+        json_resource.parse('{"a": "ä"}')
+        self.assertTrue(json_resource.add_node("b", "ö"))
+
+        stats = json_resource.stats()
+
+        self.assertEqual(11, stats["bytes_in"])
+        self.assertEqual(["parse", "add_node"], list(stats["operations"]))
+        self.assertEqual(1, stats["operations"]["add_node"]["count"])
+
+        json_resource.disable_stats()
+        self.assertFalse(json_resource.stats()["enabled"])
+
+    def test_interning(self):
+        """
+        Tests sharing equal strings of a parsed document.
+        """
+
+        data = [
+            {"key": "value", "tags": ["tag", "x" * 40]},
+            {"key": "value", "tags": ["tag", "x" * 40]},
+        ]
+
+        for implementation in (
+            JsonResource.IMPLEMENTATION_INTERNAL,
+            JsonResource.IMPLEMENTATION_NATIVE,
+        ):
+            for interning, lazy in (
+                (JsonResource.INTERNING_KEYS, False),
+                (JsonResource.INTERNING_STRINGS, False),
+                (JsonResource.INTERNING_STRINGS, True),
+            ):
+                json_resource = JsonResource()
+                json_resource.implementation = implementation
+                json_resource.parse(json.dumps(data), lazy, interning)
+
+                parsed_data = json_resource.data
+
+                self.assertEqual(data, parsed_data)
+                self.assertIs(list(parsed_data[0])[1], list(parsed_data[1])[1])
+
+                self.assertEqual(
+                    interning == JsonResource.INTERNING_STRINGS,
+                    parsed_data[0]["tags"][0] is parsed_data[1]["tags"][0],
+                )
+
+                self.assertIsNot(parsed_data[0]["tags"][1], parsed_data[1]["tags"][1])
+                self.assertIsNone(json_resource._intern_table)
+
+        json_resource = JsonResource()
+
+        for load in (
+            lambda: json_resource.set_json({"a": "b"}, True),
+            lambda: json_resource.parse_parallel('{"a": "b"}'),
+            lambda: json_resource.export_data(True),
+        ):
+            json_resource.parse(json.dumps(data), True, JsonResource.INTERNING_STRINGS)
+            self.assertIsNotNone(json_resource._intern_table)
+
+            load()
+
+            self.assertIsNone(json_resource._intern_table)
+            self.assertEqual(JsonResource.INTERNING_NONE, json_resource._interning)
+
+    def test_lazy(self):
+        """
+        Tests reading nodes of lazily parsed JSON data.
+        """
+
+        data = '{"a": {"b": [1, {"c": "x]"}]}, "d": [[], {}], "e": "}"}'
+
+        json_resource = JsonResource()
+        json_resource.parse(data, lazy=True)
+
+        self.assertEqual("x]", json_resource.get_node("a b#1 c"))
+        self.assertEqual({"c": "x]"}, json_resource.get_node("a b#1"))
+        self.assertEqual(2, json_resource.count_node("a b"))
+        self.assertEqual(
+            {"a": {"b": [1, {"c": "x]"}]}, "d": [[], {}], "e": "}"},
+            json_resource.data,
+        )
+
+        json_resource.parse(data, lazy=True)
+        self.assertEqual(
+            json_resource.export_data(), JsonResource().data_to_json(json_resource.data)
+        )
+
+        for data in (
+            '{"a": [1, 2}',
+            '{"a": 1} x',
+            "[1, 2]]",
+            '"string"',
+            '{"a": 1,}',
+            "[1, ]",
+            '{"a": "' + "x" * 100000,
+        ):
+            json_resource.parse(data, lazy=True)
+            self.assertIsNone(json_resource.data, data)
+
+        json_resource.parse('{"a": [1,], "b": 2}', lazy=True)
+        self.assertEqual(2, json_resource.get_node("b"))
+
+        with self.assertRaises(ValueError):
+            json_resource.get_node("a")
+
+        with self.assertRaises(ValueError):
+            json_resource.data
+
+        with self.assertRaises(ValueError):
+            json_resource.export_data()
+
+    def test_lazy_changes(self):
+        """
+        Tests changing nodes of lazily parsed JSON data.
+        """
+
+        json_resource = JsonResource(struct_type=OrderedDict)
+        json_resource.parse('{"a": {"b": [1, {"c": 2}, [3]]}, "d": {}}', lazy=True)
+
+        self.assertTrue(json_resource.change_node("a b#1 c", 5))
+        self.assertTrue(json_resource.remove_node("a b#2"))
+        self.assertTrue(json_resource.add_node("d e", True))
+
+        json_data = json_resource.data
+
+        self.assertIsInstance(json_data["a"]["b"][1], OrderedDict)
+        self.assertEqual([1, {"c": 5}], json_data["a"]["b"])
+        self.assertEqual({"e": True}, json_data["d"])
+
+    def test_batch_nodes(self):
+        """
+        Tests reading, changing and removing multiple nodes at once.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse(
+            '{"a": {"b": [0, 1, 2, 3, 4], "c": {"d": 1, "e": 2}}, "f": "g"}',
+            lazy=True,
+        )
+
+        self.assertEqual(
+            [1, 2, "g", None, [0, 1, 2, 3, 4], 2],
+            json_resource.get_nodes(["a c d", "a c e", "f", "a x", "a b", "a b#2"]),
+        )
+
+        json_resource.set_cached_node("a b#4")
+
+        self.assertTrue(
+            json_resource.change_nodes({"a c": {"d": 5}, "a c d": 6, "a b#0": 7})
+        )
+        self.assertFalse(json_resource.change_nodes({"a x y": 1, "f": "h"}))
+        self.assertEqual({"d": 6}, json_resource.get_node("a c"))
+        self.assertEqual("h", json_resource.get_node("f"))
+
+        self.assertTrue(
+            json_resource.remove_nodes(["a b#1", "a b#3", "a b#1", "a c d"])
+        )
+        self.assertFalse(json_resource.remove_nodes(["a b#9", "f"]))
+
+        self.assertEqual({"a": {"b": [7, 2, 4], "c": {}}}, json_resource.data)
+        self.assertEqual("", json_resource.data_cache_node)
+        self.assertEqual(4, json_resource.get_node("a b#2"))
+
+        json_resource.set_json(
+            {"a": {"b": [1, 2]}, "c": [{"d": [3, 4]}, {"d": [5]}]}, True
+        )
+
+        self.assertTrue(
+            json_resource.remove_nodes(["a b#0", "a", "c#0", "c#1 d#0", "a b"])
+        )
+
+        self.assertEqual({"c": [{"d": []}]}, json_resource.data)
+
+    def test_incremental_export(self):
+        """
+        Tests the incremental export against a complete export after random
+        changes.
+        """
+
+        data = {
+            "items": [
+                {"id": i, "tags": ["a", {"b": i}], "meta": {"c": [i]}} for i in range(8)
+            ],
+            "info": {"name": "ä", 1: None},
+        }
+
+        randomizer = random.Random(42)
+
+        for implementation in (
+            JsonResource.IMPLEMENTATION_INTERNAL,
+            JsonResource.IMPLEMENTATION_NATIVE,
+        ):
+            json_resource = JsonResource()
+            json_resource.implementation = implementation
+            json_resource.enable_incremental_export()
+            json_resource.parse(json.dumps(data))
+
+            for _ in range(200):
+                position = randomizer.randrange(len(json_resource.data["items"]))
+                node_path = randomizer.choice(
+                    (
+                        "items#{0:d} id",
+                        "items#{0:d} tags#1 b",
+                        "items#{0:d} meta",
+                        "items#{0:d} meta c#0",
+                        "items#{0:d} new",
+                        "info name",
+                    )
+                ).format(position)
+
+                operation = randomizer.randrange(4)
+
+                if operation == 0:
+                    json_resource.change_node(node_path, {"d": [operation]})
+                elif operation == 1:
+                    json_resource.add_node(node_path, randomizer.random())
+                elif operation == 2 and len(json_resource.data["items"]) > 2:
+                    json_resource.remove_node(
+                        randomizer.choice((node_path, "items#{0:d}".format(position)))
+                    )
+                else:
+                    json_resource.change_nodes({node_path: "x", "info name": "y"})
+
+                self.assertEqual(
+                    json_resource.data_to_json(json_resource.data),
+                    json_resource.export_data(),
+                )
+
+            json_resource.parse('{"o": {"p": {"q": 1}}}')
+            json_resource.export_data()
+            json_resource.change_node("o#0 p q", 2)
+
+            self.assertEqual(
+                json_resource.data_to_json(json_resource.data),
+                json_resource.export_data(),
+            )
+
+            json_resource.set_json({"a": [1]}, True)
+            self.assertEqual(json_resource.data_to_json({"a": [1]}), json_resource.json)
+
+        json_resource.disable_incremental_export()
+        self.assertIsNone(json_resource._fragment_cache)
+
+    def test_patch(self):
+        """
+        Tests applying JSON Patch operations and rolling them back on failure.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse('{"a": {"b": [1, 2, 3]}, "c": "x", "d~/e": 1}')
+        json_resource.build_index()
+        json_resource.enable_incremental_export()
+        json_resource.export_data()
+        self.assertTrue(json_resource.set_cached_node("a b#2"))
+
+        self.assertTrue(
+            json_resource.apply_patch(
+                [
+                    {"op": "add", "path": "/a/b/0", "value": 0},
+                    {"op": "remove", "path": "/c"},
+                    {"op": "move", "from": "/d~0~1e", "path": "/a/z"},
+                    {"op": "copy", "from": "/a/b", "path": "/a/b/-"},
+                    {"op": "replace", "path": "/a/b/4/0", "value": "y"},
+                    {"op": "test", "path": "/a/z", "value": 1},
+                ]
+            )
+        )
+
+        data = {"a": {"b": [0, 1, 2, 3, ["y", 1, 2, 3]], "z": 1}}
+
+        self.assertEqual(data, json_resource.data)
+        self.assertEqual(2, json_resource.get_node("a b#2"))
+        self.assertEqual(3, json_resource.get_node("a b#3"))
+        self.assertEqual(json_resource.data_to_json(data), json_resource.export_data())
+
+        for operations in (
+            [
+                {"op": "remove", "path": "/a/b/0"},
+                {"op": "test", "path": "/a/z", "value": 2},
+            ],
+            [
+                {"op": "add", "path": "/a/new", "value": 1},
+                {"op": "remove", "path": "/x"},
+            ],
+            [
+                {"op": "replace", "path": "", "value": [1]},
+                {"op": "add", "path": "/2", "value": 1},
+            ],
+            [
+                {"op": "remove", "path": "/a/z"},
+                {"op": "move", "from": "/a", "path": "/a/b/0"},
+            ],
+            [{"op": "add", "path": "/a/b/01", "value": 1}],
+            [{"op": "replace", "path": "/a/b/-", "value": 1}],
+            [{"op": "unknown", "path": "/a"}],
+            [{"op": "add", "path": "a"}],
+        ):
+            self.assertFalse(json_resource.apply_patch(operations))
+            self.assertEqual(data, json_resource.data)
+            self.assertEqual(["a"], list(json_resource.data))
+            self.assertEqual(["b", "z"], list(json_resource.data["a"]))
+
+        self.assertEqual(json_resource.data_to_json(data), json_resource.export_data())
+
+        self.assertTrue(
+            json_resource.apply_patch(
+                '[{"op": "remove", "path": "/a/b/4"}, {"op": "replace", "path": "", "value": {"a": 1}}]'
+            )
+        )
+
+        self.assertEqual({"a": 1}, json_resource.data)
+
+    def test_patch_recording(self):
+        """
+        Tests recording changes as JSON Patch operations.
+        """
+
+        source = '{"a": {"b": [1, 2, 3]}, "c": "x", "d/e": 1}'
+
+        json_resource = JsonResource()
+        json_resource.parse(source)
+
+        with json_resource.record_patch() as patch:
+            json_resource.change_node("a b#1", {"f": [9]})
+            json_resource.add_node("a g", True)
+            json_resource.remove_node("c")
+            json_resource.change_node("d/e", 2)
+            json_resource.remove_nodes(["a b#0", "a b#2"])
+
+            with json_resource.record_patch() as nested_patch:
+                self.assertFalse(
+                    json_resource.apply_patch(
+                        [
+                            {"op": "add", "path": "/a/b/0", "value": 0},
+                            {"op": "remove", "path": "/x"},
+                        ]
+                    )
+                )
+
+                self.assertTrue(
+                    json_resource.apply_patch(
+                        [{"op": "add", "path": "/a/b/-", "value": 4}]
+                    )
+                )
+
+        json_resource.change_node("a g", False)
+
+        self.assertEqual(
+            [
+                {"op": "replace", "path": "/a/b/1", "value": {"f": [9]}},
+                {"op": "add", "path": "/a/g", "value": True},
+                {"op": "remove", "path": "/c"},
+                {"op": "replace", "path": "/d~1e", "value": 2},
+                {"op": "remove", "path": "/a/b/2"},
+                {"op": "remove", "path": "/a/b/0"},
+                {"op": "add", "path": "/a/b/1", "value": 4},
+            ],
+            patch,
+        )
+
+        self.assertEqual([patch[-1]], nested_patch)
+        self.assertIsNone(json_resource._patch_recorders)
+
+        patched_json_resource = JsonResource()
+        patched_json_resource.parse(source)
+
+        self.assertTrue(patched_json_resource.apply_patch(patch))
+        self.assertEqual(
+            {"a": {"b": [{"f": [9]}, 4], "g": True}, "d/e": 2},
+            patched_json_resource.data,
+        )
+
+    def test_patch_recording_replay(self):
+        """
+        Tests replaying recorded JSON Patch operations on the original
+        document after random batch changes.
+        """
+
+        source = json.dumps(
+            {"a": [{"b": [1, 2]}, {"b": [3]}], "c": {"d": [4, {"e": 5}]}}
+        )
+
+        randomizer = random.Random(42)
+        node_paths = ("a", "a#0", "a#1", "a#0 b#0", "a#1 b#0", "a b", "c d#1 e")
+
+        for _ in range(100):
+            json_resource = JsonResource()
+            json_resource.parse(source)
+
+            with json_resource.record_patch() as patch:
+                for _ in range(3):
+                    json_resource.remove_nodes(
+                        randomizer.sample(node_paths, randomizer.randrange(1, 4))
+                    )
+
+                    json_resource.change_nodes(
+                        {randomizer.choice(node_paths): randomizer.random()}
+                    )
+
+            patched_json_resource = JsonResource()
+            patched_json_resource.parse(source)
+
+            self.assertTrue(patched_json_resource.apply_patch(patch))
+            self.assertEqual(json_resource.data, patched_json_resource.data)
+
+    def test_iter_nodes(self):
+        """
+        Tests reading nodes selected by wildcards and slices.
+        """
+
+        data = {
+            "items": [
+                {"id": i, "tags": [i, i + 1, i + 2]} if (i != 3) else None
+                for i in range(6)
+            ]
+        }
+
+        for lazy in (False, True):
+            json_resource = JsonResource()
+            json_resource.parse(json.dumps(data), lazy=lazy)
+
+            self.assertEqual(
+                [0, 1, 2, 4, 5], list(json_resource.iter_nodes("items#* id"))
+            )
+
+            self.assertEqual(
+                [{"id": 1, "tags": [1, 2, 3]}, {"id": 2, "tags": [2, 3, 4]}],
+                list(json_resource.iter_nodes("items#1:3")),
+            )
+
+            self.assertEqual(
+                [4, 5, 5, 6], list(json_resource.iter_nodes("items#-2: tags#:2"))
+            )
+
+            self.assertEqual([None], list(json_resource.iter_nodes("items#3:4")))
+
+            self.assertEqual([2], list(json_resource.iter_nodes("items#2 tags#0")))
+
+            self.assertEqual([], list(json_resource.iter_nodes("missing#*")))
+
+        json_resource = JsonResource()
+        json_resource.parse("[[1, 2], [3]]")
+
+        self.assertEqual([1, 3], list(json_resource.iter_nodes("root#* root#0")))
+
+    def test_column(self):
+        """
+        Tests reading a column with the list fallback.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse(
+            '{"items": [{"v": 1}, {"v": 2.5}, {}, null, {"v": null}, {"v": 4}]}'
+        )
+
+        if numpy is None:
+            self.assertEqual(
+                [1.0, 2.5, None, None, None, 4.0],
+                json_resource.get_column("items#* v"),
+            )
+
+        self.assertEqual(
+            [1, 2.5, 0, 0, 0, 4],
+            list(json_resource.get_column("items#* v", fill_value=0)),
+        )
+
+        self.assertEqual(
+            [1, 2, 4],
+            list(
+                json_resource.get_column(
+                    "items#* v", int, JsonResource.COLUMN_MISSING_SKIP
+                )
+            ),
+        )
+
+        with self.assertRaises(ValueError):
+            json_resource.get_column(
+                "items#* v", missing=JsonResource.COLUMN_MISSING_RAISE
+            )
+
+    @unittest.skipUnless(numpy is not None, "numpy not installed")
+    def test_column_numpy(self):
+        """
+        Tests reading a column into a NumPy array.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse('{"items": [{"v": 1}, {}, {"v": 3}]}')
+
+        column = json_resource.get_column("items#* v")
+
+        self.assertIsInstance(column, numpy.ndarray)
+        self.assertEqual(numpy.float64, column.dtype)
+        self.assertTrue(numpy.isnan(column[1]))
+
+        column = json_resource.get_column(
+            "items#* v", "int32", JsonResource.COLUMN_MISSING_SKIP
+        )
+
+        self.assertEqual([1, 3], column.tolist())
+
+    def test_parse_parallel(self):
+        """
+        Tests decoding list elements in worker processes.
+        """
+
+        data = json.dumps(
+            {"items": [{"id": i, "tags": [i, "x"]} for i in range(50)] + [1, "a"]}
+        )
+
+        serial_operations = ["parse", "parse_parallel_serial"]
+
+        json_resource = JsonResource()
+        json_resource.enable_stats()
+
+        self.assertFalse(json_resource.parse_parallel(data, "items", 2))
+        self.assertEqual(json.loads(data), json_resource.data)
+
+        self.assertEqual(serial_operations, sorted(json_resource.stats()["operations"]))
+
+        parallel_size_min = JsonResource.PARALLEL_SIZE_MIN
+        JsonResource.PARALLEL_SIZE_MIN = 0
+
+        try:
+            for implementation, processes, operations in (
+                (JsonResource.IMPLEMENTATION_INTERNAL, 1, serial_operations),
+                (JsonResource.IMPLEMENTATION_INTERNAL, 2, ["parse_parallel"]),
+            ):
+                json_resource = JsonResource(struct_type=OrderedDict)
+                json_resource.implementation = implementation
+                json_resource.enable_stats()
+
+                self.assertEqual(
+                    operations == ["parse_parallel"],
+                    json_resource.parse_parallel(data, "items", processes),
+                )
+
+                self.assertEqual(
+                    operations, sorted(json_resource.stats()["operations"])
+                )
+
+                self.assertEqual(json.loads(data), json_resource.data)
+                self.assertIsInstance(json_resource.get_node("items#49"), OrderedDict)
+
+            json_resource = JsonResource()
+            json_resource.implementation = JsonResource.IMPLEMENTATION_NATIVE
+            json_resource.enable_stats()
+
+            self.assertFalse(json_resource.parse_parallel(data, "items", 2))
+            self.assertEqual(json.loads(data), json_resource.data)
+
+            self.assertEqual(
+                serial_operations, sorted(json_resource.stats()["operations"])
+            )
+
+            json_resource = JsonResource()
+            json_resource.parse_parallel('[[1], {}, 2, {"a": [3]}]', processes=2)
+
+            self.assertEqual([[1], {}, 2, {"a": [3]}], json_resource.data)
+
+            for data in (
+                '[{"a": 1}, {"b" 2}]',
+                '{"a": [1, {"b": 1 2}], "c": []}',
+                '[{"a": 1}, {"b": 2},]',
+            ):
+                json_resource.parse_parallel(data, "c", processes=2)
+                self.assertIsNone(json_resource.data, data)
+        finally:
+            JsonResource.PARALLEL_SIZE_MIN = parallel_size_min
+
+    def test_parse_file(self):
+        """
+        Tests parsing files with both implementations with and without
+        memory-mapping.
+        """
+
+        with TemporaryDirectory() as temp_dir_path:
+            file_path = os.path.join(temp_dir_path, "test.json")
+
+            with open(file_path, "w", encoding="utf-8") as file_obj:
+                file_obj.write(self._get_json_test_data())
+
+            implementations = (
+                JsonResource.IMPLEMENTATION_INTERNAL,
+                JsonResource.IMPLEMENTATION_NATIVE,
+                JsonResource.IMPLEMENTATION_MSGSPEC,
+                JsonResource.IMPLEMENTATION_ORJSON,
+            )
+
+            for implementation in implementations:
+                for memory_map in (False, True):
+                    json_resource = JsonResource()
+                    json_resource.implementation = implementation
+                    json_resource.parse_file(file_path, memory_map)
+
+                    self.assertEqual(
+                        {"hello": "world", "more_complex": ["this", "that", True, 1]},
+                        json_resource.data,
+                    )
+
+            with open(file_path, "wb") as file_obj:
+                file_obj.write('{"ä": [12345678901234567890123]}'.encode("utf-8"))
+
+            for implementation in implementations:
+                for memory_map in (False, True):
+                    json_resource = JsonResource()
+                    json_resource.implementation = implementation
+                    json_resource.parse_file(file_path, memory_map)
+
+                    self.assertEqual(
+                        {"ä": [12345678901234567890123]}, json_resource.data
+                    )
+
+            for data in (b"", b'["\xff"]'):
+                with open(file_path, "wb") as file_obj:
+                    file_obj.write(data)
+
+                for implementation in implementations:
+                    for memory_map in (False, True):
+                        json_resource = JsonResource()
+                        json_resource.implementation = implementation
+                        json_resource.parse_file(file_path, memory_map)
+
+                        self.assertIsNone(json_resource.data)
+
+    def test_snapshot(self):
+        """
+        Tests saving and loading snapshots.
+        """
+
+        data = {"items": [{"id": i, "name": "ä", "ok": None} for i in range(3)]}
+
+        with TemporaryDirectory() as directory_path:
+            file_path = os.path.join(directory_path, "data.snapshot")
+
+            json_resource = JsonResource()
+            json_resource.parse(json.dumps(data), True, JsonResource.INTERNING_KEYS)
+            self.assertTrue(json_resource.save_snapshot(file_path))
+
+            json_resource = JsonResource(OrderedDict)
+            json_resource.set_cached_node("items#1")
+            self.assertTrue(json_resource.load_snapshot(file_path))
+
+            self.assertEqual(data, json_resource.data)
+            self.assertIsInstance(json_resource.get_node("items#2"), OrderedDict)
+
+            self.assertTrue(json_resource.save_snapshot(file_path))
+
+            json_resource = JsonResource()
+            self.assertTrue(json_resource.load_snapshot(file_path))
+            self.assertIs(type(json_resource.get_node("items#2")), dict)
+            self.assertEqual(data, json_resource.data)
+
+            with open(file_path, "r+b") as file_obj:
+                file_obj.truncate(12)
+
+            self.assertFalse(json_resource.load_snapshot(file_path))
+            self.assertEqual(data, json_resource.data)
+
+            for data in ({"value": object()}, {"value": (1,)}, {"value": b"x"}):
+                json_resource.set_json(data, True)
+                self.assertFalse(json_resource.save_snapshot(file_path))
+
+            version = bytes((JsonResource.SNAPSHOT_VERSION,))
+
+            for header, payload in (
+                (JsonResource.SNAPSHOT_MAGIC + b"\x01", b"\x00"),
+                (JsonResource.SNAPSHOT_MAGIC + version, b"\x07\x02\x00"),
+                (JsonResource.SNAPSHOT_MAGIC + version, b"\xe3\x00"),
+                (b"PPTJSNAQ" + version, b"\x00"),
+            ):
+                with open(file_path, "wb") as file_obj:
+                    file_obj.write(header + payload)
+
+                self.assertFalse(json_resource.load_snapshot(file_path))
+
+            self.assertEqual({"value": b"x"}, json_resource.data)
+
+    def test_streaming_export(self):
+        """
+        Tests exporting JSON data in parts with both implementations.
+        """
+
+        data = {"text": 'a "quoted"\nline', "list": [1, 2.5, True, None, {}], "n": {}}
+
+        for implementation in (
+            JsonResource.IMPLEMENTATION_INTERNAL,
+            JsonResource.IMPLEMENTATION_NATIVE,
+        ):
+            json_resource = JsonResource()
+            json_resource.implementation = implementation
+            json_resource.set_json(data)
+
+            self.assertEqual(data, json.loads("".join(json_resource.iter_json())))
+
+            fp = StringIO()
+            written = json_resource.export_to(fp, 4)
+
+            self.assertEqual(len(fp.getvalue()), written)
+            self.assertEqual(data, json.loads(fp.getvalue()))
+
+            fp = BytesIO()
+            json_resource.export_to(fp, encoding="utf-8")
+
+            self.assertEqual(data, json.loads(fp.getvalue()))
+
+        self.assertEqual([], list(JsonResource().iter_json()))
+
+    def test_internal_export(self):
+        """
+        Tests the internal JSON encoder with control characters and deeply
+        nested data.
+        """
+
+        json_resource = JsonResource()
+        json_resource.implementation = JsonResource.IMPLEMENTATION_INTERNAL
+
+        text = "".join(chr(code) for code in range(40)) + '\u00e9"\\'
+        json_data = json_resource.data_to_json({"text": text, 1: (True, None, 1.5)})
+
+        self.assertEqual({"text": text, "1": [True, None, 1.5]}, json.loads(json_data))
+        self.assertNotIn("\n", json_data)
+
+        data = []
+        data_ptr = data
+
+        for _ in range(5000):
+            data_ptr.append([])
+            data_ptr = data_ptr[0]
+
+        self.assertEqual("[" * 5001 + "]" * 5001, json_resource.data_to_json(data))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from collections import OrderedDict
+import math
+import unittest
+
+from ppt_json.json_snapshot_codec import JsonSnapshotCodec
+
+
+class TestJsonSnapshotCodec(unittest.TestCase):
+    """
+    Unittest for JsonSnapshotCodec
+
+    :since: v1.1.0
+    """
+
+    def test_invalid(self):
+        """
+        Tests rejecting malformed payloads and unsupported types.
+        """
+
+        payload = JsonSnapshotCodec.encode({"a": [1, 2.5, "b", None], "c": "b"})
+
+        for length in range(len(payload)):
+            with self.assertRaises(ValueError, msg=length):
+                JsonSnapshotCodec.decode(payload[:length])
+
+        for payload in (
+            payload + b"\x00",
+            b"\x09",
+            b"\x06\x00",
+            b"\x05\x01\xff",
+            bytes(
+                (JsonSnapshotCodec.TAG_OBJECT, 0, 1, JsonSnapshotCodec.TAG_LIST, 0, 0)
+            ),
+            bytes((JsonSnapshotCodec.TAG_LIST, 1, JsonSnapshotCodec.TAG_OBJECT, 1)),
+        ):
+            with self.assertRaises(ValueError, msg=payload):
+                JsonSnapshotCodec.decode(payload)
+
+        for data in ({"value": (1,)}, [b"x"], {1, 2}, {(1, 2): 1}, [object()]):
+            with self.assertRaises(TypeError, msg=data):
+                JsonSnapshotCodec.encode(data)
+
+    def test_nesting(self):
+        """
+        Tests decoding deeply nested payloads without recursion.
+        """
+
+        depth = 100000
+        payload = bytes((JsonSnapshotCodec.TAG_LIST, 1)) * depth + b"\x00"
+
+        data = JsonSnapshotCodec.decode(payload)
+
+        for _ in range(depth):
+            self.assertEqual(1, len(data))
+            data = data[0]
+
+        self.assertIsNone(data)
+
+    def test_round_trip(self):
+        """
+        Tests encoding and decoding all JSON types.
+        """
+
+        for data in (
+            None,
+            True,
+            0,
+            -1,
+            2**100,
+            -(2**100),
+            "",
+            [],
+            {},
+            {
+                "int": [0, 63, 64, -64, -65, 127, 128, 2**63, -(2**63)],
+                "float": [0.0, -1.5, 1e308, float("inf"), float("-inf")],
+                "string": ["ä", "\ud800", "x" * 1000, "ä"],
+                "nested": {"a": [{}, [[]], {"b": {"c": None}}]},
+                1: True,
+                None: False,
+                2.5: "float key",
+            },
+        ):
+            self.assertEqual(
+                data, JsonSnapshotCodec.decode(JsonSnapshotCodec.encode(data))
+            )
+
+        data = JsonSnapshotCodec.decode(
+            JsonSnapshotCodec.encode([{1: "a"}, {True: "b"}, {1.0: "c"}, {1: "d"}])
+        )
+
+        self.assertEqual(
+            [int, bool, float, int], [type(list(value)[0]) for value in data]
+        )
+
+        data = JsonSnapshotCodec.decode(JsonSnapshotCodec.encode(float("nan")))
+        self.assertTrue(math.isnan(data))
+
+        data = OrderedDict((("b", 1), ("a", OrderedDict((("d", 2), ("c", 3))))))
+        decoded_data = JsonSnapshotCodec.decode(
+            JsonSnapshotCodec.encode(data), OrderedDict
+        )
+
+        self.assertIsInstance(decoded_data["a"], OrderedDict)
+        self.assertEqual(list(data.items()), list(decoded_data.items()))
+
+    def test_strings(self):
+        """
+        Tests writing equal strings and object shapes once and sharing strings
+        after decoding.
+        """
+
+        value = "value {0:d}".format(1)
+        data = [{"key": value}, {"key": "value 1"}]
+
+        payload = JsonSnapshotCodec.encode(data)
+        self.assertEqual(1, payload.count(b"key"))
+        self.assertEqual(1, payload.count(b"value 1"))
+
+        data = JsonSnapshotCodec.decode(payload)
+        self.assertIs(data[0]["key"], data[1]["key"])
+        self.assertIs(list(data[0])[0], list(data[1])[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
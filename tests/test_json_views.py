@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+Personal Python Toolkit
+Modularized all-in-one toolkit for Python
+----------------------------------------------------------------------------
+(C) Tobias "NotTheEvilOne" Wolf - All rights reserved
+https://github.com/NotTheEvilOne/ppt_json
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+import unittest
+
+from ppt_json import JsonMappingView, JsonResource, JsonSequenceView
+
+
+class TestJsonViews(unittest.TestCase):
+    """
+    Unittest for JsonMappingView and JsonSequenceView
+
+    :since: v1.1.0
+    """
+
+    def _get_json_test_data(self):
+        """
+        Test data with nested structs.
+
+        :return: (str) Test data
+        """
+
+        return '{"a": {"b": [1, {"c": "d"}, [2, 3]]}, "e": null}'
+
+    def test_views(self):
+        """
+        Tests reading the live tree through read-only views.
+        """
+
+        for lazy in (False, True):
+            json_resource = JsonResource()
+            json_resource.parse(self._get_json_test_data(), lazy)
+
+            data_view = json_resource.data_view
+
+            self.assertIsInstance(data_view, JsonMappingView)
+            self.assertIsInstance(data_view["a"]["b"], JsonSequenceView)
+            self.assertEqual({"c": "d"}, data_view["a"]["b"][1])
+            self.assertEqual([2, 3], data_view["a"]["b"][-1])
+            self.assertEqual((1, {"c": "d"}), data_view["a"]["b"][:2])
+            self.assertEqual(["a", "e"], list(data_view))
+            self.assertIsNone(data_view["e"])
+
+            with self.assertRaises(TypeError):
+                data_view["e"] = 1
+
+            with self.assertRaises(TypeError):
+                data_view["a"]["b"][0] = 1
+
+            for index in (-4, 3):
+                with self.assertRaises(IndexError):
+                    data_view["a"]["b"][index]
+
+            self.assertEqual(
+                {"a": {"b": [1, {"c": "d"}, [2, 3]]}, "e": None}, data_view
+            )
+
+    def test_live_tree(self):
+        """
+        Tests that views reflect changes of the live tree without copies.
+        """
+
+        json_resource = JsonResource()
+        json_resource.parse(self._get_json_test_data())
+
+        node_view = json_resource.get_node_view("a b#1")
+
+        self.assertIsInstance(node_view, JsonMappingView)
+        self.assertIs(json_resource.get_node_view("a b#1")._struct, node_view._struct)
+
+        json_resource.change_node("a b#1 c", "x")
+
+        self.assertEqual("x", node_view["c"])
+        self.assertEqual(1, json_resource.get_node_view("a b#0"))
+        self.assertIsNone(json_resource.get_node_view("x"))
+
+
+if __name__ == "__main__":
+    unittest.main()